@@ -63,6 +63,43 @@ def _fallback_svg_surface(path: str) -> pygame.Surface:
     return surface
 
 
+def svg_rects_with_fill(path: str, fill: str) -> list:
+    """Return ``(x, y, w, h)`` of the SVG rects painted ``fill``.
+
+    Values are fractions of the drawing's view box, so they can be scaled to
+    whatever size the image is drawn at. Unreadable files give no rects.
+    """
+
+    import xml.etree.ElementTree as ET
+
+    try:
+        root = ET.parse(path).getroot()
+    except (ET.ParseError, OSError):
+        return []
+    view_box = root.get("viewBox")
+    if view_box:
+        parts = view_box.replace(",", " ").split()
+        width, height = float(parts[2]), float(parts[3])
+    else:
+        width = float(root.get("width", "0").rstrip("px") or 0)
+        height = float(root.get("height", "0").rstrip("px") or 0)
+    if not width or not height:
+        return []
+    rects = []
+    for elem in root.iter():
+        if not elem.tag.endswith("rect") or elem.get("fill", "").lower() != fill:
+            continue
+        rects.append(
+            (
+                float(elem.get("x", 0)) / width,
+                float(elem.get("y", 0)) / height,
+                float(elem.get("width", 0)) / width,
+                float(elem.get("height", 0)) / height,
+            )
+        )
+    return rects
+
+
 def load_image(path: str) -> pygame.Surface:
     """Load an image file, supporting SVG conversion to a pygame Surface."""
 
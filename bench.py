@@ -0,0 +1,273 @@
+"""Headless rendering benchmark, run with ``python -m game --bench``.
+
+Boots :class:`game.Game` on SDL's dummy video driver with a fixture player
+instead of the start menus, then drives :class:`states.PlayState` for a fixed
+number of frames while the player walks a scripted route across the city.
+Each scenario sets a weather and time of day and reports frame time
+percentiles and per-frame allocations. The adaptive quality governor is
+switched off so every frame renders at one tier: ``--quality`` if given,
+else the baseline's tier, else ``settings.QUALITY_TIER``.
+
+Results are written as JSON and compared against a stored baseline so
+rendering regressions fail CI. Frame times depend on the machine, so each
+run also times a fixed calibration workload and the baseline's frame times
+are scaled by how much faster or slower this machine ran it. The scaling is
+rough. For tight limits keep a baseline per CI host, made on that host with
+``python -m game --bench --update-baseline --baseline <file>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from quality import QUALITY
+
+BENCH_PLAYER_FILE = os.path.join("data", "bench_player.json")
+BENCH_BASELINE_FILE = os.path.join("data", "bench_baseline.json")
+BENCH_OUTPUT_FILE = "bench_results.json"
+BENCH_FRAMES = 300
+# Frames per scenario traced with tracemalloc; tracing is too slow to time
+BENCH_ALLOC_FRAMES = 30
+# (name, weather, in-game minutes)
+BENCH_SCENARIOS = (
+    ("noon_clear", "Clear", 12 * 60),
+    ("dusk_rain", "Rain", 19 * 60),
+    ("night_snow", "Snow", 23 * 60),
+    ("dawn_clear", "Clear", 6 * 60),
+)
+# Allowed p95 slowdown against the baseline, as a fraction and in ms
+BENCH_TOLERANCE = 0.25
+BENCH_MIN_SLACK_MS = 0.5
+# Corners of the scripted walk, in world pixels
+BENCH_ROUTE = ((40, 600), (3120, 600), (3120, 280), (40, 280))
+PERCENTILES = (50, 95, 99)
+# Runs of the calibration workload; the fastest is kept as the least noisy
+CALIBRATION_RUNS = 60
+
+
+def boot(player_file: str = BENCH_PLAYER_FILE):
+    """Create a headless :class:`game.Game` with the fixture player."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from game import Game
+    from helpers import load_game
+
+    player = load_game(player_file)
+    if player is None:
+        raise FileNotFoundError(player_file)
+    return Game(player=player)
+
+
+def route_positions(frames: int, speed: int) -> List[Tuple[int, int]]:
+    """Player positions walking :data:`BENCH_ROUTE` at ``speed`` per frame."""
+    positions = []
+    x, y = BENCH_ROUTE[0]
+    leg = 1
+    while len(positions) < frames:
+        tx, ty = BENCH_ROUTE[leg % len(BENCH_ROUTE)]
+        x += max(-speed, min(speed, tx - x))
+        y += max(-speed, min(speed, ty - y))
+        if (x, y) == (tx, ty):
+            leg += 1
+        positions.append((x, y))
+    return positions
+
+
+def _percentile(sorted_values: Sequence[float], pct: float) -> float:
+    rank = max(0, -(-len(sorted_values) * pct // 100) - 1)
+    return sorted_values[int(rank)]
+
+
+def calibrate(runs: int = CALIBRATION_RUNS) -> float:
+    """Fastest milliseconds this machine takes for a fixed blit workload."""
+    import pygame
+
+    target = pygame.Surface((640, 360))
+    sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
+    sprite.fill((200, 120, 40, 160))
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter_ns()
+        target.fill((30, 30, 30))
+        for i in range(400):
+            target.blit(sprite, ((i * 37) % 576, (i * 53) % 296))
+        total = 0
+        for i in range(20000):
+            total += i % 7
+        times.append((time.perf_counter_ns() - start) / 1e6)
+    return min(times)
+
+
+def _frame(game) -> None:
+    manager = game.state_manager
+    manager.handle_events([])
+    manager.update()
+    manager.render(game.screen)
+
+
+def run_scenario(game, weather: str, minutes: int, frames: int) -> Dict[str, float]:
+    """Time ``frames`` frames of one weather and time-of-day setting."""
+    import settings
+
+    player = game.player
+    positions = route_positions(frames + BENCH_ALLOC_FRAMES, settings.PLAYER_SPEED)
+    random.seed(0)
+    player.weather = weather
+    player.time = minutes
+
+    times = []
+    blocks = []
+    for x, y in positions[:frames]:
+        player.rect.topleft = (x, y)
+        player.weather = weather
+        before = sys.getallocatedblocks()
+        start = time.perf_counter_ns()
+        _frame(game)
+        times.append((time.perf_counter_ns() - start) / 1e6)
+        blocks.append(sys.getallocatedblocks() - before)
+
+    peaks = []
+    tracemalloc.start()
+    for x, y in positions[frames:]:
+        player.rect.topleft = (x, y)
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        _frame(game)
+        peaks.append((tracemalloc.get_traced_memory()[1] - base) / 1024.0)
+    tracemalloc.stop()
+
+    ordered = sorted(times)
+    result = {f"p{p}_ms": _percentile(ordered, p) for p in PERCENTILES}
+    result["mean_ms"] = sum(times) / len(times)
+    result["max_ms"] = ordered[-1]
+    result["alloc_kib_per_frame"] = _percentile(sorted(peaks), 50) if peaks else 0.0
+    result["net_blocks_per_frame"] = sum(blocks) / len(blocks)
+    return result
+
+
+def run(
+    frames: int = BENCH_FRAMES,
+    player_file: str = BENCH_PLAYER_FILE,
+    quality: Optional[str] = None,
+) -> Dict:
+    """Run every scenario at tier ``quality`` and return JSON-ready results."""
+    import pygame
+    import settings
+
+    # timed before the game allocates anything, when it is least noisy
+    calibration = calibrate()
+    game = boot(player_file)
+    QUALITY.auto = False
+    if quality is None:
+        QUALITY.set_level(settings.QUALITY_TIER)
+    else:
+        QUALITY.set_level(QUALITY.level_of(quality))
+    scenarios = {}
+    for name, weather, minutes in BENCH_SCENARIOS:
+        result = run_scenario(game, weather, minutes, frames)
+        result.update(weather=weather, time=minutes)
+        scenarios[name] = result
+    game.path_planner.close()
+    return {
+        "frames": frames,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "quality": QUALITY.tier.name,
+        "calibration_ms": calibration,
+        "scenarios": scenarios,
+    }
+
+
+def compare(
+    results: Dict,
+    baseline: Dict,
+    tolerance: float = BENCH_TOLERANCE,
+    slack_ms: float = BENCH_MIN_SLACK_MS,
+) -> List[str]:
+    """Describe every scenario whose p95 regressed past the baseline.
+
+    When both sides carry a calibration time, baseline frame times are first
+    scaled by the ratio of the two, so the limit follows this machine's speed.
+    """
+    scale = 1.0
+    if results.get("calibration_ms") and baseline.get("calibration_ms"):
+        scale = results["calibration_ms"] / baseline["calibration_ms"]
+    regressions = []
+    for name, result in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        expected = base["p95_ms"] * scale
+        limit = max(expected * (1 + tolerance), expected + slack_ms)
+        if result["p95_ms"] > limit:
+            regressions.append(
+                f"{name}: p95 {result['p95_ms']:.2f} ms > {limit:.2f} ms "
+                f"(baseline {expected:.2f} ms)"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m game --bench")
+    parser.add_argument("--frames", type=int, default=BENCH_FRAMES)
+    parser.add_argument("--player", default=BENCH_PLAYER_FILE)
+    parser.add_argument("--out", default=BENCH_OUTPUT_FILE)
+    parser.add_argument("--baseline", default=BENCH_BASELINE_FILE)
+    parser.add_argument("--tolerance", type=float, default=BENCH_TOLERANCE)
+    parser.add_argument("--quality", help="render at this quality tier")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store these results as the new baseline",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    quality = args.quality
+    if quality is None and baseline is not None and not args.update_baseline:
+        quality = baseline.get("quality")
+    results = run(args.frames, args.player, quality)
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"{'scenario':<12} {'p50':>7} {'p95':>7} {'p99':>7} {'KiB/frame':>10}")
+    for name, row in results["scenarios"].items():
+        print(
+            f"{name:<12} {row['p50_ms']:>7.2f} {row['p95_ms']:>7.2f} "
+            f"{row['p99_ms']:>7.2f} {row['alloc_kib_per_frame']:>10.1f}"
+        )
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"no baseline at {args.baseline}; run with --update-baseline")
+        return 0
+    if baseline.get("quality") != results["quality"]:
+        print(
+            f"baseline was recorded at quality {baseline.get('quality')!r}, "
+            f"this run used {results['quality']!r}; not comparing"
+        )
+        return 2
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print("REGRESSION", line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
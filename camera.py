@@ -0,0 +1,58 @@
+"""Camera viewport with the world-to-screen offset and visibility culling."""
+
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+import pygame
+
+from settings import MAP_WIDTH, MAP_HEIGHT
+from spatial import SpatialHash
+
+# Extra world pixels queried around the view so labels, roofs and speech
+# bubbles drawn outside an entity's rect are not culled too early
+VIEW_MARGIN = 64
+
+
+class Camera:
+    """Track the visible part of the world.
+
+    Draw functions take the camera offset and subtract it from world
+    positions themselves, and :meth:`visible` asks a :class:`SpatialHash` for
+    the entities overlapping the view instead of scanning every entity.
+    """
+
+    def __init__(
+        self, world_w: int = MAP_WIDTH, world_h: int = MAP_HEIGHT
+    ) -> None:
+        self.world_w = world_w
+        self.world_h = world_h
+        self.x = 0
+        self.y = 0
+        self.width = 0
+        self.height = 0
+
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Translation from world to screen coordinates."""
+        return -self.x, -self.y
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """The visible area in world coordinates."""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def move_to(self, x: int, y: int, view_size: Tuple[int, int]) -> None:
+        """Place the view's top-left corner, clamped to the world bounds."""
+        width, height = view_size
+        x = max(0, min(self.world_w - width, int(x)))
+        y = max(0, min(self.world_h - height, int(y)))
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+    def follow(self, target: pygame.Rect, view_size: Tuple[int, int]) -> None:
+        """Center the view horizontally on ``target``."""
+        self.move_to(target.centerx - view_size[0] // 2, 0, view_size)
+
+    def visible(self, index: SpatialHash, margin: int = VIEW_MARGIN) -> List[Any]:
+        """Return the indexed entities overlapping the view."""
+        return index.query_rect(self.rect.inflate(margin * 2, margin * 2))
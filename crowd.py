@@ -0,0 +1,410 @@
+"""Struct-of-arrays NPC crowd with vectorized movement.
+
+:class:`Crowd` keeps every attached NPC's position, size, speed and path in
+NumPy arrays. Paths share one waypoint buffer; each NPC stores where its path
+starts, how long it is and which waypoint it is heading for, so reaching a
+waypoint is an index bump instead of ``list.pop(0)``. :meth:`Crowd.step`
+moves every NPC one frame in a handful of array operations, matching
+:meth:`entities.NPC.move` step for step.
+
+Run ``python crowd.py`` for the per-frame cost at 10, 1,000 and 10,000 NPCs.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import pygame
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+from entities import NPC
+
+# Starting number of NPC slots and path buffer waypoints
+INITIAL_CAPACITY = 64
+INITIAL_PATH_CAPACITY = 1024
+
+
+def _writes_back(method):
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._store()
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class RectView(pygame.Rect):
+    """Copy of an attached NPC's rect that writes changes back to its crowd.
+
+    Like any copy it goes stale once the crowd moves the NPC, so read
+    ``npc.rect`` again rather than keeping the view across frames.
+    """
+
+    def __setattr__(self, name, value) -> None:
+        super().__setattr__(name, value)
+        self._store()
+
+    def _store(self) -> None:
+        npc = self.__dict__.get("npc")
+        if npc is not None:
+            npc.rect = self
+
+
+class PathView(list):
+    """Copy of an attached NPC's path that writes changes back to its crowd."""
+
+    def _store(self) -> None:
+        npc = self.__dict__.get("npc")
+        if npc is not None:
+            npc.path = self
+
+
+# In-place operations that must reach the crowd's arrays
+RECT_MUTATORS = (
+    "move_ip",
+    "inflate_ip",
+    "clamp_ip",
+    "union_ip",
+    "unionall_ip",
+    "scale_by_ip",
+    "update",
+    "normalize",
+    "__setitem__",
+)
+PATH_MUTATORS = (
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+)
+for _name in RECT_MUTATORS:
+    if hasattr(pygame.Rect, _name):
+        setattr(RectView, _name, _writes_back(getattr(pygame.Rect, _name)))
+for _name in PATH_MUTATORS:
+    setattr(PathView, _name, _writes_back(getattr(list, _name)))
+del _name
+
+
+class Crowd:
+    """NPC state stored as parallel arrays indexed by slot."""
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        if np is None:  # pragma: no cover - guarded by available()
+            raise RuntimeError("NumPy is required for Crowd")
+        self.count = 0
+        self.npcs: List[NPC] = []
+        self.pos = np.zeros((capacity, 2), dtype=np.int32)
+        self.size = np.zeros((capacity, 2), dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        # path of slot i is path_buf[path_start[i] : path_start[i] + path_len[i]]
+        self.path_start = np.zeros(capacity, dtype=np.int32)
+        self.path_len = np.zeros(capacity, dtype=np.int32)
+        self.waypoint = np.zeros(capacity, dtype=np.int32)
+        self.path_buf = np.zeros((INITIAL_PATH_CAPACITY, 2), dtype=np.int32)
+        self.path_end = 0
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+    def _grow(self) -> None:
+        capacity = len(self.speed) * 2
+        for name in ("pos", "size", "speed", "path_start", "path_len", "waypoint"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, npc: NPC) -> int:
+        """Move ``npc``'s state into the arrays and turn it into a view."""
+        if npc.crowd is self:
+            return npc.slot
+        if npc.crowd is not None:
+            npc.crowd.remove(npc)
+        rect, path, speed = npc.rect, npc.path, npc.speed
+        if self.count == len(self.speed):
+            self._grow()
+        slot = self.count
+        self.count += 1
+        self.npcs.append(npc)
+        self.pos[slot] = rect.topleft
+        self.size[slot] = rect.size
+        self.speed[slot] = speed
+        self.path_len[slot] = 0
+        self.waypoint[slot] = 0
+        npc.crowd = self
+        npc.slot = slot
+        for name in ("_rect", "_path", "_speed"):
+            npc.__dict__.pop(name, None)
+        self.set_path(slot, path)
+        return slot
+
+    def remove(self, npc: NPC) -> None:
+        """Detach ``npc``, copying its state back onto the object."""
+        if npc.crowd is not self:
+            return
+        slot = npc.slot
+        rect = pygame.Rect(self.rect_of(slot))
+        path, speed = list(self.path_of(slot)), self.speed_of(slot)
+        last = self.count - 1
+        if slot != last:
+            for name in ("pos", "size", "speed", "path_start", "path_len", "waypoint"):
+                arr = getattr(self, name)
+                arr[slot] = arr[last]
+            moved = self.npcs[last]
+            self.npcs[slot] = moved
+            moved.slot = slot
+        self.npcs.pop()
+        self.count = last
+        npc.crowd = None
+        npc.slot = -1
+        npc.rect, npc.path, npc.speed = rect, path, speed
+
+    # ------------------------------------------------------------------
+    # Views used by NPC properties
+    # ------------------------------------------------------------------
+    def rect_of(self, slot: int) -> RectView:
+        """Rect of ``slot``; changing it in place updates the arrays."""
+        x, y = self.pos[slot].tolist()
+        w, h = self.size[slot].tolist()
+        rect = RectView(x, y, w, h)
+        rect.__dict__["npc"] = self.npcs[slot]
+        return rect
+
+    def bounds_of(self, slot: int) -> Tuple[int, int, int, int]:
+        """``(x, y, width, height)`` of ``slot`` without building a Rect."""
+        x, y = self.pos[slot].tolist()
+        w, h = self.size[slot].tolist()
+        return x, y, w, h
+
+    def bounds_many(self, slots) -> List[List[int]]:
+        """``[x, y, width, height]`` of every slot in ``slots`` at once."""
+        slots = np.asarray(slots, dtype=np.int64)
+        return np.hstack((self.pos[slots], self.size[slots])).tolist()
+
+    def set_rect(self, slot: int, rect: pygame.Rect) -> None:
+        self.pos[slot] = rect.topleft
+        self.size[slot] = rect.size
+
+    def speed_of(self, slot: int) -> int:
+        return int(self.speed[slot])
+
+    def set_speed(self, slot: int, speed: int) -> None:
+        self.speed[slot] = speed
+
+    def path_of(self, slot: int) -> PathView:
+        """Remaining waypoints of ``slot``; changing them updates the arrays."""
+        start = int(self.path_start[slot] + self.waypoint[slot])
+        end = int(self.path_start[slot] + self.path_len[slot])
+        path = PathView(tuple(p) for p in self.path_buf[start:end].tolist())
+        path.npc = self.npcs[slot]
+        return path
+
+    def set_path(self, slot: int, path: Sequence[Tuple[int, int]]) -> None:
+        """Store ``path`` for ``slot`` at the end of the shared buffer."""
+        n = len(path)
+        if self.path_end + n > len(self.path_buf):
+            self._compact(n)
+        start = self.path_end
+        if n:
+            self.path_buf[start : start + n] = path
+        self.path_start[slot] = start
+        self.path_len[slot] = n
+        self.waypoint[slot] = 0
+        self.path_end = start + n
+
+    def _compact(self, extra: int) -> None:
+        """Pack the unvisited waypoints together, growing the buffer if needed."""
+        count = self.count
+        remaining = self.path_len[:count] - self.waypoint[:count]
+        needed = int(remaining.sum()) + extra
+        capacity = len(self.path_buf)
+        while capacity < needed * 2:
+            capacity *= 2
+        buf = np.zeros((capacity, 2), dtype=np.int32)
+        end = 0
+        for slot in range(count):
+            n = int(remaining[slot])
+            if n:
+                start = int(self.path_start[slot] + self.waypoint[slot])
+                buf[end : end + n] = self.path_buf[start : start + n]
+            self.path_start[slot] = end
+            self.path_len[slot] = n
+            self.waypoint[slot] = 0
+            end += n
+        self.path_buf = buf
+        self.path_end = end
+
+    # ------------------------------------------------------------------
+    # Movement
+    # ------------------------------------------------------------------
+    def step(self, slots=None) -> None:
+        """Advance NPCs one step toward their current waypoint.
+
+        Every NPC moves unless ``slots`` limits the step to those slots.
+        """
+        count = self.count
+        if slots is None:
+            moving = np.flatnonzero(self.waypoint[:count] < self.path_len[:count])
+        else:
+            slots = np.asarray(slots, dtype=np.int64)
+            moving = slots[self.waypoint[slots] < self.path_len[slots]]
+        if not len(moving):
+            return
+        target = self.path_buf[self.path_start[moving] + self.waypoint[moving]]
+        pos = self.pos[moving]
+        limit = self.speed[moving][:, None]
+        pos += np.clip(target - pos, -limit, limit)
+        self.pos[moving] = pos
+        arrived = (pos == target).all(axis=1)
+        self.waypoint[moving[arrived]] += 1
+
+    def advance(self, slot: int, ticks: int) -> None:
+        """Move ``slot`` to where ``ticks`` calls to :meth:`step` would put it.
+
+        Whole path segments are skipped by their travel time, so the cost
+        depends on the waypoints passed rather than on ``ticks``.
+        """
+        speed = int(self.speed[slot])
+        if speed <= 0:
+            return
+        x, y = self.pos[slot].tolist()
+        waypoint = int(self.waypoint[slot])
+        end = int(self.path_len[slot])
+        start = int(self.path_start[slot])
+        while ticks > 0 and waypoint < end:
+            tx, ty = self.path_buf[start + waypoint].tolist()
+            x, y, ticks, arrived = travel(x, y, tx, ty, speed, ticks)
+            if arrived:
+                waypoint += 1
+        self.pos[slot] = (x, y)
+        self.waypoint[slot] = waypoint
+
+    def advance_many(self, slots, ticks) -> None:
+        """Vectorized :meth:`advance` of ``slots`` by per-slot ``ticks``."""
+        slots = np.asarray(slots, dtype=np.int64)
+        ticks = np.asarray(ticks, dtype=np.int64).copy()
+        speed = self.speed[slots].astype(np.int64)
+        active = (ticks > 0) & (speed > 0)
+        # each pass finishes or cuts short one path segment per slot
+        while True:
+            active &= self.waypoint[slots] < self.path_len[slots]
+            if not active.any():
+                return
+            idx = slots[active]
+            left = ticks[active]
+            step = speed[active][:, None]
+            target = self.path_buf[self.path_start[idx] + self.waypoint[idx]]
+            delta = (target - self.pos[idx]).astype(np.int64)
+            needed = np.maximum(1, (-(-np.abs(delta) // step)).max(axis=1))
+            arrived = needed <= left
+            reach = step * left[:, None]
+            self.pos[idx] += np.clip(delta, -reach, reach).astype(np.int32)
+            self.waypoint[idx[arrived]] += 1
+            ticks[active] = np.where(arrived, left - needed, 0)
+            active[active] = arrived
+
+    def step_one(self, slot: int) -> None:
+        """Advance a single NPC, as :meth:`NPC.move` does."""
+        if self.waypoint[slot] >= self.path_len[slot]:
+            return
+        target = self.path_buf[self.path_start[slot] + self.waypoint[slot]]
+        limit = self.speed[slot]
+        self.pos[slot] += np.clip(target - self.pos[slot], -limit, limit)
+        if (self.pos[slot] == target).all():
+            self.waypoint[slot] += 1
+
+
+def travel(x: int, y: int, tx: int, ty: int, speed: int, ticks: int):
+    """Move from ``(x, y)`` toward ``(tx, ty)`` for up to ``ticks`` steps.
+
+    Returns ``(x, y, ticks_left, arrived)``. Reaching the waypoint takes one
+    step per ``speed`` pixels along the longer axis, and at least one step,
+    exactly as :meth:`entities.NPC.move` does.
+    """
+    dx = tx - x
+    dy = ty - y
+    needed = max(1, -(-abs(dx) // speed), -(-abs(dy) // speed))
+    if needed <= ticks:
+        return tx, ty, ticks - needed, True
+    reach = speed * ticks
+    x += max(-reach, min(reach, dx))
+    y += max(-reach, min(reach, dy))
+    return x, y, 0, False
+
+
+# ----------------------------------------------------------------------
+# Benchmark
+# ----------------------------------------------------------------------
+BENCH_COUNTS = (10, 1000, 10000)
+
+
+def _bench_npcs(count: int, seed: int = 0) -> List[NPC]:
+    rng = random.Random(seed)
+    npcs = []
+    for i in range(count):
+        x, y = rng.randrange(0, 3200, 40), rng.randrange(0, 1200, 40)
+        path = []
+        for _ in range(60):
+            x = min(3160, max(0, x + rng.choice((-40, 40))))
+            y = min(1160, max(0, y + rng.choice((-40, 40))))
+            path.append((x, y))
+        npcs.append(NPC(pygame.Rect(x, y, 40, 40), f"NPC {i}", path=path))
+    return npcs
+
+
+def benchmark(counts: Sequence[int] = BENCH_COUNTS, frames: int = 100) -> List[Dict]:
+    """Time per-object ``NPC.move`` against :meth:`Crowd.step`."""
+    results = []
+    for count in counts:
+        npcs = _bench_npcs(count)
+        start = time.perf_counter()
+        for _ in range(frames):
+            for npc in npcs:
+                npc.move()
+        objects = (time.perf_counter() - start) / frames
+
+        crowd = Crowd()
+        for npc in _bench_npcs(count):
+            crowd.add(npc)
+        start = time.perf_counter()
+        for _ in range(frames):
+            crowd.step()
+        arrays = (time.perf_counter() - start) / frames
+        results.append(
+            {"npcs": count, "objects_ms": objects * 1000.0, "crowd_ms": arrays * 1000.0}
+        )
+    return results
+
+
+def main(argv: Sequence[str] = ()) -> None:
+    counts = [int(arg) for arg in argv] or BENCH_COUNTS
+    print(f"{'NPCs':>7} {'NPC.move ms':>12} {'Crowd.step ms':>14}")
+    for row in benchmark(counts):
+        print(f"{row['npcs']:>7} {row['objects_ms']:>12.3f} {row['crowd_ms']:>14.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
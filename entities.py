@@ -12,6 +12,8 @@ class Building:
     btype: str
     image: Optional[pygame.Surface] = None
     window_layers: List[pygame.Surface] = field(default_factory=list)
+    # window panes of ``image`` as fractions of its size, lit up at night
+    windows: List[Tuple[float, float, float, float]] = field(default_factory=list)
 
 
 @dataclass
@@ -246,8 +248,8 @@ class SideQuest:
 
 
 @dataclass
-class NPC:
-    """Simple moving NPC that can give side quests."""
+class NPCRecord:
+    """Fields of an :class:`NPC`."""
 
     rect: pygame.Rect
     name: str
@@ -266,8 +268,72 @@ class NPC:
     path: List[Tuple[int, int]] = field(default_factory=list)
     speed: int = 4
 
+
+class NPC(NPCRecord):
+    """Simple moving NPC that can give side quests.
+
+    :meth:`crowd.Crowd.add` moves ``rect``, ``path`` and ``speed`` into the
+    crowd's arrays and sets ``crowd`` and ``slot``. The properties below then
+    go to those arrays. ``rect`` and ``path`` return fresh copies whose
+    in-place changes are written back, so do not keep them across frames.
+    Per-frame code should read :attr:`bounds`, which builds no Rect.
+    """
+
+    crowd = None
+    slot = -1
+
+    @property
+    def rect(self) -> pygame.Rect:
+        if self.crowd is not None:
+            return self.crowd.rect_of(self.slot)
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: pygame.Rect) -> None:
+        if self.crowd is not None:
+            self.crowd.set_rect(self.slot, value)
+        else:
+            self._rect = value
+
+    @property
+    def path(self) -> List[Tuple[int, int]]:
+        if self.crowd is not None:
+            return self.crowd.path_of(self.slot)
+        return self._path
+
+    @path.setter
+    def path(self, value: List[Tuple[int, int]]) -> None:
+        if self.crowd is not None:
+            self.crowd.set_path(self.slot, value)
+        else:
+            self._path = value
+
+    @property
+    def speed(self) -> int:
+        if self.crowd is not None:
+            return self.crowd.speed_of(self.slot)
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: int) -> None:
+        if self.crowd is not None:
+            self.crowd.set_speed(self.slot, value)
+        else:
+            self._speed = value
+
+    @property
+    def bounds(self) -> Tuple[int, int, int, int]:
+        """``(x, y, width, height)`` of the NPC, read without a Rect."""
+        if self.crowd is not None:
+            return self.crowd.bounds_of(self.slot)
+        rect = self._rect
+        return rect.x, rect.y, rect.width, rect.height
+
     def move(self) -> None:
         """Advance the NPC along its path one step."""
+        if self.crowd is not None:
+            self.crowd.step_one(self.slot)
+            return
         if not self.path:
             return
         target_x, target_y = self.path[0]
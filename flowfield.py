@@ -0,0 +1,177 @@
+"""Shared flow fields that route any number of NPCs to one building.
+
+A :class:`FlowField` holds the breadth-first distance from every tile of a
+:class:`~pathfinding.NavGrid` to one destination, computed with NumPy array
+shifts, plus the neighbor each tile should step to next. Following the next
+steps from any tile walks a shortest path, so every NPC heading for the same
+building shares one field instead of running its own search.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+from pathfinding import Coord, NavGrid
+
+# Number of destination fields kept before the least recently used is dropped
+FLOW_FIELD_CACHE_SIZE = 32
+
+# Distance used for blocked and unreached tiles
+UNREACHED = np.iinfo(np.int32).max if np is not None else 2**31 - 1
+
+
+class FlowField:
+    """Distance and next-step arrays toward a single goal node.
+
+    Arrays are laid out like :attr:`NavGrid.walkable`, so a node id indexes
+    them directly.
+    """
+
+    def __init__(self, grid: NavGrid, goal: int) -> None:
+        if np is None:  # pragma: no cover - guarded by available()
+            raise RuntimeError("NumPy is required for FlowField")
+        self.grid = grid
+        self.goal = goal
+        self.version = grid.version
+        shape = (grid.height + 2, grid.stride)
+        walkable = np.frombuffer(bytes(grid.walkable), dtype=np.uint8)
+        walkable = walkable.reshape(shape).astype(bool)
+        self.dist = self._distances(walkable, goal)
+        self.next = self._next_steps(self.dist, grid.stride)
+        # plain list copy for fast per-step lookups while following the field
+        self._next_list = self.next.tolist()
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    @staticmethod
+    def _distances(walkable, goal: int):
+        """Expand a BFS wavefront one ring per iteration with array shifts."""
+        dist = np.full(walkable.shape, UNREACHED, dtype=np.int32)
+        frontier = np.zeros(walkable.shape, dtype=bool)
+        frontier.flat[goal] = True
+        dist.flat[goal] = 0
+        unvisited = walkable.copy()
+        unvisited.flat[goal] = False
+        step = 0
+        while frontier.any():
+            step += 1
+            ring = np.zeros_like(frontier)
+            ring[1:, :] |= frontier[:-1, :]
+            ring[:-1, :] |= frontier[1:, :]
+            ring[:, 1:] |= frontier[:, :-1]
+            ring[:, :-1] |= frontier[:, 1:]
+            ring &= unvisited
+            dist[ring] = step
+            unvisited &= ~ring
+            frontier = ring
+        return dist.ravel()
+
+    @staticmethod
+    def _next_steps(dist, stride: int):
+        """Pick the closest neighbor of every tile, ``-1`` where none is."""
+        size = dist.size
+        # pad by a row either side so every neighbor index stays in range
+        padded = np.full(size + 2 * stride, UNREACHED, dtype=np.int32)
+        padded[stride : stride + size] = dist
+        offsets = np.array([-1, 1, -stride, stride], dtype=np.int64)
+        candidates = np.stack(
+            [padded[stride + o : stride + o + size] for o in offsets.tolist()]
+        )
+        best = candidates.argmin(axis=0)
+        best_dist = candidates[best, np.arange(size)]
+        nodes = np.arange(size, dtype=np.int64)
+        next_step = nodes + offsets[best]
+        # a tile only steps downhill; blocked tiles may step onto any reached one
+        stuck = (best_dist == UNREACHED) | (
+            (dist != UNREACHED) & (best_dist >= dist)
+        )
+        next_step[stuck] = -1
+        return next_step
+
+    @property
+    def stale(self) -> bool:
+        return self.version != self.grid.version
+
+    def distance(self, pos: Coord) -> Optional[int]:
+        """Steps from pixel ``pos`` to the goal, ``None`` if unreachable."""
+        d = int(self.dist[self.grid.node_at(pos)])
+        return None if d == UNREACHED else d
+
+    def next_step(self, node: int) -> int:
+        """Node to move to from ``node``, ``-1`` at the goal or if stuck."""
+        return int(self.next[node])
+
+    def path(self, start: Coord) -> List[Coord]:
+        """Pixel steps from ``start`` to the goal following the field."""
+        node = self.grid.node_at(start)
+        nodes = []
+        next_step = self._next_list
+        # every step strictly lowers the distance, so this terminates
+        while node != self.goal:
+            node = next_step[node]
+            if node < 0:
+                return []
+            nodes.append(node)
+        return self.grid.to_pixels(nodes)
+
+
+class FlowFieldCache:
+    """LRU cache of flow fields keyed by destination building."""
+
+    def __init__(self, grid: NavGrid, max_fields: int = FLOW_FIELD_CACHE_SIZE):
+        self.grid = grid
+        self.max_fields = max_fields
+        self.fields: "OrderedDict[int, FlowField]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def available() -> bool:
+        return FlowField.available()
+
+    def _goal(self, building) -> int:
+        goal = self.grid.entrances.get(id(building))
+        if goal is None:
+            goal = self.grid.node(*self.grid.entrance_tile(building.rect))
+        return goal
+
+    def field(self, building) -> FlowField:
+        """Return the field toward ``building``, building it on a miss."""
+        goal = self._goal(building)
+        field = self.fields.get(goal)
+        if field is not None and not field.stale:
+            self.fields.move_to_end(goal)
+            self.hits += 1
+            return field
+        self.misses += 1
+        field = FlowField(self.grid, goal)
+        self.fields[goal] = field
+        self.fields.move_to_end(goal)
+        while len(self.fields) > self.max_fields:
+            self.fields.popitem(last=False)
+            self.evictions += 1
+        return field
+
+    def path(self, start: Coord, building) -> List[Coord]:
+        """Pixel steps from ``start`` to the entrance of ``building``."""
+        return self.field(building).path(start)
+
+    def clear(self) -> None:
+        self.fields.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "fields": len(self.fields),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
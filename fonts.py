@@ -0,0 +1,112 @@
+"""Shared font and rendered-text cache used by all drawing code."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+import pygame
+
+# Rendered text surfaces kept before the least recently used are evicted
+TEXT_CACHE_SIZE = 512
+
+
+class TextCache:
+    """Memoize fonts by pixel size and rendered text surfaces with LRU eviction.
+
+    Surfaces returned by :meth:`render` are shared between callers and must
+    be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.fonts: Dict[int, pygame.font.Font] = {}
+        # Maps memoized fonts back to their size so keys survive re-creation
+        self._font_sizes: Dict[pygame.font.Font, int] = {}
+        self.surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, size: int) -> pygame.font.Font:
+        """Return the default system font at ``size`` pixels, created once."""
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont(None, size)
+            self.fonts[size] = font
+            self._font_sizes[font] = size
+        return font
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        antialias: bool,
+        color,
+        background=None,
+    ) -> pygame.Surface:
+        """Return ``font.render(text, antialias, color)`` from the cache."""
+        font_key: Hashable = self._font_sizes.get(font, font)
+        key = (
+            str(text),
+            font_key,
+            tuple(color),
+            bool(antialias),
+            tuple(background) if background is not None else None,
+        )
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+        self.misses += 1
+        if background is None:
+            surf = font.render(str(text), antialias, color)
+        else:
+            surf = font.render(str(text), antialias, color, background)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and the current cache occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "surfaces": len(self.surfaces),
+            "fonts": len(self.fonts),
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    def clear(self) -> None:
+        """Drop every cached font and surface."""
+        self.fonts.clear()
+        self._font_sizes.clear()
+        self.surfaces.clear()
+
+
+TEXT_CACHE = TextCache()
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """Return the shared font for a pixel ``size``."""
+    return TEXT_CACHE.font(size)
+
+
+def render_text(
+    font: pygame.font.Font, text: str, antialias: bool, color, background=None
+) -> pygame.Surface:
+    """Render ``text`` with ``font`` through the shared cache."""
+    return TEXT_CACHE.render(font, text, antialias, color, background)
+
+
+def text_cache_stats() -> Dict[str, float]:
+    """Return statistics for the shared text cache."""
+    return TEXT_CACHE.stats()
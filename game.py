@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
+import sys
+import time
+from functools import partial
+from typing import Optional, Sequence
+
 import pygame
 
 import settings
+from camera import Camera
+from crowd import Crowd
 from entities import Player
+from flowfield import FlowFieldCache
 from helpers import recalc_layouts, scaled_font, load_game
 from loaders import load_buildings
 from menus import start_menu, character_creation
+from npc_lod import NPCLevelOfDetail
+from npc_schedule import NPCScheduler
+from npc_sim import NPCSimulation
+from path_planner import PathPlanner, plan_path
+from pathfinding import NavGrid
+from quality import QUALITY
 from quests import NPCS
+from rendering import load_city_map
+from replay import PressedKeys, snapshot_keys
+from replay import main as replay_main
+from routes import RouteTable
+from timestep import FixedTimestep
 from types import SimpleNamespace
 from settings import (
     MAP_HEIGHT,
@@ -22,6 +41,7 @@ from settings import (
     MUSIC_VOLUME,
     SFX_VOLUME,
 )
+from spatial import SpatialHash
 from state_manager import StateManager
 from states import PlayState
 
@@ -29,7 +49,7 @@ from states import PlayState
 class Game:
     """Container for the running game state and main loop."""
 
-    def __init__(self) -> None:
+    def __init__(self, player: Optional[Player] = None) -> None:
         # --- Pygame setup -------------------------------------------------
         pygame.init()
         pygame.joystick.init()
@@ -61,6 +81,58 @@ class Game:
             tilewidth=40,
             tileheight=40,
         )
+        # Walkable tiles for NPC routing, blocked by water and buildings
+        self.navgrid = NavGrid.from_tilemap(load_city_map(), self.buildings)
+        # One shared distance field per destination; the precomputed routes
+        # between every pair of buildings are only a fallback for installs
+        # without NumPy
+        self.flow_fields = (
+            FlowFieldCache(self.navgrid) if FlowFieldCache.available() else None
+        )
+        self.routes = (
+            RouteTable(self.navgrid, self.buildings)
+            if self.flow_fields is None
+            else None
+        )
+        # Paths are planned within a per-frame budget instead of on demand
+        self.path_planner = PathPlanner(
+            partial(
+                plan_path,
+                tile_map=self.navgrid,
+                routes=self.routes,
+                flow_fields=self.flow_fields,
+            )
+        )
+        # NPC destinations only change when a shift boundary fires
+        self.npc_scheduler = NPCScheduler(self.buildings, self.npcs)
+        # NPC positions and paths live in shared arrays when NumPy is present
+        self.crowd = Crowd() if Crowd.available() else None
+        if self.crowd is not None:
+            for npc in self.npcs:
+                self.crowd.add(npc)
+        # Off-screen NPCs are only caught up now and then
+        self.npc_lod = NPCLevelOfDetail()
+
+        # Viewport and spatial indexes used to cull off-screen entities
+        self.camera = Camera()
+        self.building_index = SpatialHash()
+        for b in self.buildings:
+            self.building_index.insert(b, b.rect)
+        self.npc_index = SpatialHash()
+        for npc in self.npcs:
+            self.npc_index.insert(npc, npc.rect)
+        self.npc_sim = NPCSimulation(
+            self.buildings,
+            self.npcs,
+            self.navgrid,
+            self.routes,
+            self.flow_fields,
+            self.npc_scheduler,
+            self.crowd,
+            self.npc_lod,
+            self.npc_index,
+            self.path_planner,
+        )
 
         # Load audio assets if possible
         self.step_sound = self.enter_sound = self.quest_sound = None
@@ -79,51 +151,121 @@ class Game:
                 pass
 
         # --- Player setup ------------------------------------------------
-        load_existing = start_menu(self)
-        if load_existing:
-            loaded = load_game()
-        else:
-            loaded = None
-        if loaded:
-            self.player = loaded
+        if player is not None:
+            # supplied by headless runs such as the benchmark
+            self.player = player
         else:
-            name, color, head_color, pants_color, has_hat, hat_color = character_creation(
-                self
-            )
-            self.player = Player(
-                pygame.Rect(MAP_WIDTH // 2, MAP_HEIGHT // 2, PLAYER_SIZE, PLAYER_SIZE),
-                name=name,
-                color=color,
-                head_color=head_color,
-                pants_color=pants_color,
-                has_hat=has_hat,
-                hat_color=hat_color,
-            )
+            self.player = self._choose_player()
 
         self.player.game = self
 
         self.running = True
         self.frame = 0
+        # Updates run at a fixed rate; renders interpolate between them
+        self.timestep = FixedTimestep()
+        # Key state from a recording, used instead of the live keyboard
+        self.input_keys: Optional[PressedKeys] = None
+        # Set while run() records or replays, for the blocking menus
+        self.recorder = None
+        self.replay = None
 
         # Initialize state manager with the default gameplay state
         self.state_manager = StateManager()
         self.state_manager.change_state(PlayState(self))
 
+    def _choose_player(self) -> Player:
+        """Load a save or create a character through the start menus."""
+        load_existing = start_menu(self)
+        loaded = load_game() if load_existing else None
+        if loaded:
+            return loaded
+        name, color, head_color, pants_color, has_hat, hat_color = character_creation(
+            self
+        )
+        return Player(
+            pygame.Rect(MAP_WIDTH // 2, MAP_HEIGHT // 2, PLAYER_SIZE, PLAYER_SIZE),
+            name=name,
+            color=color,
+            head_color=head_color,
+            pants_color=pants_color,
+            has_hat=has_hat,
+            hat_color=hat_color,
+        )
+
     # ------------------------------------------------------------------
     # Main game loop
     # ------------------------------------------------------------------
-    def run(self) -> None:
-        """Run the main game loop."""
+    def pressed_keys(self):
+        """Held keys: the replayed or recorded snapshot, else the keyboard."""
+        if self.input_keys is not None:
+            return self.input_keys
+        return pygame.key.get_pressed()
+
+    def menu_events(self):
+        """Events for one pass of a blocking menu loop.
+
+        They come from the replay when one is running and are saved by the
+        recorder when one is attached, like the main loop's frames.
+        """
+        if self.replay is not None:
+            return self.replay.next_menu_events()
+        events = pygame.event.get()
+        if self.recorder is not None:
+            self.recorder.record_menu(events)
+        return events
+
+    def run(self, recorder=None, replay=None) -> None:
+        """Run the main game loop.
+
+        With a :class:`replay.InputRecorder` every frame's input is saved.
+        With a :class:`replay.InputReplay` input and update counts come from
+        the recording instead of the devices and the clock, and the loop
+        ends with it.
+        """
+        self.recorder = recorder
+        self.replay = replay
+        previous = time.perf_counter()
         while self.running:
-            events = pygame.event.get()
+            frame_start = time.perf_counter()
+            if replay is not None:
+                frame = replay.next_frame()
+                if frame is None:
+                    break
+                steps, events, keys = frame
+                self.input_keys = PressedKeys(keys)
+            else:
+                now = time.perf_counter()
+                steps = self.timestep.advance(now - previous)
+                previous = now
+                events = pygame.event.get()
+                if recorder is not None:
+                    keys = snapshot_keys()
+                    recorder.record(steps, events, keys)
+                    self.input_keys = PressedKeys(keys)
             self.state_manager.handle_events(events)
-            self.state_manager.update()
+            for _ in range(steps):
+                self.state_manager.update()
             self.state_manager.render(self.screen)
-            self.clock.tick(60)
+            # work time only; the frame cap's sleep is not counted
+            QUALITY.record((time.perf_counter() - frame_start) * 1000.0)
+            self.clock.tick(settings.RENDER_FPS)
+        self.recorder = self.replay = None
+        self.path_planner.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entry point used by tests or scripts.
 
+    ``--bench`` runs the headless rendering benchmark instead of the game,
+    ``--record``/``--replay`` capture or play back a seeded session.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "--bench":
+        from bench import main as bench_main
 
-def main() -> None:
-    """Entry point used by tests or scripts."""
+        raise SystemExit(bench_main(argv[1:]))
+    if any(arg in ("--record", "--replay") for arg in argv):
+        raise SystemExit(replay_main(argv))
     Game().run()
 
 
@@ -25,6 +25,7 @@ from quests import (
 from combat import energy_cost
 from businesses import collect_profits
 from inventory import resolve_companion_errands
+from fonts import get_font
 import settings
 
 
@@ -111,9 +112,12 @@ FOREST_DOOR_RECT = pygame.Rect(0, 0, 0, 0)
 
 
 def scaled_font(base_size: int) -> pygame.font.Font:
-    """Return a font scaled relative to the window height."""
+    """Return a font scaled relative to the window height.
+
+    Fonts are memoized by their scaled pixel size in :mod:`fonts`.
+    """
     scale = settings.SCREEN_HEIGHT / BASE_SCREEN_H
-    return pygame.font.SysFont(None, int(base_size * scale))
+    return get_font(int(base_size * scale))
 
 
 def recalc_layouts() -> None:
@@ -997,11 +1001,12 @@ def auto_save(player: Player, cooldown: float = 60.0) -> bool:
     return False
 
 
-def load_game() -> Optional[Player]:
-    """Load saved player state if a save file exists."""
-    if not os.path.exists(SAVE_FILE):
+def load_game(path: Optional[str] = None) -> Optional[Player]:
+    """Load saved player state from ``path`` (default the save file)."""
+    path = path or SAVE_FILE
+    if not os.path.exists(path):
         return None
-    with open(SAVE_FILE) as f:
+    with open(path) as f:
         data = json.load(f)
     player = Player(
         pygame.Rect(
@@ -0,0 +1,392 @@
+"""Hierarchical pathfinding (HPA*) over a :class:`~pathfinding.NavGrid`.
+
+The map is split into square clusters. Walkable gaps along every cluster
+border become pairs of abstract nodes joined by a single step, which gives an
+entrance graph that is built once up front. Costs between the entrances of
+one cluster are found by a breadth-first search confined to the cluster the
+first time a search reaches it, or for every cluster by :meth:`connect_all`.
+Abstract edges are only refined into tiles as the path is iterated.
+
+Run ``python hpa.py`` to compare against :func:`pathfinding.find_path` on
+generated maps from 80x30 up to 2000x2000 tiles.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pathfinding import Coord, NavGrid
+
+# Edge length of a cluster, in tiles
+CLUSTER_SIZE = 16
+# Border gaps at least this wide get an entrance at each end instead of one
+# in the middle
+WIDE_ENTRANCE = 6
+
+
+class HierarchicalPathfinder:
+    """Abstract entrance graph over a :class:`NavGrid` split into clusters."""
+
+    def __init__(self, grid: NavGrid, cluster_size: int = CLUSTER_SIZE) -> None:
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.cols = -(-grid.width // cluster_size)
+        self.rows = -(-grid.height // cluster_size)
+        self.version = -1
+        self.build_seconds = 0.0
+        self.connect_seconds = 0.0
+        self.build()
+
+    # ------------------------------------------------------------------
+    # Abstract graph
+    # ------------------------------------------------------------------
+    def build(self) -> None:
+        """Find the entrances between every pair of neighboring clusters."""
+        start_time = time.perf_counter()
+        count = self.cols * self.rows
+        self.cluster_nodes: List[List[int]] = [[] for _ in range(count)]
+        self.edges: Dict[int, Dict[int, int]] = {}
+        self._intra_ready = bytearray(count)
+        self._segments: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        self._local_grids: Dict[int, Tuple[bytearray, int, int, int]] = {}
+        grid = self.grid
+        size = self.cluster_size
+        for cy in range(self.rows):
+            y0 = cy * size
+            y1 = min(grid.height, y0 + size)
+            for cx in range(self.cols):
+                x0 = cx * size
+                x1 = min(grid.width, x0 + size)
+                if x1 < grid.width:
+                    # vertical border between this cluster and the one right
+                    self._link(
+                        [(x1 - 1, y) for y in range(y0, y1)],
+                        [(x1, y) for y in range(y0, y1)],
+                    )
+                if y1 < grid.height:
+                    self._link(
+                        [(x, y1 - 1) for x in range(x0, x1)],
+                        [(x, y1) for x in range(x0, x1)],
+                    )
+        self.version = grid.version
+        self.build_seconds = time.perf_counter() - start_time
+
+    def _link(self, side_a: Sequence[Coord], side_b: Sequence[Coord]) -> None:
+        """Add entrances for every walkable gap between two cluster borders."""
+        grid = self.grid
+        walkable = grid.walkable
+        run_start = None
+        for i, (a, b) in enumerate(zip(side_a, side_b)):
+            if walkable[grid.node(*a)] and walkable[grid.node(*b)]:
+                if run_start is None:
+                    run_start = i
+            elif run_start is not None:
+                self._add_entrances(side_a, side_b, run_start, i)
+                run_start = None
+        if run_start is not None:
+            self._add_entrances(side_a, side_b, run_start, len(side_a))
+
+    def _add_entrances(self, side_a, side_b, first: int, end: int) -> None:
+        length = end - first
+        picks = [first + length // 2]
+        if length >= WIDE_ENTRANCE:
+            picks = [first, end - 1]
+        for i in picks:
+            a = self.grid.node(*side_a[i])
+            b = self.grid.node(*side_b[i])
+            self._add_node(a)
+            self._add_node(b)
+            self.edges[a][b] = 1
+            self.edges[b][a] = 1
+
+    def _add_node(self, node: int) -> None:
+        if node not in self.edges:
+            self.edges[node] = {}
+            self.cluster_nodes[self.cluster_of(node)].append(node)
+
+    def cluster_of(self, node: int) -> int:
+        y, x = divmod(node, self.grid.stride)
+        size = self.cluster_size
+        return ((y - 1) // size) * self.cols + (x - 1) // size
+
+    def _local_grid(self, cluster: int) -> Tuple[bytearray, int, int, int]:
+        """Copy of the cluster's walkability padded by a blocked border.
+
+        Returns ``(walkable, stride, x0, y0)`` where a local id ``l`` maps to
+        the grid node ``(y0 + l // stride) * grid.stride + x0 + l % stride``.
+        """
+        local = self._local_grids.get(cluster)
+        if local is not None:
+            return local
+        grid = self.grid
+        cy, cx = divmod(cluster, self.cols)
+        size = self.cluster_size
+        x0 = cx * size
+        y0 = cy * size
+        width = min(grid.width, x0 + size) - x0
+        height = min(grid.height, y0 + size) - y0
+        stride = width + 2
+        walkable = bytearray(stride * (height + 2))
+        for y in range(height):
+            start = grid.node(x0, y0 + y)
+            row = (y + 1) * stride + 1
+            walkable[row : row + width] = grid.walkable[start : start + width]
+        local = (walkable, stride, x0, y0)
+        self._local_grids[cluster] = local
+        return local
+
+    def _to_local(self, node: int, cluster: int) -> int:
+        _, stride, x0, y0 = self._local_grid(cluster)
+        gy, gx = divmod(node, self.grid.stride)
+        return (gy - y0) * stride + gx - x0
+
+    def _to_global(self, local: int, cluster: int) -> int:
+        _, stride, x0, y0 = self._local_grid(cluster)
+        ly, lx = divmod(local, stride)
+        return (y0 + ly) * self.grid.stride + x0 + lx
+
+    def _local_bfs(self, origin: int, cluster: int) -> List[int]:
+        """Parent array of a BFS from local id ``origin`` inside ``cluster``."""
+        walkable, stride, _, _ = self._local_grid(cluster)
+        parent = [-1] * len(walkable)
+        parent[origin] = origin
+        frontier = [origin]
+        offsets = (-1, 1, -stride, stride)
+        while frontier:
+            next_frontier = []
+            append = next_frontier.append
+            for current in frontier:
+                for offset in offsets:
+                    n = current + offset
+                    if walkable[n] and parent[n] < 0:
+                        parent[n] = current
+                        append(n)
+            frontier = next_frontier
+        return parent
+
+    @staticmethod
+    def _trace(parent: List[int], origin: int, target: int) -> List[int]:
+        """Local ids from ``origin`` to ``target`` excluding ``origin``."""
+        steps = []
+        node = target
+        while node != origin:
+            steps.append(node)
+            node = parent[node]
+        steps.reverse()
+        return steps
+
+    def _costs(self, source: int, cluster: int, targets) -> Dict[int, int]:
+        """Step counts from ``source`` to each reachable node of ``targets``."""
+        origin = self._to_local(source, cluster)
+        parent = self._local_bfs(origin, cluster)
+        costs = {}
+        for target in targets:
+            local = self._to_local(target, cluster)
+            if parent[local] >= 0 and target != source:
+                costs[target] = len(self._trace(parent, origin, local))
+        return costs
+
+    def connect_all(self) -> None:
+        """Connect the entrances of every cluster up front."""
+        start_time = time.perf_counter()
+        for cluster in range(self.cols * self.rows):
+            self._ensure_intra(cluster)
+        self.connect_seconds = time.perf_counter() - start_time
+
+    def _ensure_intra(self, cluster: int) -> None:
+        """Connect the entrances of ``cluster`` on first use."""
+        if self._intra_ready[cluster]:
+            return
+        self._intra_ready[cluster] = 1
+        nodes = self.cluster_nodes[cluster]
+        for i, a in enumerate(nodes):
+            for b, cost in self._costs(a, cluster, nodes[i + 1 :]).items():
+                self.edges[a][b] = self.edges[b][a] = cost
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _segment(self, a: int, b: int) -> Tuple[int, ...]:
+        """Tile steps from ``a`` to ``b`` excluding ``a``.
+
+        Nodes in different clusters are an entrance pair one step apart;
+        otherwise the edge is refined with a search inside the cluster and
+        cached when both ends are entrances.
+        """
+        cluster = self.cluster_of(a)
+        if cluster != self.cluster_of(b):
+            return (b,)
+        steps = self._segments.get((a, b))
+        if steps is None:
+            origin = self._to_local(a, cluster)
+            parent = self._local_bfs(origin, cluster)
+            local = self._trace(parent, origin, self._to_local(b, cluster))
+            steps = tuple(self._to_global(n, cluster) for n in local)
+            if a in self.edges and b in self.edges:
+                self._segments[(a, b)] = steps
+        return steps
+
+    def abstract_path(self, start: int, goal: int) -> Optional[List[int]]:
+        """Return abstract nodes from ``start`` to ``goal`` inclusive."""
+        if self.version != self.grid.version:
+            self.build()
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        self._ensure_intra(start_cluster)
+        self._ensure_intra(goal_cluster)
+
+        # temporary edges linking the query endpoints into the graph
+        targets = list(self.cluster_nodes[start_cluster])
+        if start_cluster == goal_cluster:
+            targets.append(goal)
+        from_start = self._costs(start, start_cluster, targets)
+        into_goal = self._costs(goal, goal_cluster, self.cluster_nodes[goal_cluster])
+
+        stride = self.grid.stride
+        gy, gx = divmod(goal, stride)
+        g_score = {start: 0}
+        came: Dict[int, int] = {}
+        open_set = [(0, start)]
+        closed = set()
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if current == goal:
+                path = [goal]
+                while path[-1] != start:
+                    path.append(came[path[-1]])
+                path.reverse()
+                return path
+            if current in closed:
+                continue
+            closed.add(current)
+            neighbors = []
+            if current in self.edges:
+                self._ensure_intra(self.cluster_of(current))
+                neighbors.extend(self.edges[current].items())
+            if current == start:
+                neighbors.extend(from_start.items())
+            if current in into_goal:
+                neighbors.append((goal, into_goal[current]))
+            base = g_score[current]
+            for n, cost in neighbors:
+                tentative = base + cost
+                if tentative < g_score.get(n, sys.maxsize):
+                    g_score[n] = tentative
+                    came[n] = current
+                    ny, nx = divmod(n, stride)
+                    heapq.heappush(
+                        open_set, (tentative + abs(nx - gx) + abs(ny - gy), n)
+                    )
+        return None
+
+    def iter_path(self, start: int, goal: int) -> Iterator[int]:
+        """Yield tile node ids toward ``goal``, refining one edge at a time."""
+        if start == goal:
+            return
+        abstract = self.abstract_path(start, goal)
+        if not abstract:
+            return
+        for a, b in zip(abstract, abstract[1:]):
+            yield from self._segment(a, b)
+
+    def search(self, start: int, goal: int) -> List[int]:
+        """Return tile node ids from ``start`` to ``goal`` excluding ``start``."""
+        return list(self.iter_path(start, goal))
+
+    def find_path(self, start: Coord, goal: Coord) -> List[Coord]:
+        """Pixel-coordinate wrapper matching :func:`pathfinding.find_path`."""
+        grid = self.grid
+        return grid.to_pixels(self.search(grid.node_at(start), grid.node_at(goal)))
+
+
+# ----------------------------------------------------------------------
+# Benchmark
+# ----------------------------------------------------------------------
+BENCH_SIZES = [(80, 30), (256, 256), (512, 512), (1000, 1000), (2000, 2000)]
+
+
+def bench_grid(width: int, height: int, density: float = 0.1, seed: int = 0):
+    """Return a :class:`NavGrid` of scattered obstacles and long walls.
+
+    Walls run the full height of the map every eighth of its width with two
+    gaps each, so many routes need long detours that plain A* explores
+    widely before finding.
+    """
+    rng = random.Random(seed)
+    grid = NavGrid(width, height, 40, 40)
+    for y in range(height):
+        row = bytes(rng.random() >= density for _ in range(width))
+        start = grid.node(0, y)
+        grid.walkable[start : start + width] = row
+    spacing = max(4, width // 8)
+    for x in range(spacing, width - 1, spacing):
+        gaps = {rng.randrange(height) for _ in range(2)}
+        for y in range(height):
+            grid.walkable[grid.node(x, y)] = 1 if y in gaps else 0
+    return grid
+
+
+def benchmark(
+    sizes: Sequence[Tuple[int, int]] = BENCH_SIZES,
+    queries: int = 5,
+    seed: int = 0,
+) -> List[Dict[str, float]]:
+    """Time HPA* against plain A* on generated maps of each size."""
+    results = []
+    for width, height in sizes:
+        grid = bench_grid(width, height, seed=seed)
+        hpa = HierarchicalPathfinder(grid)
+        hpa.connect_all()
+        rng = random.Random(seed)
+        pairs = []
+        while len(pairs) < queries:
+            a = grid.node(rng.randrange(width), rng.randrange(height))
+            b = grid.node(rng.randrange(width), rng.randrange(height))
+            if grid.walkable[a] and grid.walkable[b]:
+                pairs.append((a, b))
+        astar_time = hpa_time = 0.0
+        astar_len = hpa_len = 0
+        for a, b in pairs:
+            t = time.perf_counter()
+            exact = grid.search(a, b)
+            astar_time += time.perf_counter() - t
+            t = time.perf_counter()
+            approx = hpa.search(a, b)
+            hpa_time += time.perf_counter() - t
+            if exact and approx:
+                astar_len += len(exact)
+                hpa_len += len(approx)
+        results.append(
+            {
+                "width": width,
+                "height": height,
+                "hpa_build_ms": hpa.build_seconds * 1000.0,
+                "hpa_connect_ms": hpa.connect_seconds * 1000.0,
+                "astar_ms": astar_time * 1000.0 / queries,
+                "hpa_ms": hpa_time * 1000.0 / queries,
+                "length_ratio": hpa_len / astar_len if astar_len else 1.0,
+            }
+        )
+    return results
+
+
+def main(argv: Sequence[str] = ()) -> None:
+    sizes = [tuple(int(v) for v in arg.split("x")) for arg in argv] or BENCH_SIZES
+    print(
+        f"{'map':>11} {'build ms':>10} {'connect ms':>11} "
+        f"{'A* ms':>10} {'HPA* ms':>10} {'length':>7}"
+    )
+    for row in benchmark(sizes):
+        print(
+            f"{row['width']:>5}x{row['height']:<5} {row['hpa_build_ms']:>10.1f} "
+            f"{row['hpa_connect_ms']:>11.1f} {row['astar_ms']:>10.1f} "
+            f"{row['hpa_ms']:>10.1f} {row['length_ratio']:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
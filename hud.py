@@ -0,0 +1,325 @@
+"""Retained-mode HUD bar built from widgets with dirty tracking.
+
+Each widget lists the player values it displays through a cheap ``key``
+function. The HUD keeps one bar surface and only re-renders widgets whose key
+changed since the last frame, repainting the rectangles they cover.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+import settings
+from careers import get_job_title, job_progress
+from fonts import render_text
+from helpers import WEEKDAY_NAMES
+from inventory import crafting_exp_needed, CROPS
+import factions
+
+BAR_HEIGHT = 60
+
+
+def _job_text(player, job, label, level):
+    exp, need = job_progress(player, job)
+    prog = f"{exp}/{need}" if need else "MAX"
+    return f"{label}:{get_job_title(player, job)} L{level}({prog})"
+
+
+def _stats_key(p):
+    return (
+        int(p.money), p.tokens, int(p.energy), int(p.health),
+        p.strength, p.defense, p.speed, p.intelligence, p.charisma,
+        p.office_level, p.office_exp, p.dealer_level, p.dealer_exp,
+        p.clinic_level, p.clinic_exp, p.day, int(p.time),
+    )
+
+
+def _stats_text(p):
+    hour = int(p.time) // 60
+    minute = int(p.time) % 60
+    job_info = "  ".join(
+        (
+            _job_text(p, "office", "Office", p.office_level),
+            _job_text(p, "dealer", "Dealer", p.dealer_level),
+            _job_text(p, "clinic", "Clinic", p.clinic_level),
+        )
+    )
+    return (
+        f"Money: ${int(p.money)}  Tokens: {p.tokens}  "
+        f"Energy: {int(p.energy)}  Health: {int(p.health)}  "
+        f"STR:{p.strength} DEF:{p.defense} SPD:{p.speed} "
+        f"INT:{p.intelligence} CHA:{p.charisma}  "
+        f"{job_info}  Day: {p.day}  Time: {hour:02d}:{minute:02d}"
+    )
+
+
+def _resources_text(p):
+    seed_total = sum(p.resources.get(f"{n}_seeds", 0) for n in CROPS)
+    produce_total = sum(p.resources.get(n, 0) for n in CROPS)
+    return (
+        f"M:{p.resources.get('metal', 0)} "
+        f"C:{p.resources.get('cloth', 0)} "
+        f"H:{p.resources.get('herbs', 0)} "
+        f"S:{seed_total} P:{produce_total}"
+    )
+
+
+def _crops_key(p):
+    return p.day, tuple((c["type"], c["planted_day"]) for c in p.crops)
+
+
+def _crops_text(p):
+    parts = []
+    for c in p.crops:
+        growth = CROPS[c["type"]]["growth_days"]
+        parts.append(f"{c['type']}:{min(p.day - c['planted_day'], growth)}/{growth}")
+    return " ".join(parts)
+
+
+def _reputation_key(p):
+    return tuple(p.reputation.get(f, 0) for f in factions.FACTIONS)
+
+
+def _reputation_text(p):
+    line = (
+        f"Mayor:{p.reputation.get('mayor', 0)} "
+        f"Biz:{p.reputation.get('business', 0)} "
+        f"Gang:{p.reputation.get('gang', 0)}"
+    )
+    rewards = (
+        factions.mayor_rewards(p)
+        + factions.business_rewards(p)
+        + factions.gang_rewards(p)
+    )
+    if rewards:
+        line += " " + ", ".join(rewards)
+    return line
+
+
+def _craft_key(p):
+    if not p.crafting_skills:
+        return None
+    first = next(iter(p.crafting_skills))
+    return first, p.crafting_skills[first], p.crafting_exp.get(first, 0)
+
+
+def _craft_text(p):
+    if p.crafting_skills:
+        first = next(iter(p.crafting_skills))
+        level = p.crafting_skills[first]
+        xp = p.crafting_exp.get(first, 0)
+        needed = crafting_exp_needed(p, first)
+        return f"Craft XP: {first.title()} {level} {xp}/{needed}"
+    return "Craft XP: No Crafting"
+
+
+def _cooldown_key(p):
+    return tuple(
+        p.ability_cooldowns[a] // 60 if p.ability_cooldowns[a] else "R"
+        for a in ("heavy", "guard", "special")
+    )
+
+
+def _cooldown_text(p):
+    heavy, guard, special = _cooldown_key(p)
+    return f"Z:{heavy} X:{guard} C:{special}"
+
+
+def _season_text(p):
+    return f"{WEEKDAY_NAMES[p.weekday]} - {p.season} - {p.weather}"
+
+
+class Widget:
+    """Base HUD element that caches its rendered surface."""
+
+    def __init__(self, key: Callable) -> None:
+        self.key = key
+        self.last_key: object = object()
+        self.surface: Optional[pygame.Surface] = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def refresh(self, player, font, width: int) -> Optional[pygame.Rect]:
+        """Re-render if the key changed; return the bar area to repaint."""
+        key = self.key(player)
+        if key == self.last_key:
+            return None
+        self.last_key = key
+        old = self.rect
+        self.surface = self.render(player, font)
+        if self.surface is None:
+            self.rect = pygame.Rect(0, 0, 0, 0)
+            return old.copy()
+        self.rect = self.place(self.surface, width)
+        if old.size == (0, 0):
+            return self.rect.copy()
+        return old.union(self.rect)
+
+    def render(self, player, font) -> Optional[pygame.Surface]:
+        """Return the widget surface, or ``None`` to draw nothing."""
+        return None
+
+    def place(self, surf, width: int) -> pygame.Rect:
+        """Return where ``surf`` goes on a bar ``width`` pixels wide."""
+        return surf.get_rect()
+
+
+class TextWidget(Widget):
+    """Single line of text anchored left, centre or right of the bar."""
+
+    def __init__(self, key, text, y, anchor="left", x=16) -> None:
+        super().__init__(key)
+        self.text = text
+        self.y = y
+        self.anchor = anchor
+        self.x = x
+
+    def render(self, player, font):
+        text = self.text(player)
+        if not text:
+            return None
+        return render_text(font, text, True, settings.FONT_COLOR)
+
+    def place(self, surf, width):
+        if self.anchor == "center":
+            x = width // 2 - surf.get_width() // 2
+        elif self.anchor == "right":
+            x = width - surf.get_width() - 20
+        else:
+            x = self.x
+        return pygame.Rect((x, self.y), surf.get_size())
+
+
+class MeterWidget(Widget):
+    """Horizontal progress bar such as energy or health."""
+
+    def __init__(self, attr, pos, color) -> None:
+        super().__init__(lambda p: int(getattr(p, attr)))
+        self.attr = attr
+        self.pos = pos
+        self.color = color
+
+    def render(self, player, font):
+        surf = pygame.Surface((100, 10))
+        surf.fill((80, 80, 80))
+        value = max(0, min(100, int(getattr(player, self.attr))))
+        pygame.draw.rect(surf, self.color, (0, 0, value, 10))
+        return surf
+
+    def place(self, surf, width):
+        return pygame.Rect(self.pos, surf.get_size())
+
+
+def default_widgets() -> List[Widget]:
+    """Return the HUD widgets in drawing order."""
+    return [
+        TextWidget(_stats_key, _stats_text, 6),
+        TextWidget(lambda p: p.epithet, lambda p: p.epithet, 6, "center"),
+        TextWidget(lambda p: tuple(p.resources.items()), _resources_text, 20),
+        TextWidget(_crops_key, _crops_text, 32),
+        TextWidget(_reputation_key, _reputation_text, 44),
+        TextWidget(
+            lambda p: len(p.cards), lambda p: f"Cards: {len(p.cards)}/10", 20, "right"
+        ),
+        TextWidget(_craft_key, _craft_text, 32, "right"),
+        TextWidget(
+            lambda p: (p.weekday, p.season, p.weather), _season_text, 32, "center"
+        ),
+        TextWidget(
+            lambda p: p.companion,
+            lambda p: f"Pet: {p.companion}" if p.companion else "",
+            6,
+            "right",
+        ),
+        MeterWidget("energy", (16, 44), (0, 200, 0)),
+        MeterWidget("health", (140, 44), (200, 0, 0)),
+        TextWidget(lambda p: None, lambda p: "E", 42, x=6),
+        TextWidget(lambda p: None, lambda p: "H", 42, x=130),
+        TextWidget(_cooldown_key, _cooldown_text, 32, "right"),
+    ]
+
+
+class HUD:
+    """Composite HUD widgets onto a persistent bar surface."""
+
+    def __init__(self, widgets: Optional[List[Widget]] = None) -> None:
+        self.widgets = widgets if widgets is not None else default_widgets()
+        self.bar: Optional[pygame.Surface] = None
+        self.font: Optional[pygame.font.Font] = None
+        self.quest_key: Optional[Tuple] = None
+        self.quest_surface: Optional[pygame.Surface] = None
+        self.dirty_rects: List[pygame.Rect] = []
+
+    def invalidate(self) -> None:
+        """Force every widget to re-render on the next update."""
+        self.bar = None
+        self.quest_key = None
+
+    def update(self, player, font) -> List[pygame.Rect]:
+        """Refresh changed widgets and return the bar rects repainted."""
+        width = settings.SCREEN_WIDTH
+        if self.bar is None or self.bar.get_width() != width or font is not self.font:
+            self.font = font
+            self.bar = pygame.Surface((width, BAR_HEIGHT), pygame.SRCALPHA)
+            for widget in self.widgets:
+                widget.last_key = object()
+                widget.rect = pygame.Rect(0, 0, 0, 0)
+            full = True
+        else:
+            full = False
+
+        bounds = self.bar.get_rect()
+        dirty = []
+        for widget in self.widgets:
+            rect = widget.refresh(player, font, width)
+            if rect is not None:
+                rect = rect.clip(bounds)
+                if rect.size != (0, 0):
+                    dirty.append(rect)
+        if full:
+            dirty = [self.bar.get_rect()]
+        for rect in dirty:
+            self._repaint(rect)
+        self.dirty_rects = dirty
+        return dirty
+
+    def _repaint(self, area: pygame.Rect) -> None:
+        """Clear ``area`` and redraw every widget overlapping it in order."""
+        bar = self.bar
+        bar.fill(settings.UI_BG, area)
+        bar.set_clip(area)
+        for widget in self.widgets:
+            if widget.surface is not None and widget.rect.colliderect(area):
+                bar.blit(widget.surface, widget.rect)
+        bar.set_clip(None)
+
+    def quest_panel(self, font, text: Optional[str]) -> Optional[pygame.Surface]:
+        """Return the cached quest line shown under the bar."""
+        key = (text, font)
+        if key != self.quest_key:
+            self.quest_key = key
+            self.quest_surface = None
+            if text:
+                qsurf = render_text(font, f"Quest: {text}", True, settings.FONT_COLOR)
+                panel = pygame.Surface(
+                    (qsurf.get_width() + 12, qsurf.get_height() + 4), pygame.SRCALPHA
+                )
+                panel.fill((255, 255, 255, 220))
+                panel.blit(qsurf, (6, 2))
+                self.quest_surface = panel
+        return self.quest_surface
+
+    def draw(self, surface, font, player, quest_text=None) -> List[pygame.Rect]:
+        """Update the HUD and blit it; return the dirty rects in screen space."""
+        dirty = list(self.update(player, font))
+        surface.blit(self.bar, (0, 0))
+        previous = self.quest_surface
+        panel = self.quest_panel(font, quest_text)
+        if panel is not None:
+            surface.blit(panel, (16, BAR_HEIGHT + 4))
+        if panel is not previous:
+            for surf in (previous, panel):
+                if surf is not None:
+                    dirty.append(pygame.Rect((16, BAR_HEIGHT + 4), surf.get_size()))
+        return dirty
@@ -7,7 +7,22 @@ from entities import Building, Quest, SideQuest
 from inventory import HOME_UPGRADES, COMPANION_ABILITIES, upgrade_companion_ability
 import settings
 from tilemap import BUS_STOP_BUILDINGS
-from asset_utils import load_image
+from asset_utils import load_image, svg_rects_with_fill
+
+
+def _load_window_layers() -> List[pygame.Surface]:
+    """Load the parallax window-light layers shared by all buildings."""
+    layer_filename = getattr(settings, "BUILDING_WINDOW_LAYER", "")
+    if not layer_filename:
+        return []
+    layer_path = os.path.join(settings.BUILDING_IMAGE_DIR, layer_filename)
+    if not os.path.exists(layer_path):
+        return []
+    try:
+        base_layer = load_image(layer_path)
+    except (pygame.error, FileNotFoundError):
+        return []
+    return [base_layer, base_layer.copy(), base_layer.copy()]
 
 
 def load_buildings(path: str = "data/buildings.json") -> List[Building]:
@@ -15,6 +30,7 @@ def load_buildings(path: str = "data/buildings.json") -> List[Building]:
     with open(path) as f:
         data = json.load(f)
     data.extend(BUS_STOP_BUILDINGS)
+    shared_layers = _load_window_layers()
     buildings: List[Building] = []
     for b in data:
         rect = pygame.Rect(*b["rect"])
@@ -22,6 +38,7 @@ def load_buildings(path: str = "data/buildings.json") -> List[Building]:
         btype = b["type"]
         image = None
         window_layers: List[pygame.Surface] = []
+        windows = []
         if btype != "bus_stop":
             filename = settings.BUILDING_SPRITES.get(
                 btype, settings.BUILDING_SPRITES["default"]
@@ -31,21 +48,32 @@ def load_buildings(path: str = "data/buildings.json") -> List[Building]:
                 image = load_image(img_path)
             except (pygame.error, FileNotFoundError):
                 image = None
-            layer_filename = getattr(settings, "BUILDING_WINDOW_LAYER", "")
-            if layer_filename:
-                layer_path = os.path.join(settings.BUILDING_IMAGE_DIR, layer_filename)
-                if os.path.exists(layer_path):
-                    try:
-                        base_layer = load_image(layer_path)
-                        window_layers = [base_layer, base_layer.copy(), base_layer.copy()]
-                    except (pygame.error, FileNotFoundError):
-                        window_layers = []
+            if image is not None:
+                windows = svg_rects_with_fill(
+                    img_path, settings.BUILDING_WINDOW_FILL
+                )
+            # every building shares the same layer surfaces so rendered
+            # window-light frames can be cached once for the whole city
+            window_layers = list(shared_layers)
         buildings.append(
-            Building(rect, name, btype, image=image, window_layers=window_layers)
+            Building(
+                rect,
+                name,
+                btype,
+                image=image,
+                window_layers=window_layers,
+                windows=windows,
+            )
         )
     return buildings
 
 
+def load_street_lamps(path: str = "data/street_lamps.json") -> List[tuple]:
+    """Load the world positions of the street lamp heads."""
+    with open(path) as f:
+        return [tuple(pos) for pos in json.load(f)]
+
+
 # Quest check functions map by index
 
 def _quest_check(idx: int, player) -> bool:
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Dict
 import pygame
 
 from helpers import recalc_layouts, compute_slot_rects, scaled_font, save_game, load_game
+from fonts import render_text
 from businesses import (
     manage_business,
     hire_staff,
@@ -61,7 +62,7 @@ def controls_menu(
             json.dump(settings.KEY_BINDINGS, f)
 
     while True:
-        for event in pygame.event.get():
+        for event in game.menu_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -76,7 +77,7 @@ def controls_menu(
                 elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                     waiting = True
                     while waiting:
-                        for ev in pygame.event.get():
+                        for ev in game.menu_events():
                             if ev.type == pygame.QUIT:
                                 pygame.quit()
                                 sys.exit()
@@ -89,7 +90,8 @@ def controls_menu(
                                 save()
                                 waiting = False
                         screen.fill((0, 0, 0))
-                        prompt = font.render(
+                        prompt = render_text(
+                            font,
                             "Press a key or button...", True, (255, 255, 255)
                         )
                         screen.blit(
@@ -102,14 +104,14 @@ def controls_menu(
                         pygame.display.flip()
                         pygame.time.wait(20)
         screen.fill((0, 0, 0))
-        title = font.render("Controls", True, (255, 255, 255))
+        title = render_text(font, "Controls", True, (255, 255, 255))
         screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
         for i, action in enumerate(actions):
             binds = ", ".join(_binding_name(b) for b in settings.KEY_BINDINGS[action])
             color = (255, 255, 0) if i == idx else (200, 200, 200)
-            txt = font.render(f"{action}: {binds}", True, color)
+            txt = render_text(font, f"{action}: {binds}", True, color)
             screen.blit(txt, (100, 120 + i * 40))
-        info = font.render("Enter to rebind, Esc to exit", True, (200, 200, 200))
+        info = render_text(font, "Enter to rebind, Esc to exit", True, (200, 200, 200))
         screen.blit(info, (100, settings.SCREEN_HEIGHT - 80))
         pygame.display.flip()
         pygame.time.wait(20)
@@ -132,7 +134,7 @@ def deck_build_menu(
     idx = 0
 
     while True:
-        for event in pygame.event.get():
+        for event in game.menu_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -151,13 +153,13 @@ def deck_build_menu(
                     deck.pop()
 
         screen.fill((0, 0, 0))
-        title = font.render("Deck Builder", True, (255, 255, 255))
+        title = render_text(font, "Deck Builder", True, (255, 255, 255))
         screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
         for i, name in enumerate(available):
             color = (255, 255, 0) if i == idx else (200, 200, 200)
-            txt = font.render(name, True, color)
+            txt = render_text(font, name, True, color)
             screen.blit(txt, (100, 120 + i * 30))
-        deck_txt = font.render(f"Deck: {len(deck)}/30", True, (200, 200, 200))
+        deck_txt = render_text(font, f"Deck: {len(deck)}/30", True, (200, 200, 200))
         screen.blit(deck_txt, (settings.SCREEN_WIDTH - deck_txt.get_width() - 20, 80))
         pygame.display.flip()
         pygame.time.wait(20)
@@ -193,7 +195,7 @@ def shop_menu(
     message = ""
 
     while True:
-        for event in pygame.event.get():
+        for event in game.menu_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -213,14 +215,17 @@ def shop_menu(
 
         screen.fill((0, 0, 0))
 
-        title = font.render("General Store", True, (255, 255, 255))
+        title = render_text(font, "General Store", True, (255, 255, 255))
         screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
 
-        money_txt = font.render(f"Money: ${player.money:.0f}", True, (200, 200, 200))
+        money_txt = render_text(
+            font, f"Money: ${player.money:.0f}", True, (200, 200, 200)
+        )
         screen.blit(money_txt, (80, 110))
 
         duplicates = duplicate_card_rarity_counts(player)
-        cards_txt = font.render(
+        cards_txt = render_text(
+            font,
             f"Duplicate Cards: {_format_duplicate_summary(duplicates)}",
             True,
             (200, 200, 200),
@@ -236,7 +241,8 @@ def shop_menu(
                 if card_cost
                 else "Cards: N/A"
             )
-            text = font.render(
+            text = render_text(
+                font,
                 f"{item['name']} - ${price} | {req_text}",
                 True,
                 color,
@@ -244,7 +250,8 @@ def shop_menu(
             screen.blit(text, (80, 180 + i * 30))
 
         mode_name = "Cards" if payment_mode == "card" else "Cash"
-        info = font.render(
+        info = render_text(
+            font,
             f"Mode: {mode_name}  Enter: Buy  P: Toggle payment  Esc: Exit",
             True,
             (200, 200, 200),
@@ -252,7 +259,7 @@ def shop_menu(
         screen.blit(info, (80, settings.SCREEN_HEIGHT - 100))
 
         if message:
-            msg = font.render(message, True, (180, 220, 180))
+            msg = render_text(font, message, True, (180, 220, 180))
             screen.blit(msg, (80, settings.SCREEN_HEIGHT - 60))
 
         pygame.display.flip()
@@ -291,7 +298,7 @@ def business_menu(
     message = ""
 
     while True:
-        for event in pygame.event.get():
+        for event in game.menu_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -318,7 +325,7 @@ def business_menu(
                         message = schedule_future_contract(player, name)
 
         screen.fill((0, 0, 0))
-        title = font.render("Businesses", True, (255, 255, 255))
+        title = render_text(font, "Businesses", True, (255, 255, 255))
         screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
         for i, name in enumerate(names):
             staff = player.business_staff.get(name, 0)
@@ -331,12 +338,13 @@ def business_menu(
                     label += " [Future ready]"
                 else:
                     label += f" [Future day {due}]"
-            txt = font.render(label, True, color)
+            txt = render_text(font, label, True, color)
             screen.blit(txt, (100, 120 + i * 40))
         if message:
-            msg_txt = font.render(message, True, (200, 200, 200))
+            msg_txt = render_text(font, message, True, (200, 200, 200))
             screen.blit(msg_txt, (100, settings.SCREEN_HEIGHT - 80))
-        info = font.render(
+        info = render_text(
+            font,
             "M:Manage H:Hire C:Campaign T:Train F:Futures Esc:Exit",
             True,
             (200, 200, 200),
@@ -360,7 +368,7 @@ def pet_shop_menu(
     message = ""
 
     while True:
-        for event in pygame.event.get():
+        for event in game.menu_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -375,15 +383,17 @@ def pet_shop_menu(
                     message = schedule_companion_errand(player, idx)
 
         screen.fill((0, 0, 0))
-        title = font.render("Pet Shop Errands", True, (255, 255, 255))
+        title = render_text(font, "Pet Shop Errands", True, (255, 255, 255))
         screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
 
         chance = companion_errand_success_chance(player)
-        chance_txt = font.render(
+        chance_txt = render_text(
+            font,
             f"Success chance: {int(chance * 100)}%", True, (200, 200, 200)
         )
         screen.blit(chance_txt, (100, 110))
-        fee_txt = font.render(
+        fee_txt = render_text(
+            font,
             f"Fee: ${COMPANION_ERRAND_FEE}  Morale needed: {MIN_COMPANION_MORALE_FOR_ERRAND}",
             True,
             (200, 200, 200),
@@ -395,13 +405,15 @@ def pet_shop_menu(
         for i in range(start, min(len(SHOP_ITEMS), start + max_visible)):
             item_name = SHOP_ITEMS[i][0]
             color = (255, 255, 0) if i == idx else (200, 200, 200)
-            txt = font.render(f"{i + 1}. {item_name}", True, color)
+            txt = render_text(font, f"{i + 1}. {item_name}", True, color)
             screen.blit(txt, (100, 180 + (i - start) * 30))
 
-        info = font.render("Enter to schedule, Esc to exit", True, (200, 200, 200))
+        info = render_text(
+            font, "Enter to schedule, Esc to exit", True, (200, 200, 200)
+        )
         screen.blit(info, (100, settings.SCREEN_HEIGHT - 80))
         if message:
-            msg_txt = font.render(message, True, (180, 220, 180))
+            msg_txt = render_text(font, message, True, (180, 220, 180))
             screen.blit(msg_txt, (100, settings.SCREEN_HEIGHT - 120))
 
         pygame.display.flip()
@@ -421,7 +433,7 @@ def pause_menu(
     idx = 0
 
     while True:
-        for event in pygame.event.get():
+        for event in game.menu_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -446,14 +458,14 @@ def pause_menu(
                         controls_menu(game, screen, font)
 
         screen.fill((0, 0, 0))
-        title = font.render("Paused", True, (255, 255, 255))
+        title = render_text(font, "Paused", True, (255, 255, 255))
         screen.blit(
             title,
             (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 120),
         )
         for i, opt in enumerate(options):
             color = (255, 255, 0) if i == idx else (200, 200, 200)
-            txt = font.render(opt, True, color)
+            txt = render_text(font, opt, True, color)
             screen.blit(
                 txt,
                 (settings.SCREEN_WIDTH // 2 - txt.get_width() // 2, 200 + i * 40),
@@ -476,7 +488,7 @@ def start_menu(
             except Exception:
                 board = []
     while True:
-        for event in pygame.event.get():
+        for event in game.menu_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -498,9 +510,9 @@ def start_menu(
                 if event.key == pygame.K_c:
                     controls_menu(game, screen, font)
         screen.fill((0, 0, 0))
-        title = font.render("Stick RPG Clone", True, (255, 255, 255))
-        start_txt = font.render("Press Enter to Start", True, (230, 230, 230))
-        load_txt = font.render("Press L to Load Game", True, (230, 230, 230))
+        title = render_text(font, "Stick RPG Clone", True, (255, 255, 255))
+        start_txt = render_text(font, "Press Enter to Start", True, (230, 230, 230))
+        load_txt = render_text(font, "Press L to Load Game", True, (230, 230, 230))
         screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 260))
         screen.blit(
             start_txt, (settings.SCREEN_WIDTH // 2 - start_txt.get_width() // 2, 320)
@@ -508,18 +520,19 @@ def start_menu(
         screen.blit(
             load_txt, (settings.SCREEN_WIDTH // 2 - load_txt.get_width() // 2, 360)
         )
-        controls_txt = font.render("Press C for Controls", True, (230, 230, 230))
+        controls_txt = render_text(font, "Press C for Controls", True, (230, 230, 230))
         screen.blit(
             controls_txt,
             (settings.SCREEN_WIDTH // 2 - controls_txt.get_width() // 2, 400),
         )
         if board:
-            lb_title = font.render("Top Completions", True, (230, 230, 230))
+            lb_title = render_text(font, "Top Completions", True, (230, 230, 230))
             screen.blit(
                 lb_title, (settings.SCREEN_WIDTH // 2 - lb_title.get_width() // 2, 440)
             )
             for i, rec in enumerate(board):
-                txt = font.render(
+                txt = render_text(
+                    font,
                     f"{i+1}. Day {rec['day']} - ${rec['money']}", True, (200, 200, 200)
                 )
                 screen.blit(
@@ -540,7 +553,7 @@ def draw_workshop_menu(surface: pygame.Surface, font: pygame.font.Font, player,
     panel.fill((240, 240, 220))
     surface.blit(panel, (60, 60))
 
-    title = font.render("Workshop", True, settings.FONT_COLOR)
+    title = render_text(font, "Workshop", True, settings.FONT_COLOR)
     surface.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 70))
 
     y = 120
@@ -548,7 +561,8 @@ def draw_workshop_menu(surface: pygame.Surface, font: pygame.font.Font, player,
         for skill, lvl in player.crafting_skills.items():
             xp = player.crafting_exp.get(skill, 0)
             needed = crafting_exp_needed(player, skill)
-            prog = font.render(
+            prog = render_text(
+                font,
                 f"{skill.title()} Lv{lvl} {xp}/{needed}",
                 True,
                 settings.FONT_COLOR,
@@ -556,12 +570,12 @@ def draw_workshop_menu(surface: pygame.Surface, font: pygame.font.Font, player,
             surface.blit(prog, (100, y))
             y += 40
     else:
-        txt = font.render("No crafting skills", True, settings.FONT_COLOR)
+        txt = render_text(font, "No crafting skills", True, settings.FONT_COLOR)
         surface.blit(txt, (100, y))
         y += 40
 
     if not player.known_recipes:
-        txt = font.render("No recipes known", True, settings.FONT_COLOR)
+        txt = render_text(font, "No recipes known", True, settings.FONT_COLOR)
         surface.blit(txt, (100, y))
     else:
         for i, name in enumerate(player.known_recipes):
@@ -571,7 +585,8 @@ def draw_workshop_menu(surface: pygame.Surface, font: pygame.font.Font, player,
             )
             skill = recipe.get("skill", "crafting").title()
             lvl = recipe.get("level", 1)
-            line = font.render(
+            line = render_text(
+                font,
                 f"{i+1}: {name} ({skill} Lv{lvl}) - {reqs}",
                 True,
                 settings.FONT_COLOR,
@@ -579,7 +594,7 @@ def draw_workshop_menu(surface: pygame.Surface, font: pygame.font.Font, player,
             surface.blit(line, (100, y + i * 40))
 
     info_y = y + len(player.known_recipes) * 40 + 20
-    info = font.render("[Q] Exit  [R] Repair", True, settings.FONT_COLOR)
+    info = render_text(font, "[Q] Exit  [R] Repair", True, settings.FONT_COLOR)
     surface.blit(info, (100, info_y))
 
 
@@ -601,7 +616,7 @@ def character_creation(
     has_hat = False
     selecting = 0  # 0=body,1=head,2=pants,3=hat
     while True:
-        for event in pygame.event.get():
+        for event in game.menu_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -642,32 +657,36 @@ def character_creation(
                 elif event.unicode and event.unicode.isprintable() and len(name) < 12:
                     name += event.unicode
         screen.fill((0, 0, 0))
-        title = font.render("Create Character", True, (255, 255, 255))
-        prompt = font.render(f"Name: {name}", True, (230, 230, 230))
-        body_txt = font.render(
+        title = render_text(font, "Create Character", True, (255, 255, 255))
+        prompt = render_text(font, f"Name: {name}", True, (230, 230, 230))
+        body_txt = render_text(
+            font,
             f"Body Color: {color_names[body_idx]} (\u2190/\u2192)",
             True,
             colors[body_idx],
         )
-        head_txt = font.render(
+        head_txt = render_text(
+            font,
             f"Head Color: {head_color_names[head_idx]} (\u2190/\u2192)",
             True,
             head_colors[head_idx],
         )
-        pants_txt = font.render(
+        pants_txt = render_text(
+            font,
             f"Pants Color: {color_names[pants_idx]} (\u2190/\u2192)",
             True,
             colors[pants_idx],
         )
         hat_status = "On" if has_hat else "Off"
         hat_color = colors[hat_idx]
-        hat_txt = font.render(
+        hat_txt = render_text(
+            font,
             f"Hat: {hat_status} ({color_names[hat_idx]}) (Space)",
             True,
             hat_color if has_hat else (200, 200, 200),
         )
-        toggle_txt = font.render("Press TAB to switch", True, (230, 230, 230))
-        confirm = font.render("Press Enter to Start", True, (230, 230, 230))
+        toggle_txt = render_text(font, "Press TAB to switch", True, (230, 230, 230))
+        confirm = render_text(font, "Press Enter to Start", True, (230, 230, 230))
         screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 220))
         screen.blit(prompt, (settings.SCREEN_WIDTH // 2 - prompt.get_width() // 2, 260))
         screen.blit(
@@ -0,0 +1,160 @@
+"""Level of detail for NPCs outside the camera view.
+
+NPCs inside the view, plus a margin, move every tick. The rest are brought
+up to date only every ``FAR_TICK_INTERVAL`` ticks, or whenever something
+asks for their position, by jumping straight to where per-tick movement
+would have left them after the NPC ticks they missed. Paths are straight
+segments walked at a fixed speed, so the jump lands on exactly the same
+pixel as stepping would have.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pygame
+
+from crowd import travel
+
+# Ticks between catch-ups of an off-screen NPC
+FAR_TICK_INTERVAL = 15
+# Pixels around the view that still count as visible. Must exceed the distance
+# an NPC walks in FAR_TICK_INTERVAL ticks so nobody enters the view unsynced.
+LOD_MARGIN = 128
+
+
+def advance_npc(npc, ticks: int) -> None:
+    """Move ``npc`` to where ``ticks`` calls to :meth:`NPC.move` would put it."""
+    if ticks <= 0:
+        return
+    if npc.crowd is not None:
+        npc.crowd.advance(npc.slot, ticks)
+        return
+    speed = npc.speed
+    path = npc.path
+    if speed <= 0 or not path:
+        return
+    x, y = npc.rect.topleft
+    done = 0
+    while ticks > 0 and done < len(path):
+        tx, ty = path[done]
+        x, y, ticks, arrived = travel(x, y, tx, ty, speed, ticks)
+        if arrived:
+            done += 1
+    npc.rect.topleft = (x, y)
+    del path[:done]
+
+
+class NPCLevelOfDetail:
+    """Split NPCs into per-tick near ones and lazily advanced far ones."""
+
+    def __init__(
+        self, far_interval: int = FAR_TICK_INTERVAL, margin: int = LOD_MARGIN
+    ) -> None:
+        self.far_interval = far_interval
+        self.margin = margin
+        self.tick = 0
+        self.started = False
+        self.synced: Dict[int, int] = {}  # id(npc) -> tick its position is for
+        self.near: List = []
+        # NPCs whose position changed during the last update
+        self.moved: List = []
+
+    def sync(self, npc, tick: Optional[int] = None) -> bool:
+        """Advance ``npc`` to ``tick`` (default: the last completed tick).
+
+        Returns True if the NPC had fallen behind. Call this before reading
+        the position of an NPC that may be off screen.
+        """
+        lag = self._lag(npc, tick)
+        if lag <= 0:
+            return False
+        advance_npc(npc, lag)
+        return True
+
+    def _lag(self, npc, tick: Optional[int] = None) -> int:
+        """Mark ``npc`` synced to ``tick`` and return the ticks it missed."""
+        if tick is None:
+            tick = self.tick
+        lag = tick - self.synced.get(id(npc), tick)
+        self.synced[id(npc)] = tick
+        if lag > 0 and npc.bubble_timer > 0:
+            npc.bubble_timer = max(0, npc.bubble_timer - lag)
+        return lag
+
+    def sync_all(self, npcs: Iterable) -> None:
+        for npc in npcs:
+            self.sync(npc)
+
+    def _visible(self, npcs: Sequence, area: pygame.Rect, index) -> List:
+        if index is not None:
+            return index.query_rect(area)
+        return [npc for npc in npcs if area.colliderect(npc.bounds)]
+
+    def update(
+        self, npcs: Sequence, view: pygame.Rect, tick: int, crowd=None, index=None
+    ) -> List:
+        """Advance the clock to NPC tick ``tick`` and move every NPC that is due.
+
+        NPCs near ``view`` step normally and are returned so the caller can
+        run per-frame logic such as greetings on them. Off-screen NPCs are
+        caught up in round-robin batches so each is synced at least every
+        ``far_interval`` ticks. ``tick`` comes from the caller's own tick
+        counter, such as :attr:`npc_sim.NPCSimulation.ticks`, so NPCs catch
+        up by the ticks that ran rather than by the game clock. ``index`` is
+        an optional :class:`spatial.SpatialHash` of the NPCs used to find the
+        near ones.
+        """
+        if not self.started:
+            self.started = True
+            for npc in npcs:
+                self.synced.setdefault(id(npc), self.tick)
+        start = self.tick
+        ticks = max(0, tick - start)
+        self.tick = now = start + ticks
+        area = view.inflate(self.margin * 2, self.margin * 2)
+        near = self._visible(npcs, area, index) if ticks else []
+        near_ids = {id(npc) for npc in near}
+        moved = list(near)
+
+        # far NPCs: one slice of the list per elapsed tick
+        interval = self.far_interval
+        if ticks >= interval:
+            due: Iterable = npcs
+        else:
+            due = (
+                npc
+                for t in range(start + 1, now + 1)
+                for npc in npcs[t % interval :: interval]
+            )
+        slots = []
+        lags = []
+        for npc in due:
+            if id(npc) in near_ids:
+                continue
+            lag = self._lag(npc, now)
+            if lag <= 0:
+                continue
+            moved.append(npc)
+            if crowd is not None and npc.crowd is crowd:
+                slots.append(npc.slot)
+                lags.append(lag)
+            else:
+                advance_npc(npc, lag)
+        if slots:
+            crowd.advance_many(slots, lags)
+
+        # near NPCs: catch up to the previous tick, then step like usual
+        crowd_slots = []
+        for npc in near:
+            self.sync(npc, now - 1)
+            self.synced[id(npc)] = now
+            if crowd is not None and npc.crowd is crowd:
+                crowd_slots.append(npc.slot)
+            else:
+                npc.move()
+        if crowd_slots:
+            crowd.step(crowd_slots)
+        self.near = near
+        self.moved = moved
+        return near
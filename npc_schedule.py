@@ -0,0 +1,89 @@
+"""Timing wheel that fires NPC shift changes by in-game minute.
+
+NPC destinations only change when a work shift starts or ends, so instead of
+re-deriving every NPC's target each frame, :class:`NPCScheduler` files each
+NPC under the minutes of its shift boundaries. :meth:`NPCScheduler.advance`
+walks the wheel slots between the previous and the current clock time and
+returns just the NPCs whose boundaries were crossed.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def on_shift(npc, hour: int) -> bool:
+    """Return True if ``npc`` is working at ``hour``; shifts may wrap midnight."""
+    if not npc.work:
+        return False
+    start, end = npc.work_start, npc.work_end
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+class NPCScheduler:
+    """Fire NPC schedule changes from a wheel of one slot per minute."""
+
+    def __init__(self, buildings: Iterable, npcs: Iterable = ()) -> None:
+        self.slots: List[List] = [[] for _ in range(MINUTES_PER_DAY)]
+        self.buildings: Dict[str, object] = {}
+        for b in buildings:
+            # first building of a type wins, like the old linear lookup
+            self.buildings.setdefault(b.btype, b)
+        self.npcs: Dict[int, object] = {}  # id(npc) -> npc
+        self.pending: List = []
+        self.minute: Optional[int] = None
+        for npc in npcs:
+            self.register(npc)
+
+    def register(self, npc) -> None:
+        """Add ``npc`` to the wheel; its destination is due on next advance."""
+        if id(npc) in self.npcs:
+            self.unregister(npc)
+        self.npcs[id(npc)] = npc
+        if npc.work:
+            for hour in {npc.work_start, npc.work_end}:
+                self.slots[(hour * 60) % MINUTES_PER_DAY].append(npc)
+        self.pending.append(npc)
+
+    def unregister(self, npc) -> None:
+        if self.npcs.pop(id(npc), None) is None:
+            return
+        for slot in self.slots:
+            slot[:] = [n for n in slot if n is not npc]
+        self.pending = [n for n in self.pending if n is not npc]
+
+    def reschedule(self, npc) -> None:
+        """Refile ``npc`` after its work hours changed."""
+        self.register(npc)
+
+    def target(self, npc, hour: int):
+        """Return the building ``npc`` should be at during ``hour``."""
+        btype = npc.work if on_shift(npc, hour) else npc.home
+        return self.buildings.get(btype)
+
+    def advance(self, time: float) -> List:
+        """Move the clock to ``time`` minutes and return NPCs to re-route.
+
+        Every slot after the previous minute up to and including the new one
+        fires, wrapping past midnight.
+        """
+        now = int(time) % MINUTES_PER_DAY
+        due = self.pending
+        self.pending = []
+        previous = self.minute
+        self.minute = now
+        if previous is None or previous == now:
+            return due
+        elapsed = (now - previous) % MINUTES_PER_DAY
+        seen = {id(n) for n in due}
+        slots = self.slots
+        for step in range(1, elapsed + 1):
+            for npc in slots[(previous + step) % MINUTES_PER_DAY]:
+                if id(npc) not in seen:
+                    seen.add(id(npc))
+                    due.append(npc)
+        return due
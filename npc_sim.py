@@ -0,0 +1,232 @@
+"""Fixed-rate NPC simulation shared by gameplay and quests.
+
+:class:`NPCSimulation` bundles the NPC subsystems (shift scheduler, path
+planning, crowd movement, level of detail and the NPC spatial index) and
+advances them in fixed ticks of ``1 / tick_rate`` seconds, however fast the
+game renders. Every tick runs four phases, scheduling, pathing, movement and
+greeting, and records the nanoseconds each one took, also into the shared
+:data:`~profiler.PROFILER` while it is enabled.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+import pygame
+
+import settings
+from npc_schedule import NPCScheduler
+from path_planner import plan_path
+from profiler import PROFILER
+
+# Order in which tick phases run and are reported
+PHASES = ("schedule", "pathing", "movement", "greeting")
+# Number of recent ticks kept per phase for stats()
+TIMING_SAMPLES = 120
+
+
+def route_npc(
+    npc, building, tile_map, routes=None, flow_fields=None, planner=None
+) -> None:
+    """Point ``npc`` at ``building`` and plan a path if the target moved."""
+    dest = (
+        building.rect.centerx - npc.rect.width // 2,
+        building.rect.centery - npc.rect.height // 2,
+    )
+    if npc.destination == dest:
+        return
+    npc.destination = dest
+    if planner is not None:
+        planner.request(npc, building, dest)
+    else:
+        npc.path = plan_path(
+            npc.rect.topleft, building, dest, tile_map, routes, flow_fields
+        )
+
+
+class NPCSimulation:
+    """Advance NPCs in fixed ticks and time each phase of a tick.
+
+    New paths follow the shared ``flow_fields`` of the destination when
+    given, otherwise they are looked up from the precomputed ``routes`` and
+    only searched from scratch when neither is available; a ``planner``
+    queues them within its frame budget instead. Only NPCs whose shift
+    started or ended since the last tick get a new destination. NPCs
+    attached to ``crowd`` move together in one vectorized step.
+
+    With ``lod`` only NPCs near the view or the player step every tick; the
+    others are caught up along their paths by
+    :class:`~npc_lod.NPCLevelOfDetail`. ``index`` is the NPC
+    :class:`~spatial.SpatialHash`; it is kept up to date here and used to
+    find the NPCs close enough to greet the player.
+    """
+
+    def __init__(
+        self,
+        buildings: Sequence,
+        npcs: Sequence,
+        tile_map,
+        routes=None,
+        flow_fields=None,
+        scheduler: Optional[NPCScheduler] = None,
+        crowd=None,
+        lod=None,
+        index=None,
+        planner=None,
+        tick_rate: float = settings.NPC_TICK_RATE,
+        max_ticks: int = settings.MAX_NPC_TICKS_PER_UPDATE,
+    ) -> None:
+        self.buildings = buildings
+        self.npcs = npcs
+        self.tile_map = tile_map
+        self.routes = routes
+        self.flow_fields = flow_fields
+        if scheduler is None:
+            scheduler = NPCScheduler(buildings, npcs)
+        self.scheduler = scheduler
+        self.crowd = crowd
+        self.lod = lod
+        self.index = index
+        self.planner = planner
+        self.tick_rate = tick_rate
+        self.max_ticks = max_ticks
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self._accumulator = 0.0
+        self._last_update: Optional[float] = None
+        # phase -> nanoseconds spent in it by recent ticks
+        self.timings: Dict[str, Deque[int]] = {
+            phase: deque(maxlen=TIMING_SAMPLES) for phase in PHASES
+        }
+
+    @property
+    def tick_seconds(self) -> float:
+        return 1.0 / self.tick_rate
+
+    def update(
+        self, player, dt: Optional[float] = None, view: Optional[pygame.Rect] = None
+    ) -> int:
+        """Run the ticks that ``dt`` seconds of wall time cover.
+
+        ``dt`` defaults to the wall time since the previous call. At most
+        ``max_ticks`` run per call; time beyond that is dropped so a stall
+        does not snowball. Returns the number of ticks run.
+        """
+        now = time.perf_counter()
+        if dt is None:
+            dt = 0.0 if self._last_update is None else now - self._last_update
+        self._last_update = now
+        self._accumulator += dt
+        step = self.tick_seconds
+        count = 0
+        while self._accumulator >= step:
+            if count == self.max_ticks:
+                self.dropped_ticks += int(self._accumulator / step)
+                self._accumulator %= step
+                break
+            self._accumulator -= step
+            self.tick(player, view)
+            count += 1
+        return count
+
+    def tick(self, player, view: Optional[pygame.Rect] = None) -> None:
+        """Run one tick: scheduling, pathing, movement and greeting."""
+        clock = time.perf_counter_ns
+        lod = self.lod
+        start = clock()
+
+        hour = int(player.time) // 60
+        due = []
+        for npc in self.scheduler.advance(player.time):
+            building = self.scheduler.target(npc, hour)
+            if building:
+                due.append((npc, building))
+        scheduled = clock()
+
+        for npc, building in due:
+            if lod is not None:
+                lod.sync(npc)
+            route_npc(
+                npc,
+                building,
+                self.tile_map,
+                self.routes,
+                self.flow_fields,
+                self.planner,
+            )
+        if self.planner is not None:
+            self.planner.process()
+        pathed = clock()
+
+        npcs = self.npcs
+        crowd = self.crowd
+        greet_area = player.rect.inflate(40, 40)
+        moving = npcs
+        if lod is not None:
+            area = greet_area if view is None else view.union(greet_area)
+            moving = lod.update(npcs, area, self.ticks + 1, crowd, self.index)
+        else:
+            if crowd is not None:
+                crowd.step()
+            for npc in npcs:
+                if crowd is None or npc.crowd is not crowd:
+                    npc.move()
+        if self.index is not None:
+            self._reindex(lod.moved if lod is not None else npcs)
+        moved = clock()
+
+        for npc in moving:
+            if npc.bubble_timer > 0:
+                npc.bubble_timer -= 1
+        if self.index is not None:
+            greeted = self.index.query_rect(greet_area)
+        else:
+            greeted = [npc for npc in npcs if greet_area.colliderect(npc.bounds)]
+        for npc in greeted:
+            npc.bubble_message = f"Hi {player.name}"
+            npc.bubble_timer = 60
+        greeted_at = clock()
+
+        timings = self.timings
+        timings["schedule"].append(scheduled - start)
+        timings["pathing"].append(pathed - scheduled)
+        timings["movement"].append(moved - pathed)
+        timings["greeting"].append(greeted_at - moved)
+        self.ticks += 1
+        if PROFILER.enabled:
+            PROFILER.record("npc.schedule", scheduled - start)
+            PROFILER.record("npc.pathing", pathed - scheduled)
+            PROFILER.record("npc.movement", moved - pathed)
+            PROFILER.record("npc.greeting", greeted_at - moved)
+
+    def _reindex(self, npcs: Sequence) -> None:
+        """Move ``npcs`` in the index, reading crowd positions in one go."""
+        index = self.index
+        crowd = self.crowd
+        attached = []
+        for npc in npcs:
+            if crowd is not None and npc.crowd is crowd:
+                attached.append(npc)
+            else:
+                index.move(npc, npc.bounds)
+        if attached:
+            bounds = crowd.bounds_many([npc.slot for npc in attached])
+            for npc, rect in zip(attached, bounds):
+                index.move(npc, rect)
+
+    def last_tick(self) -> Dict[str, int]:
+        """Nanoseconds each phase took in the most recent tick."""
+        return {phase: (t[-1] if t else 0) for phase, t in self.timings.items()}
+
+    def stats(self) -> Dict[str, float]:
+        """Mean milliseconds per phase over recent ticks plus tick counters."""
+        result: Dict[str, float] = {
+            phase + "_ms": (sum(t) / len(t) / 1e6 if t else 0.0)
+            for phase, t in self.timings.items()
+        }
+        result["ticks"] = self.ticks
+        result["dropped_ticks"] = self.dropped_ticks
+        result["tick_rate"] = self.tick_rate
+        return result
@@ -0,0 +1,161 @@
+"""Vectorized rain and snow particles backed by NumPy arrays."""
+
+from __future__ import annotations
+
+import random
+from typing import Optional, Tuple
+
+import pygame
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+RAIN_COLOR = (180, 180, 255)
+SNOW_COLOR = (255, 255, 255)
+
+# Particle counts at density 1.0
+BASE_COUNTS = {"Rain": 180, "Snow": 120}
+
+
+def _line_offsets(dx: int, dy: int):
+    """Pixel offsets covering a one pixel wide line from (0, 0) to (dx, dy)."""
+    steps = max(abs(dx), abs(dy))
+    return sorted(
+        {(round(dx * i / steps), round(dy * i / steps)) for i in range(steps + 1)}
+    )
+
+
+def _disk_offsets(radius: int):
+    """Pixel offsets covering a filled circle of ``radius``."""
+    return [
+        (x, y)
+        for y in range(-radius, radius + 1)
+        for x in range(-radius, radius + 1)
+        if x * x + y * y <= radius * radius
+    ]
+
+
+# Pixel footprint of each particle type relative to its position
+FOOTPRINTS = {
+    "Rain": _line_offsets(3, 8),
+    "Snow": _disk_offsets(2),
+}
+
+
+class ParticleField:
+    """Rain or snow particles stored as struct-of-arrays.
+
+    Positions, velocities and sizes live in NumPy arrays and are advanced in
+    one vectorized step. Drawing writes every particle's pixel footprint into
+    the target through :func:`pygame.surfarray.pixels2d`, falling back to
+    batched blits of a pre-rendered sprite for surfaces it cannot map.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        size: Tuple[int, int],
+        density: float = 1.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        if np is None:  # pragma: no cover - guarded by available()
+            raise RuntimeError("NumPy is required for ParticleField")
+        self.kind = kind
+        self.width, self.height = size
+        self.rng = np.random.default_rng(seed)
+        self.count = max(0, int(BASE_COUNTS[kind] * density))
+        self.density = density
+        self.pos = np.empty((self.count, 2), dtype=np.float32)
+        self.pos[:, 0] = self.rng.integers(0, self.width + 1, self.count)
+        self.pos[:, 1] = self.rng.integers(-self.height, 1, self.count)
+        self.size = np.zeros(self.count, dtype=np.float32)
+        self.vel = np.zeros((self.count, 2), dtype=np.float32)
+        if kind == "Rain":
+            self.vel[:] = (-3.0, 15.0)
+        else:
+            # flakes fall at their size and sway horizontally
+            self.size[:] = self.rng.integers(1, 4, self.count)
+            self.vel[:, 1] = self.size
+        offsets = np.array(FOOTPRINTS[kind], dtype=np.int32)
+        self.offset_x = offsets[:, 0]
+        self.offset_y = offsets[:, 1]
+        self.sprite = self._sprite()
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    def _sprite(self) -> pygame.Surface:
+        w = int(self.offset_x.max() - self.offset_x.min()) + 1
+        h = int(self.offset_y.max() - self.offset_y.min()) + 1
+        sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+        color = RAIN_COLOR if self.kind == "Rain" else SNOW_COLOR
+        min_x = int(self.offset_x.min())
+        min_y = int(self.offset_y.min())
+        for x, y in zip(self.offset_x.tolist(), self.offset_y.tolist()):
+            sprite.set_at((x - min_x, y - min_y), color)
+        return sprite
+
+    def step(self) -> None:
+        """Advance every particle and respawn those below the screen."""
+        if self.kind == "Snow":
+            self.pos[:, 0] += np.sin(self.pos[:, 1] * 0.05) * self.size
+        else:
+            self.pos[:, 0] += self.vel[:, 0]
+        self.pos[:, 1] += self.vel[:, 1]
+        fallen = self.pos[:, 1] > self.height
+        n = int(fallen.sum())
+        if n:
+            self.pos[fallen, 0] = self.rng.integers(0, self.width + 1, n)
+            self.pos[fallen, 1] = self.rng.integers(-40, 1, n)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Render all particles onto ``surface``."""
+        color = RAIN_COLOR if self.kind == "Rain" else SNOW_COLOR
+        try:
+            pixels = pygame.surfarray.pixels2d(surface)
+        except (ValueError, pygame.error):
+            self._draw_blits(surface)
+            return
+        try:
+            xs = (self.pos[:, 0].astype(np.int32)[:, None] + self.offset_x).ravel()
+            ys = (self.pos[:, 1].astype(np.int32)[:, None] + self.offset_y).ravel()
+            w, h = pixels.shape
+            inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+            pixels[xs[inside], ys[inside]] = surface.map_rgb(color)
+        finally:
+            del pixels
+
+    def _draw_blits(self, surface: pygame.Surface) -> None:
+        ox = int(self.offset_x.min())
+        oy = int(self.offset_y.min())
+        sprite = self.sprite
+        surface.blits(
+            [(sprite, (int(x) + ox, int(y) + oy)) for x, y in self.pos.tolist()],
+            doreturn=False,
+        )
+
+
+class WeatherParticles:
+    """Keep the particle field for the current weather and window size."""
+
+    def __init__(self) -> None:
+        self.field: Optional[ParticleField] = None
+        self.key: Optional[Tuple] = None
+
+    def update(self, weather: str, size: Tuple[int, int], density: float = 1.0):
+        """Return the field for ``weather``, rebuilding it when inputs change."""
+        if weather not in BASE_COUNTS:
+            self.field = None
+            self.key = None
+            return None
+        key = (weather, size, density)
+        if key != self.key:
+            # seeded from the global RNG so seeded sessions replay identically
+            self.field = ParticleField(
+                weather, size, density, seed=random.getrandbits(32)
+            )
+            self.key = key
+        return self.field
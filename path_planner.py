@@ -0,0 +1,184 @@
+"""Frame-budgeted NPC path planning.
+
+NPC route requests are queued instead of searched on the spot, so a burst of
+shift changes does not run every search in the same frame. Each frame
+:meth:`PathPlanner.process` plans queued requests until its time budget is
+spent, or, with ``threaded=True``, collects paths a background worker
+finished. Until its path arrives an NPC holds its position, or walks straight
+at its destination when ``fallback="straight"``.
+
+The searches run in pure Python and hold the GIL, so the worker thread adds
+no throughput. It only spreads a burst of searches across frames at the
+interpreter's thread switch interval instead of the planner's budget. The
+nav grid, route table and flow field cache behind ``plan`` keep shared
+scratch state and are not thread-safe. Every search the planner runs holds
+:attr:`PathPlanner.lock`, and any other code that queries or changes them
+while the worker is running must hold it too.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import settings
+from pathfinding import Coord, find_path
+
+# Number of recent request latencies kept for stats()
+LATENCY_SAMPLES = 256
+
+
+def plan_path(
+    start: Coord, building, dest: Coord, tile_map, routes=None, flow_fields=None
+) -> List[Coord]:
+    """Pixel path from ``start`` to ``building`` using the fastest source.
+
+    Shared flow fields win over precomputed routes, and a fresh search to
+    ``dest`` is the last resort.
+    """
+    if flow_fields is not None:
+        return flow_fields.path(start, building)
+    if routes is not None:
+        return routes.path(start, building)
+    return find_path(tile_map, start, dest)
+
+
+@dataclass
+class PathRequest:
+    npc: object
+    building: object
+    start: Coord
+    dest: Coord
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+class PathPlanner:
+    """Queue of path requests served within a per-frame time budget."""
+
+    def __init__(
+        self,
+        plan: Callable[[Coord, object, Coord], List[Coord]],
+        budget_ms: float = settings.PATH_BUDGET_MS,
+        threaded: bool = settings.PATH_WORKER_THREAD,
+        fallback: str = "hold",
+    ) -> None:
+        self.plan = plan
+        self.budget = budget_ms / 1000.0
+        self.threaded = threaded
+        self.fallback = fallback
+        # a fixed number of searches per frame instead of the time budget,
+        # so recorded sessions replay identically
+        self.request_limit: Optional[int] = None
+        self.queue: Deque[PathRequest] = deque()
+        # id(npc) -> its latest request; older queued ones are skipped
+        self.pending: Dict[int, PathRequest] = {}
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.completed = 0
+        self.superseded = 0
+        self.frame_seconds = 0.0
+        self._jobs: "queue.Queue[Optional[PathRequest]]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[PathRequest, List[Coord]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        # held around every call to ``plan``, on either thread
+        self.lock = threading.Lock()
+
+    @property
+    def depth(self) -> int:
+        """Requests still waiting for a path."""
+        return len(self.pending)
+
+    def request(self, npc, building, dest: Coord) -> None:
+        """Ask for a path from ``npc``'s position to ``building``."""
+        req = PathRequest(npc, building, npc.rect.topleft, dest)
+        if id(npc) in self.pending:
+            self.superseded += 1
+        self.pending[id(npc)] = req
+        npc.path = [dest] if self.fallback == "straight" else []
+        if self.threaded:
+            self._start_worker()
+            self._jobs.put(req)
+        else:
+            self.queue.append(req)
+
+    def _current(self, req: PathRequest) -> bool:
+        return self.pending.get(id(req.npc)) is req
+
+    def _deliver(self, req: PathRequest, path: List[Coord]) -> None:
+        if not self._current(req):
+            return
+        del self.pending[id(req.npc)]
+        req.npc.path = path
+        self.latencies.append(time.perf_counter() - req.queued_at)
+        self.completed += 1
+
+    def process(self) -> None:
+        """Hand out finished paths, planning on this thread up to the budget."""
+        start = time.perf_counter()
+        if self.threaded:
+            while True:
+                try:
+                    req, path = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                self._deliver(req, path)
+        else:
+            deadline = start + self.budget
+            planned = 0
+            # at least one search per frame so the queue always drains
+            while self.queue:
+                req = self.queue.popleft()
+                if not self._current(req):
+                    continue
+                with self.lock:
+                    path = self.plan(req.start, req.building, req.dest)
+                self._deliver(req, path)
+                planned += 1
+                if self.request_limit is not None:
+                    if planned >= self.request_limit:
+                        break
+                elif time.perf_counter() >= deadline:
+                    break
+        self.frame_seconds = time.perf_counter() - start
+
+    # ------------------------------------------------------------------
+    # Worker thread
+    # ------------------------------------------------------------------
+    def _start_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._work, daemon=True)
+            self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            req = self._jobs.get()
+            if req is None:
+                return
+            if self._current(req):
+                with self.lock:
+                    path = self.plan(req.start, req.building, req.dest)
+                self._results.put((req, path))
+
+    def close(self) -> None:
+        """Stop the worker thread, if one was started."""
+        if self._worker is not None:
+            self._jobs.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def stats(self) -> Dict[str, float]:
+        """Queue depth, request latency and planning time of the last frame."""
+        latencies = sorted(self.latencies)
+        return {
+            "depth": self.depth,
+            "completed": self.completed,
+            "superseded": self.superseded,
+            "latency_ms_mean": (
+                sum(latencies) / len(latencies) * 1000.0 if latencies else 0.0
+            ),
+            "latency_ms_max": latencies[-1] * 1000.0 if latencies else 0.0,
+            "frame_ms": self.frame_seconds * 1000.0,
+        }
@@ -1,36 +1,281 @@
-"""Simple A* pathfinding over TileMap tiles."""
+"""A* pathfinding over an obstacle-aware tile grid."""
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple
 import heapq
 
+import pygame
+
 from tilemap import TileMap
 
 
 Coord = Tuple[int, int]
 
+# Water and garden planter tiles in ``city_tileset.tsx``
+BLOCKED_GIDS = frozenset({7, 8})
+# Building types the player and NPCs can walk across
+WALKABLE_BUILDINGS = frozenset({"park", "dealer", "bus_stop", "beach", "forest"})
+
+
+class NavGrid:
+    """Walkability grid stored as a flat ``bytearray``.
+
+    The grid is padded with a one tile blocked border so the four neighbor
+    offsets ``(-1, 1, -stride, stride)`` never leave the array and need no
+    bounds checks. Node ids are flat indices into the padded grid. Blocked
+    buildings get an entrance corridor carved from their bottom edge to the
+    tile NPCs aim for, so routes into a building use its door.
+    """
+
+    def __init__(self, width: int, height: int, tilewidth: int, tileheight: int):
+        self.width = width
+        self.height = height
+        self.tilewidth = tilewidth
+        self.tileheight = tileheight
+        self.stride = width + 2
+        self.size = self.stride * (height + 2)
+        self.walkable = bytearray(self.size)
+        for y in range(height):
+            start = (y + 1) * self.stride + 1
+            self.walkable[start : start + width] = b"\x01" * width
+        # Ground walkability before buildings are placed on it
+        self.terrain = bytearray(self.walkable)
+        self.offsets = (-1, 1, -self.stride, self.stride)
+        self.entrances: Dict[int, int] = {}  # id(building) -> node
+        # Bumped whenever walkability changes so derived caches can expire
+        self.version = 0
+        # Scratch arrays reused by every search; ``_stamp`` marks which
+        # entries belong to the current search so they never need clearing
+        self._g = [0] * self.size
+        self._came = [0] * self.size
+        self._stamp = [0] * self.size
+        self._closed = [0] * self.size
+        self._search = 0
+
+    @classmethod
+    def from_tilemap(
+        cls,
+        tile_map,
+        buildings: Iterable = (),
+        blocked_gids: Iterable[int] = BLOCKED_GIDS,
+    ) -> "NavGrid":
+        """Build a grid from ``tile_map`` layers and building rects."""
+        grid = cls(
+            tile_map.width, tile_map.height, tile_map.tilewidth, tile_map.tileheight
+        )
+        blocked = frozenset(blocked_gids)
+        for layer in getattr(tile_map, "layers", []):
+            for i, gid in enumerate(layer):
+                if gid in blocked:
+                    y, x = divmod(i, tile_map.width)
+                    grid.walkable[grid.node(x, y)] = 0
+        grid.terrain[:] = grid.walkable
+        buildings = list(buildings)
+        for b in buildings:
+            if b.btype not in WALKABLE_BUILDINGS:
+                grid.block_rect(b.rect)
+        # Walkable buildings such as bus stops may sit inside blocked ones
+        for b in buildings:
+            grid.entrances[id(b)] = grid.carve_entrance(b.rect)
+        return grid
+
+    # ------------------------------------------------------------------
+    # Grid access
+    # ------------------------------------------------------------------
+    def node(self, x: int, y: int) -> int:
+        """Return the node id of tile ``(x, y)``."""
+        return (y + 1) * self.stride + x + 1
+
+    def tile(self, node: int) -> Coord:
+        """Return the tile coordinates of ``node``."""
+        y, x = divmod(node, self.stride)
+        return x - 1, y - 1
+
+    def node_at(self, pos: Coord) -> int:
+        """Return the node under pixel position ``pos``, clamped to the map."""
+        x = min(max(pos[0] // self.tilewidth, 0), self.width - 1)
+        y = min(max(pos[1] // self.tileheight, 0), self.height - 1)
+        return self.node(x, y)
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return bool(self.walkable[self.node(x, y)])
+
+    def set_walkable(self, x: int, y: int, walkable: bool) -> None:
+        self.walkable[self.node(x, y)] = 1 if walkable else 0
+        self.version += 1
+
+    def _tile_span(self, rect: pygame.Rect) -> Tuple[range, range]:
+        tw, th = self.tilewidth, self.tileheight
+        # tiles whose centers fall inside the half-open rect
+        xs = range(
+            max(0, -((tw // 2 - rect.left) // tw)),
+            min(self.width, -((tw // 2 - rect.right) // tw)),
+        )
+        ys = range(
+            max(0, -((th // 2 - rect.top) // th)),
+            min(self.height, -((th // 2 - rect.bottom) // th)),
+        )
+        return xs, ys
+
+    def block_rect(self, rect: pygame.Rect) -> None:
+        """Mark every tile whose center lies in ``rect`` as blocked."""
+        xs, ys = self._tile_span(rect)
+        for y in ys:
+            start = self.node(xs.start, y)
+            self.walkable[start : start + len(xs)] = bytes(len(xs))
+        self.version += 1
+
+    def entrance_tile(self, rect: pygame.Rect) -> Coord:
+        """Tile an NPC centered on ``rect`` stands on."""
+        x = (rect.centerx - self.tilewidth // 2) // self.tilewidth
+        y = (rect.centery - self.tileheight // 2) // self.tileheight
+        return (
+            min(max(x, 0), self.width - 1),
+            min(max(y, 0), self.height - 1),
+        )
+
+    def carve_entrance(self, rect: pygame.Rect) -> int:
+        """Open the shortest straight corridor from the center of ``rect``.
+
+        The corridor runs through building tiles until it reaches walkable
+        ground, trying down, up, left and right and never crossing blocked
+        terrain outside the rect. Returns the node id of the tile at the center
+        of the rect.
+        """
+        x, y = self.entrance_tile(rect)
+        xs, ys = self._tile_span(rect)
+        best: List[int] = []
+        for dx, dy in ((0, 1), (0, -1), (-1, 0), (1, 0)):
+            corridor = []
+            tx, ty = x, y
+            while 0 <= tx < self.width and 0 <= ty < self.height:
+                n = self.node(tx, ty)
+                if not self.terrain[n] and not (tx in xs and ty in ys):
+                    break
+                if self.walkable[n] and corridor:
+                    if not best or len(corridor) < len(best):
+                        best = corridor
+                    break
+                corridor.append(n)
+                tx += dx
+                ty += dy
+        for n in best or [self.node(x, y)]:
+            self.walkable[n] = 1
+        self.version += 1
+        return self.node(x, y)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def search(self, start: int, goal: int) -> List[int]:
+        """Return node ids from ``start`` to ``goal`` excluding ``start``.
+
+        The start node may be blocked so NPCs standing inside a building can
+        still leave it. Returns an empty list when ``goal`` is unreachable.
+        """
+        if start == goal:
+            return []
+        walkable = self.walkable
+        if not walkable[goal]:
+            return []
+        self._search += 1
+        search = self._search
+        g = self._g
+        came = self._came
+        stamp = self._stamp
+        closed = self._closed
+        offsets = self.offsets
+        stride = self.stride
+        gy, gx = divmod(goal, stride)
+
+        stamp[start] = search
+        g[start] = 0
+        sy, sx = divmod(start, stride)
+        open_set = [(abs(sx - gx) + abs(sy - gy), start)]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        while open_set:
+            _, current = heappop(open_set)
+            if current == goal:
+                return self._reconstruct(start, goal)
+            if closed[current] == search:
+                continue
+            closed[current] = search
+            tentative = g[current] + 1
+            for offset in offsets:
+                n = current + offset
+                if not walkable[n] or closed[n] == search:
+                    continue
+                if stamp[n] != search or tentative < g[n]:
+                    stamp[n] = search
+                    g[n] = tentative
+                    came[n] = current
+                    ny, nx = divmod(n, stride)
+                    heappush(open_set, (tentative + abs(nx - gx) + abs(ny - gy), n))
+        return []
+
+    def flood(self, source: int) -> List[int]:
+        """Breadth-first search from ``source`` over the whole grid.
+
+        Returns a parent array indexed by node id: following parents from any
+        reached node walks a shortest path back to ``source``. Unreached
+        nodes hold ``-1`` and ``source`` holds itself.
+        """
+        walkable = self.walkable
+        offsets = self.offsets
+        parent = [-1] * self.size
+        parent[source] = source
+        frontier = [source]
+        while frontier:
+            next_frontier = []
+            append = next_frontier.append
+            for current in frontier:
+                for offset in offsets:
+                    n = current + offset
+                    if walkable[n] and parent[n] < 0:
+                        parent[n] = current
+                        append(n)
+            frontier = next_frontier
+        return parent
+
+    def _reconstruct(self, start: int, goal: int) -> List[int]:
+        came = self._came
+        path = [goal]
+        current = goal
+        while True:
+            current = came[current]
+            if current == start:
+                break
+            path.append(current)
+        path.reverse()
+        return path
 
-def _heuristic(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    def to_pixels(self, nodes: Iterable[int]) -> List[Coord]:
+        """Convert node ids to pixel coordinates of tile corners."""
+        stride = self.stride
+        tw = self.tilewidth
+        th = self.tileheight
+        result = []
+        for n in nodes:
+            y, x = divmod(n, stride)
+            result.append(((x - 1) * tw, (y - 1) * th))
+        return result
 
 
-def _neighbors(tm: TileMap, node: Coord) -> List[Coord]:
-    x, y = node
-    res: List[Coord] = []
-    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < tm.width and 0 <= ny < tm.height:
-            res.append((nx, ny))
-    return res
+# Open grids for plain tile maps passed to ``find_path``
+_OPEN_GRIDS: Dict[Tuple[int, int, int, int], NavGrid] = {}
 
 
-def _reconstruct(came_from: dict, current: Coord) -> List[Coord]:
-    path = [current]
-    while current in came_from:
-        current = came_from[current]
-        path.append(current)
-    path.reverse()
-    return path
+def _grid_for(tile_map) -> NavGrid:
+    if isinstance(tile_map, NavGrid):
+        return tile_map
+    key = (tile_map.width, tile_map.height, tile_map.tilewidth, tile_map.tileheight)
+    grid = _OPEN_GRIDS.get(key)
+    if grid is None:
+        grid = _OPEN_GRIDS[key] = NavGrid(*key)
+    return grid
 
 
 def find_path(tile_map: TileMap, start: Coord, goal: Coord) -> List[Coord]:
@@ -38,8 +283,9 @@ def find_path(tile_map: TileMap, start: Coord, goal: Coord) -> List[Coord]:
 
     Parameters
     ----------
-    tile_map: TileMap
-        Map defining the grid dimensions.
+    tile_map: TileMap or NavGrid
+        Map defining the grid. Plain tile maps are treated as fully walkable;
+        pass a :class:`NavGrid` to route around obstacles.
     start, goal: Tuple[int, int]
         Pixel coordinates for start and goal.
 
@@ -48,34 +294,6 @@ def find_path(tile_map: TileMap, start: Coord, goal: Coord) -> List[Coord]:
     List of pixel coordinate steps (excluding the starting position).
     """
 
-    # Convert pixel coordinates to tile coordinates
-    start_tile = (start[0] // tile_map.tilewidth, start[1] // tile_map.tileheight)
-    goal_tile = (goal[0] // tile_map.tilewidth, goal[1] // tile_map.tileheight)
-
-    open_set: List[Tuple[int, Coord]] = []
-    heapq.heappush(open_set, (0, start_tile))
-    came_from: dict = {}
-    g_score = {start_tile: 0}
-    f_score = {start_tile: _heuristic(start_tile, goal_tile)}
-
-    visited = set()
-    while open_set:
-        _, current = heapq.heappop(open_set)
-        if current == goal_tile:
-            tiles = _reconstruct(came_from, current)
-            if tiles and tiles[0] == start_tile:
-                tiles = tiles[1:]
-            return [
-                (x * tile_map.tilewidth, y * tile_map.tileheight) for x, y in tiles
-            ]
-        if current in visited:
-            continue
-        visited.add(current)
-        for neighbor in _neighbors(tile_map, current):
-            tentative_g = g_score[current] + 1
-            if tentative_g < g_score.get(neighbor, float("inf")):
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                f_score[neighbor] = tentative_g + _heuristic(neighbor, goal_tile)
-                heapq.heappush(open_set, (f_score[neighbor], neighbor))
-    return []
+    grid = _grid_for(tile_map)
+    nodes = grid.search(grid.node_at(start), grid.node_at(goal))
+    return grid.to_pixels(nodes)
@@ -0,0 +1,125 @@
+"""Per-subsystem timing hooks with percentile summaries.
+
+Functions decorated with :func:`profiled` record their run time in
+nanoseconds into a fixed-size ring buffer per subsystem on the shared
+:data:`PROFILER`. While profiling is disabled the hook is a single flag test
+before the real call, so the decorators stay in place in normal play.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import time
+from array import array
+from typing import Callable, Dict, List, Optional
+
+import settings
+
+PERCENTILES = (50, 95, 99)
+
+
+class RingBuffer:
+    """Fixed number of the most recent integer samples."""
+
+    def __init__(self, capacity: int) -> None:
+        self.samples = array("q", bytes(8 * capacity))
+        self.capacity = capacity
+        self.index = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value: int) -> None:
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def values(self) -> List[int]:
+        """Samples from oldest to newest."""
+        if self.count < self.capacity:
+            return self.samples[: self.count].tolist()
+        return (self.samples[self.index :] + self.samples[: self.index]).tolist()
+
+
+def percentile(sorted_values: List[int], pct: float) -> int:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0
+    rank = max(0, -(-len(sorted_values) * pct // 100) - 1)
+    return sorted_values[int(rank)]
+
+
+class Profiler:
+    """Collect timings per named subsystem."""
+
+    def __init__(
+        self,
+        capacity: int = settings.PROFILE_SAMPLES,
+        enabled: bool = settings.PROFILER_ENABLED,
+    ) -> None:
+        self.capacity = capacity
+        self.enabled = enabled
+        self.overlay = False
+        self.sections: Dict[str, RingBuffer] = {}
+
+    def toggle_overlay(self) -> None:
+        """Show or hide the overlay, collecting timings while it is shown."""
+        self.overlay = not self.overlay
+        self.enabled = self.overlay or settings.PROFILER_ENABLED
+
+    def record(self, name: str, ns: int) -> None:
+        buffer = self.sections.get(name)
+        if buffer is None:
+            buffer = self.sections[name] = RingBuffer(self.capacity)
+        buffer.append(ns)
+
+    def clear(self) -> None:
+        self.sections.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """p50/p95/p99 and max in milliseconds plus sample count per section."""
+        result = {}
+        for name, buffer in self.sections.items():
+            values = sorted(buffer.values())
+            row = {f"p{p}_ms": percentile(values, p) / 1e6 for p in PERCENTILES}
+            row["max_ms"] = (values[-1] if values else 0) / 1e6
+            row["samples"] = len(values)
+            result[name] = row
+        return result
+
+    def export_csv(self, path: str = settings.PROFILE_CSV_FILE) -> None:
+        """Write one row per section with its percentiles."""
+        summary = self.summary()
+        fields = ["section"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms", "samples"]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for name in sorted(summary):
+                writer.writerow({"section": name, **summary[name]})
+
+
+PROFILER = Profiler()
+
+
+def profiled(name: str, profiler: Optional[Profiler] = None) -> Callable:
+    """Decorator timing each call of the function as section ``name``."""
+    prof = profiler or PROFILER
+    clock = time.perf_counter_ns
+
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not prof.enabled:
+                return func(*args, **kwargs)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                prof.record(name, clock() - start)
+
+        return wrapper
+
+    return decorate
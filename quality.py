@@ -0,0 +1,95 @@
+"""Adaptive visual quality tiers.
+
+The :data:`QUALITY` governor is fed the time each frame took to simulate and
+draw. When the rolling average goes over budget it steps down to the next
+cheaper tier of :data:`settings.QUALITY_TIERS`, and when there is plenty of
+headroom it steps back up. Draw functions in :mod:`rendering` read
+``QUALITY.tier`` to decide which effects to draw. After every change the
+window refills before the next decision, so one slow frame or the cost of
+rebuilding caches for the new tier cannot make it oscillate.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import settings
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    name: str
+    window_layers: int
+    particle_density: float
+    clouds: bool
+    shadows: bool
+    gradients: bool
+
+
+def load_tiers(tiers: Optional[Sequence[Dict]] = None) -> List[QualityTier]:
+    """Build tiers from settings-style dictionaries."""
+    tiers = settings.QUALITY_TIERS if tiers is None else tiers
+    if not tiers:
+        raise ValueError("at least one quality tier is required")
+    return [QualityTier(**tier) for tier in tiers]
+
+
+class QualityGovernor:
+    """Pick a quality tier from a rolling average of frame times."""
+
+    def __init__(
+        self,
+        tiers: Optional[Sequence[Dict]] = None,
+        level: int = settings.QUALITY_TIER,
+        budget_ms: float = settings.QUALITY_BUDGET_MS,
+        raise_ratio: float = settings.QUALITY_RAISE_RATIO,
+        window: int = settings.QUALITY_WINDOW,
+        auto: bool = settings.QUALITY_AUTO,
+    ) -> None:
+        self.tiers = load_tiers(tiers)
+        self.budget_ms = budget_ms
+        self.raise_ratio = raise_ratio
+        self.window = window
+        self.auto = auto
+        self.samples: deque = deque(maxlen=window)
+        self.changes = 0
+        self.set_level(level)
+
+    @property
+    def average_ms(self) -> float:
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def level_of(self, name: str) -> int:
+        """Index of the tier called ``name``."""
+        for level, tier in enumerate(self.tiers):
+            if tier.name == name:
+                return level
+        raise ValueError(f"unknown quality tier {name!r}")
+
+    def set_level(self, level: int) -> None:
+        """Switch to tier ``level`` (0 is the best) and restart the window."""
+        self.level = max(0, min(len(self.tiers) - 1, level))
+        self.tier = self.tiers[self.level]
+        self.samples.clear()
+
+    def record(self, frame_ms: float) -> bool:
+        """Add one frame time; return True if the tier changed."""
+        if not self.auto:
+            return False
+        self.samples.append(frame_ms)
+        if len(self.samples) < self.window:
+            return False
+        average = self.average_ms
+        if average > self.budget_ms and self.level < len(self.tiers) - 1:
+            self.set_level(self.level + 1)
+        elif average < self.budget_ms * self.raise_ratio and self.level > 0:
+            self.set_level(self.level - 1)
+        else:
+            return False
+        self.changes += 1
+        return True
+
+
+QUALITY = QualityGovernor()
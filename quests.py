@@ -404,13 +404,6 @@ def random_event(player: Player, location: str | None = None) -> str | None:
     return None
 
 
-def _in_schedule(hour: int, start: int, end: int) -> bool:
-    """Return True if the hour falls within the time window."""
-    if start <= end:
-        return start <= hour < end
-    return hour >= start or hour < end
-
-
 def check_companion_quest(player: Player) -> None:
     """Assign a companion quest when morale is high enough."""
     if (
@@ -433,35 +426,14 @@ def check_faction_quest(player: Player) -> None:
             break
 
 
-def update_npcs(player: Player, buildings: List[Building]) -> None:
-    """Move NPCs toward their scheduled locations."""
+def update_npcs(player: Player, simulation) -> None:
+    """Check NPC-driven quests and advance ``simulation`` one tick.
+
+    ``simulation`` is the game's shared :class:`~npc_sim.NPCSimulation`.
+    """
     check_companion_quest(player)
     check_faction_quest(player)
-    hour = int(player.time) // 60
-    for npc in NPCS:
-        target = npc.home
-        if npc.work and _in_schedule(hour, npc.work_start, npc.work_end):
-            target = npc.work
-        building = next((b for b in buildings if b.btype == target), None)
-        if not building:
-            continue
-        dest_x = building.rect.centerx - npc.rect.width // 2
-        dest_y = building.rect.centery - npc.rect.height // 2
-
-        dx = 0
-        dy = 0
-        if npc.rect.x < dest_x:
-            dx = min(4, dest_x - npc.rect.x)
-        elif npc.rect.x > dest_x:
-            dx = -min(4, npc.rect.x - dest_x)
-        if npc.rect.y < dest_y:
-            dy = min(4, dest_y - npc.rect.y)
-        elif npc.rect.y > dest_y:
-            dy = -min(4, npc.rect.y - dest_y)
-
-        rect = npc.rect.move(dx, dy)
-        if 0 <= rect.x <= 1600 - 40 and 0 <= rect.y <= 1200 - 40:
-            npc.rect = rect
+    simulation.tick(player)
 
 
 def choose_story_branch(player: Player, branch: str) -> None:
@@ -32,23 +32,28 @@ from settings import (
     TRUNK_COLOR,
     FLOWER_COLORS,
     SHADOW_COLOR,
+    STREET_LAMP_POST_COLOR,
+    STREET_LAMP_HEAD_COLOR,
 )
+from loaders import load_street_lamps
 from tilemap import TileMap
-from careers import get_job_title, job_progress
-from inventory import crafting_exp_needed, CROPS
+from inventory import CROPS
 from constants import PERK_MAX_LEVEL
-from helpers import scaled_font, WEEKDAY_NAMES
+from helpers import scaled_font
+from fonts import render_text
+from hud import HUD
+from particles import ParticleField, WeatherParticles
+from profiler import PROFILER, profiled
+from quality import QUALITY
 from quests import SIDE_QUESTS, COMPANION_QUESTS
-import factions
 
 PLAYER_SPRITES = []
 PLAYER_SPRITE_COLOR = None
 FOREST_ENEMY_IMAGES = []
-STARS = []
-CLOUDS = []
 RAINDROPS = []
 SNOWFLAKES = []
 CITY_MAP = None
+STREET_LAMPS = None
 DUNGEON_TRAP_IMAGE = None
 DUNGEON_PUZZLE_IMAGE = None
 
@@ -81,6 +86,7 @@ def load_player_sprites(color=None):
     return PLAYER_SPRITES
 
 
+@profiled("draw_player_sprite")
 def draw_player_sprite(
     surface,
     rect,
@@ -165,22 +171,26 @@ def draw_player(
         pygame.draw.rect(surface, hat_color, (x - 8, y - 46, 16, 10))
 
 
+@profiled("draw_npc")
 def draw_npc(surface, npc, font, offset=(0, 0)):
     """Draw an NPC using its current position and optional speech bubble."""
-    rect = npc.rect.move(offset)
-    pygame.draw.rect(surface, (60, 120, 220), rect)
+    x, y, width, height = npc.bounds
+    x += offset[0]
+    y += offset[1]
+    pygame.draw.rect(surface, (60, 120, 220), (x, y, width, height))
     if npc.bubble_timer > 0 and npc.bubble_message:
-        msg_surf = font.render(npc.bubble_message, True, (30, 30, 30))
+        msg_surf = render_text(font, npc.bubble_message, True, (30, 30, 30))
         bg = pygame.Surface(
             (msg_surf.get_width() + 10, msg_surf.get_height() + 6), pygame.SRCALPHA
         )
         bg.fill((255, 255, 255, 230))
-        bx = rect.centerx - bg.get_width() // 2
-        by = rect.top - bg.get_height() - 8
+        bx = x + width // 2 - bg.get_width() // 2
+        by = y - bg.get_height() - 8
         surface.blit(bg, (bx, by))
         surface.blit(msg_surf, (bx + 5, by + 3))
 
 
+@profiled("draw_quest_marker")
 def draw_quest_marker(surface, player_rect, target_rect, cam_x, cam_y):
     """Draw an arrow above the player pointing toward the target."""
     px = player_rect.centerx - cam_x
@@ -225,7 +235,7 @@ def load_dungeon_assets():
         DUNGEON_PUZZLE_IMAGE = pygame.Surface((20, 20), pygame.SRCALPHA)
         pygame.draw.rect(DUNGEON_PUZZLE_IMAGE, (0, 100, 200), (0, 0, 20, 20))
         font = scaled_font(14)
-        q = font.render("?", True, (255, 255, 255))
+        q = render_text(font, "?", True, (255, 255, 255))
         DUNGEON_PUZZLE_IMAGE.blit(q, (5, 2))
 
 
@@ -246,7 +256,7 @@ def draw_dungeon_room(surface, room, position, font=None):
         surface.blit(img, (x - img.get_width() // 2, y - img.get_height() // 2))
 
     if room.enemies:
-        txt = font.render(str(len(room.enemies)), True, (255, 0, 0))
+        txt = render_text(font, str(len(room.enemies)), True, (255, 0, 0))
         surface.blit(txt, (x - txt.get_width() // 2, y - txt.get_height() // 2))
 
     for i, _ in enumerate(room.exits):
@@ -289,23 +299,119 @@ def building_color(btype):
     return BUILDING_COLOR
 
 
+# Window-light animation: frames sampled over one loop of the scroll motion
+WINDOW_ANIM_PERIOD = 565  # frames, ~2*pi*90
+WINDOW_ANIM_FRAMES = 48
+# Night overlay alpha steps used to bucket window-light visibility
+WINDOW_NIGHT_STEP = 20
+
+
+class WindowLightCache:
+    """Pre-bake tinted window-light layers and their animation offsets.
+
+    Tinted layers are cached per (layers, window size, hour, night step) and
+    the scroll/drift offsets for every animation frame are tabulated once per
+    layer count, so drawing a window only picks entries and blits them.
+    """
+
+    def __init__(self):
+        self.layers = {}
+        self.offsets = {}
+
+    def clear(self):
+        self.layers.clear()
+        self.offsets.clear()
+
+    def baked_layers(self, window_layers, size, hour, night_step):
+        """Return ``[(surface, (x, y)), ...]`` centred within ``size``."""
+        key = (tuple(id(layer) for layer in window_layers), size, hour, night_step)
+        entry = self.layers.get(key)
+        if entry is None or entry[0] != window_layers:
+            baked = self._bake(window_layers, size, hour, night_step)
+            entry = (list(window_layers), baked)
+            self.layers[key] = entry
+        return entry[1]
+
+    def frame_offsets(self, layer_count, frame):
+        """Return per-layer ``(scroll, drift)`` offsets for ``frame``."""
+        table = self.offsets.get(layer_count)
+        if table is None:
+            table = self._tabulate(layer_count)
+            self.offsets[layer_count] = table
+        index = (frame % WINDOW_ANIM_PERIOD) * WINDOW_ANIM_FRAMES // WINDOW_ANIM_PERIOD
+        return table[index]
+
+    @staticmethod
+    def _tabulate(layer_count):
+        table = []
+        for k in range(WINDOW_ANIM_FRAMES):
+            frame = k * WINDOW_ANIM_PERIOD / WINDOW_ANIM_FRAMES
+            row = []
+            for idx in range(layer_count):
+                depth = idx / max(1, layer_count - 1)
+                scroll = math.sin((frame / 90.0) + depth * 2.7) * (1.5 + depth)
+                drift = math.cos((frame / 140.0) + idx) * 0.8
+                row.append((int(scroll), int(drift)))
+            table.append(row)
+        return table
+
+    @staticmethod
+    def _bake(window_layers, size, hour, night_step):
+        # sample the lighting at the middle of the hour bucket
+        day_phase = (hour * 60 + 30) / 1440.0
+        # 1.0 at midday, 0.0 at midnight
+        day_cycle = (math.cos(day_phase * math.tau) + 1) / 2
+        warm = (255, 200, 140)
+        cool = (180, 220, 255)
+        base_color = tuple(
+            int(cool[i] * day_cycle + warm[i] * (1 - day_cycle)) for i in range(3)
+        )
+        night_factor = min(1.0, night_step * WINDOW_NIGHT_STEP / 120.0)
+        night_visibility = (1 - day_cycle) * 0.7 + night_factor * 0.6 + 0.15
+        night_visibility = max(0.1, min(1.0, night_visibility))
+
+        baked = []
+        layer_count = len(window_layers)
+        for idx, layer in enumerate(window_layers):
+            if layer.get_width() == 0 or layer.get_height() == 0:
+                continue
+            depth = idx / max(1, layer_count - 1)
+            scale = 0.86 + 0.18 * depth
+            target_w = max(1, int(size[0] * scale))
+            target_h = max(1, int(size[1] * scale))
+            tinted = pygame.transform.smoothscale(layer, (target_w, target_h))
+            shade = 0.7 + 0.25 * depth
+            tint_color = tuple(min(255, int(base_color[i] * shade)) for i in range(3))
+            tinted.fill((*tint_color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+            alpha = int((60 + depth * 55) * night_visibility)
+            tinted.set_alpha(max(0, min(255, alpha)))
+            offset = ((size[0] - target_w) // 2, (size[1] - target_h) // 2)
+            baked.append((idx, depth, tinted, offset))
+        return baked
+
+
+WINDOW_LIGHTS = WindowLightCache()
+
+
 def _draw_window_layers(surface, building, window_rect, player, cam_x, frame, night_alpha):
-    """Composite cached window layers with tinting and subtle motion."""
+    """Blit cached window-light layers with parallax and subtle motion.
+
+    Only as many layers as the current quality tier allows are drawn.
+    """
 
-    if not building.window_layers:
+    layers = building.window_layers[: QUALITY.tier.window_layers]
+    if not layers:
         return
 
     minutes = getattr(player, "time", 12 * 60) % 1440
-    day_phase = minutes / 1440.0
-    # 1.0 at midday, 0.0 at midnight
-    day_cycle = (math.cos(day_phase * math.tau) + 1) / 2
-    warm = (255, 200, 140)
-    cool = (180, 220, 255)
-    base_color = tuple(
-        int(cool[i] * day_cycle + warm[i] * (1 - day_cycle)) for i in range(3)
+    baked = WINDOW_LIGHTS.baked_layers(
+        layers,
+        window_rect.size,
+        int(minutes) // 60,
+        int(night_alpha or 0) // WINDOW_NIGHT_STEP,
     )
+    offsets = WINDOW_LIGHTS.frame_offsets(len(layers), frame)
 
-    night_factor = min(1.0, night_alpha / 120.0) if night_alpha else 0.0
     player_rect = getattr(player, "rect", None)
     building_screen_x = building.rect.centerx - cam_x
     if player_rect:
@@ -314,36 +420,168 @@ def _draw_window_layers(surface, building, window_rect, player, cam_x, frame, ni
         player_screen_x = building_screen_x
     relative_x = (player_screen_x - building_screen_x) / 80.0
 
-    layer_count = len(building.window_layers)
-    for idx, layer in enumerate(building.window_layers):
-        if layer.get_width() == 0 or layer.get_height() == 0:
-            continue
-        depth = idx / max(1, layer_count - 1)
-        scale = 0.86 + 0.18 * depth
-        target_w = max(1, int(window_rect.width * scale))
-        target_h = max(1, int(window_rect.height * scale))
-        scaled = pygame.transform.smoothscale(layer, (target_w, target_h))
-        tinted = scaled.copy()
-        shade = 0.7 + 0.25 * depth
-        tint_color = tuple(min(255, int(base_color[i] * shade)) for i in range(3))
-        tinted.fill((*tint_color, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    clip = surface.get_clip()
+    surface.set_clip(window_rect.clip(clip))
+    for idx, depth, tinted, (x_offset, y_offset) in baked:
+        scroll, drift = offsets[idx]
+        parallax = int(relative_x * (1 - depth) * 5)
+        surface.blit(
+            tinted,
+            (
+                window_rect.x + x_offset + parallax + scroll,
+                window_rect.y + y_offset + drift,
+            ),
+        )
+    surface.set_clip(clip)
 
-        night_visibility = (1 - day_cycle) * 0.7 + night_factor * 0.6 + 0.15
-        night_visibility = max(0.1, min(1.0, night_visibility))
-        alpha = int((60 + depth * 55) * night_visibility)
-        tinted.set_alpha(max(0, min(255, alpha)))
 
-        parallax = int(relative_x * (1 - depth) * 5)
-        scroll = math.sin((frame / 90.0) + depth * 2.7) * (1.5 + depth)
-        drift = math.cos((frame / 140.0) + idx) * 0.8
-        x_offset = (window_rect.width - target_w) // 2 + parallax + int(scroll)
-        y_offset = (window_rect.height - target_h) // 2 + int(drift)
+def building_window_rects(rect):
+    """Return the window rects for a fallback-drawn building at ``rect``."""
+    return [
+        pygame.Rect(rect.x + 18 + i * 50, rect.y + 28, 22, 22)
+        for i in range(2, rect.width // 50)
+    ]
+
+
+def lit_window_rects(building):
+    """Return the world rects of the windows actually drawn for ``building``.
+
+    Sprites use the panes read from their SVG, scaled to the building rect;
+    fallback drawings use :func:`building_window_rects`.
+    """
+    rect = building.rect
+    if not building.image:
+        if building.btype == "park":
+            return []
+        return building_window_rects(rect)
+    return [
+        pygame.Rect(
+            rect.x + round(x * rect.width),
+            rect.y + round(y * rect.height),
+            round(w * rect.width),
+            round(h * rect.height),
+        )
+        for x, y, w, h in building.windows
+    ]
+
+
+class BuildingRenderCache:
+    """Pre-composite buildings into ready-to-blit surfaces.
+
+    Each entry holds the shadow, sprite or fallback drawing, highlight border
+    and name label for one building at a given size and highlight state;
+    animated window layers are drawn on top each frame. The whole cache is
+    dropped when the window size changes, because the label font scales with
+    it, and when the shadow or gradient settings change, so composites from
+    an old quality tier do not linger.
+    """
+
+    def __init__(self):
+        self.screen_size = None
+        self.quality = None
+        self.entries = {}
+
+    def clear(self):
+        self.entries.clear()
+
+    def get(self, building, highlight=False, shadows=True, gradients=True):
+        """Return ``(surface, (dx, dy))`` where ``dx, dy`` offset the blit."""
+        screen_size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        if screen_size != self.screen_size:
+            self.screen_size = screen_size
+            self.clear()
+        quality = (bool(shadows), bool(gradients))
+        if quality != self.quality:
+            self.quality = quality
+            self.clear()
+        key = (
+            id(building),
+            building.name,
+            id(building.image),
+            building.rect.size,
+            bool(highlight),
+        )
+        entry = self.entries.get(key)
+        if entry is None or entry[0] is not building:
+            entry = (
+                building,
+                *self._composite(building, highlight, shadows, gradients),
+            )
+            self.entries[key] = entry
+        return entry[1], entry[2]
+
+    @staticmethod
+    def _composite(building, highlight, shadows=True, gradients=True):
+        w, h = building.rect.size
+        font = scaled_font(28)
+        label = render_text(font, building.name, True, FONT_COLOR)
+        label_x = w // 2 - label.get_width() // 2
+        pad_left = max(0, 6 - label_x)
+        pad_top = 32
+        width = pad_left + max(w + 4, label_x + label.get_width() + 6)
+        surf = pygame.Surface((width, pad_top + h + 4), pygame.SRCALPHA)
+        b = pygame.Rect(pad_left, pad_top, w, h)
+
+        if shadows:
+            shadow = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(shadow, SHADOW_COLOR, shadow.get_rect(), border_radius=9)
+            surf.blit(shadow, (b.x + 4, b.y + 4))
+        if building.image:
+            sprite = pygame.transform.smoothscale(building.image, (w, h))
+            surf.blit(sprite, b.topleft)
+            if highlight:
+                pygame.draw.rect(surf, (255, 255, 0), b, 2, border_radius=9)
+        else:
+            color = building_color(building.btype)
+            if highlight:
+                color = tuple(min(255, c + 40) for c in color)
+            # base rectangle for the building
+            pygame.draw.rect(surf, color, b, border_radius=9)
+
+            if gradients:
+                # subtle vertical gradient to give the building more depth
+                grad = pygame.Surface((w, h), pygame.SRCALPHA)
+                for y in range(h):
+                    alpha = int(90 * (y / h))
+                    pygame.draw.line(grad, (0, 0, 0, alpha), (0, y), (w, y))
+                mask = pygame.Surface((w, h), pygame.SRCALPHA)
+                pygame.draw.rect(
+                    mask, (255, 255, 255), mask.get_rect(), border_radius=9
+                )
+                grad.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                surf.blit(grad, b.topleft)
+
+            if highlight:
+                pygame.draw.rect(surf, (255, 255, 0), b, 2, border_radius=9)
+            roof = pygame.Rect(b.x, b.y - 14, w, 18)
+            pygame.draw.rect(
+                surf,
+                (150, 140, 100),
+                roof,
+                border_top_left_radius=9,
+                border_top_right_radius=9,
+            )
+            if building.btype != "park":
+                for window_rect in building_window_rects(b):
+                    pygame.draw.rect(surf, WINDOW_COLOR, window_rect, border_radius=4)
+                dx = b.x + w // 2 - 18
+                dy = b.y + h - 38
+                pygame.draw.rect(surf, DOOR_COLOR, (dx, dy, 36, 38), border_radius=5)
+                pygame.draw.circle(surf, (220, 210, 120), (dx + 32, dy + 19), 3)
+
+        label_bg = pygame.Surface(
+            (label.get_width() + 12, label.get_height() + 4), pygame.SRCALPHA
+        )
+        label_bg.fill((255, 255, 255, 230))
+        surf.blit(label_bg, (b.x + label_x - 6, b.y - 32))
+        surf.blit(label, (b.x + label_x, b.y - 30))
+        return surf, (-pad_left, -pad_top)
 
-        layer_surface = pygame.Surface(window_rect.size, pygame.SRCALPHA)
-        layer_surface.blit(tinted, (x_offset, y_offset))
-        surface.blit(layer_surface, window_rect.topleft)
 
+BUILDING_CACHE = BuildingRenderCache()
 
+
+@profiled("draw_building")
 def draw_building(
     surface,
     building,
@@ -352,76 +590,29 @@ def draw_building(
     player=None,
     frame=0,
     night_alpha=0,
+    cam_y=0,
 ):
-    """Draw a city building, optionally highlighted."""
-    b = building.rect
-    if building.image:
-        shadow = pygame.Surface((b.width, b.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow, SHADOW_COLOR, shadow.get_rect(), border_radius=9)
-        surface.blit(shadow, (b.x + 4, b.y + 4))
-        sprite = pygame.transform.smoothscale(building.image, (b.width, b.height))
-        surface.blit(sprite, (b.x, b.y))
-        if highlight:
-            pygame.draw.rect(surface, (255, 255, 0), b, 2, border_radius=9)
-    else:
-        color = building_color(building.btype)
-        if highlight:
-            color = tuple(min(255, c + 40) for c in color)
-        shadow = pygame.Surface((b.width, b.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow, SHADOW_COLOR, shadow.get_rect(), border_radius=9)
-        surface.blit(shadow, (b.x + 4, b.y + 4))
-        # base rectangle for the building
-        pygame.draw.rect(surface, color, b, border_radius=9)
-
-        # subtle vertical gradient to give the building more depth
-        grad = pygame.Surface((b.width, b.height), pygame.SRCALPHA)
-        for y in range(b.height):
-            alpha = int(90 * (y / b.height))
-            pygame.draw.line(grad, (0, 0, 0, alpha), (0, y), (b.width, y))
-        mask = pygame.Surface((b.width, b.height), pygame.SRCALPHA)
-        pygame.draw.rect(mask, (255, 255, 255), mask.get_rect(), border_radius=9)
-        grad.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        surface.blit(grad, (b.x, b.y))
-
-        if highlight:
-            pygame.draw.rect(surface, (255, 255, 0), b, 2, border_radius=9)
-        roof = pygame.Rect(b.x, b.y - 14, b.width, 18)
-        pygame.draw.rect(
-            surface,
-            (150, 140, 100),
-            roof,
-            border_top_left_radius=9,
-            border_top_right_radius=9,
-        )
-        if building.btype != "park":
-            for i in range(2, b.width // 50):
-                wx = b.x + 18 + i * 50
-                wy = b.y + 28
-                window_rect = pygame.Rect(wx, wy, 22, 22)
-                pygame.draw.rect(surface, WINDOW_COLOR, window_rect, border_radius=4)
-                _draw_window_layers(
-                    surface,
-                    building,
-                    window_rect,
-                    player,
-                    cam_x,
-                    frame,
-                    night_alpha,
-                )
-            dx = b.x + b.width // 2 - 18
-            dy = b.y + b.height - 38
-            pygame.draw.rect(surface, DOOR_COLOR, (dx, dy, 36, 38), border_radius=5)
-            pygame.draw.circle(surface, (220, 210, 120), (dx + 32, dy + 19), 3)
-    font = scaled_font(28)
-    label = font.render(building.name, True, FONT_COLOR)
-    label_bg = pygame.Surface(
-        (label.get_width() + 12, label.get_height() + 4), pygame.SRCALPHA
+    """Draw a city building at its world position shifted by the camera."""
+    tier = QUALITY.tier
+    sprite, (dx, dy) = BUILDING_CACHE.get(
+        building, highlight, tier.shadows, tier.gradients
     )
-    label_bg.fill((255, 255, 255, 230))
-    surface.blit(label_bg, (b.x + b.width // 2 - label.get_width() // 2 - 6, b.y - 32))
-    surface.blit(label, (b.x + b.width // 2 - label.get_width() // 2, b.y - 30))
+    rect = building.rect
+    surface.blit(sprite, (rect.x - cam_x + dx, rect.y - cam_y + dy))
+    if not building.image and building.btype != "park":
+        for window_rect in building_window_rects(rect.move(-cam_x, -cam_y)):
+            _draw_window_layers(
+                surface,
+                building,
+                window_rect,
+                player,
+                cam_x,
+                frame,
+                night_alpha,
+            )
 
 
+@profiled("draw_minimap")
 def draw_minimap(surface, player_rect, buildings, npcs=None, target=None, scale=0.1):
     """Render a simple minimap showing buildings, NPCs and the player."""
     width = int(MAP_WIDTH * scale)
@@ -453,8 +644,9 @@ def draw_minimap(surface, player_rect, buildings, npcs=None, target=None, scale=
     # draw NPCs
     if npcs:
         for n in npcs:
-            x = int(n.rect.centerx * scale)
-            y = int(n.rect.centery * scale)
+            nx, ny, nw, nh = n.bounds
+            x = int((nx + nw // 2) * scale)
+            y = int((ny + nh // 2) * scale)
             pygame.draw.circle(minimap, (0, 0, 255), (x, y), 3)
 
     # draw player
@@ -466,15 +658,30 @@ def draw_minimap(surface, player_rect, buildings, npcs=None, target=None, scale=
     surface.blit(minimap, (SCREEN_WIDTH - width - 10, 10))
 
 
-def draw_road_and_sidewalks(surface, cam_x, cam_y):
-    """Render the city ground using a tile map."""
+def street_lamps():
+    """Return the shared street lamp positions, loading them on first use."""
+    global STREET_LAMPS
+    if STREET_LAMPS is None:
+        STREET_LAMPS = load_street_lamps()
+    return STREET_LAMPS
+
+
+def load_city_map():
+    """Return the shared city :class:`TileMap`, loading it on first use."""
     global CITY_MAP
     if CITY_MAP is None:
         map_path = os.path.join(settings.IMAGE_DIR, "tiles", "city.tmx")
         CITY_MAP = TileMap(map_path)
-    CITY_MAP.render(surface, cam_x, cam_y)
+    return CITY_MAP
+
+
+@profiled("draw_road_and_sidewalks")
+def draw_road_and_sidewalks(surface, cam_x, cam_y):
+    """Render the city ground using a tile map."""
+    load_city_map().render(surface, cam_x, cam_y)
 
 
+@profiled("draw_city_walls")
 def draw_city_walls(surface, cam_x, cam_y):
     """Draw the outer walls surrounding the city map."""
     pygame.draw.rect(surface, CITY_WALL_COLOR, (-cam_x, -cam_y, MAP_WIDTH, 12))
@@ -498,6 +705,14 @@ def _draw_tree(surface, x, y):
     pygame.draw.circle(surface, dark, (x + 22, y + 14), 16)
 
 
+def _draw_street_lamp(surface, x, y):
+    "Draw a street lamp whose head sits at ``(x, y)``."
+    pygame.draw.rect(surface, STREET_LAMP_POST_COLOR, (x - 2, y, 4, 32))
+    pygame.draw.rect(surface, STREET_LAMP_POST_COLOR, (x - 5, y + 30, 10, 4))
+    pygame.draw.circle(surface, STREET_LAMP_POST_COLOR, (x, y), 7)
+    pygame.draw.circle(surface, STREET_LAMP_HEAD_COLOR, (x, y), 5)
+
+
 def _draw_flower_patch(surface, x, y):
     "Draw a small patch of flowers."
     for i, color in enumerate(FLOWER_COLORS):
@@ -507,6 +722,7 @@ def _draw_flower_patch(surface, x, y):
         pygame.draw.circle(surface, (255, 255, 255), (x + ox, y + oy), 1)
 
 
+@profiled("draw_decorations")
 def draw_decorations(surface, cam_x, cam_y):
     "Render decorative trees and flowers on the map."
     for x in range(100, MAP_WIDTH, 300):
@@ -514,63 +730,155 @@ def draw_decorations(surface, cam_x, cam_y):
     patches = [(500, 620), (900, 620), (2000, 620), (2500, 900)]
     for fx, fy in patches:
         _draw_flower_patch(surface, fx - cam_x, fy - cam_y)
+    for lx, ly in street_lamps():
+        _draw_street_lamp(surface, lx - cam_x, ly - cam_y)
+
+
+# Gradient (top, bottom) colors for each time-of-day bucket
+SKY_PALETTES = {
+    "dawn": ((250, 170, 140), (240, 215, 180)),
+    "day": ((120, 180, 255), BG_COLOR),
+    "dusk": ((110, 80, 150), (245, 160, 110)),
+    "night": ((20, 25, 60), (60, 70, 100)),
+}
+CLOUD_LAYER_HEIGHT = 300
+CLOUD_SPEED = 0.45
+
+
+def sky_bucket(current_time):
+    """Return the sky palette bucket for a time given in minutes."""
+    hour = int(current_time) % (24 * 60) // 60
+    if 5 <= hour < 7:
+        return "dawn"
+    if 7 <= hour < 17:
+        return "day"
+    if 17 <= hour < 19:
+        return "dusk"
+    return "night"
+
+
+class SkyRenderer:
+    """Cache the sky gradient, star field and cloud layer as surfaces.
+
+    Gradients are baked once per palette bucket and the star and cloud layers
+    once per window size, so each frame only costs a handful of blits.
+    """
 
+    def __init__(self):
+        self.size = None
+        self.gradients = {}
+        self.stars = None
+        self.clouds = None
+        self.cloud_offset = 0.0
+
+    def _ensure_size(self, size):
+        if size == self.size:
+            return
+        self.size = size
+        self.gradients = {}
+        self.stars = self._bake_stars(size)
+        self.clouds = self._bake_clouds(size)
+        self.cloud_offset = 0.0
+
+    def gradient(self, bucket):
+        """Return the pre-baked gradient surface for ``bucket``."""
+        surf = self.gradients.get(bucket)
+        if surf is None:
+            surf = self._bake_gradient(self.size, *SKY_PALETTES[bucket])
+            self.gradients[bucket] = surf
+        return surf
+
+    @staticmethod
+    def _bake_gradient(size, top_color, bottom_color):
+        width, height = size
+        column = pygame.Surface((1, height))
+        for y in range(height):
+            ratio = y / height
+            column.set_at(
+                (0, y),
+                tuple(
+                    int(top_color[i] * (1 - ratio) + bottom_color[i] * ratio)
+                    for i in range(3)
+                ),
+            )
+        return pygame.transform.scale(column, (width, height))
 
-def draw_sky(surface, current_time):
-    """Draw a vertical gradient sky background with a sun or moon."""
-    top_color = (120, 180, 255)
-    bottom_color = BG_COLOR
-    for y in range(settings.SCREEN_HEIGHT):
-        ratio = y / settings.SCREEN_HEIGHT
-        r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
-        g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
-        b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (0, y), (settings.SCREEN_WIDTH, y))
-
-    # stars remain fixed across frames
-    if not STARS:
+    @staticmethod
+    def _bake_stars(size):
+        width, height = size
+        stars = pygame.Surface((width, height // 2 + 3), pygame.SRCALPHA)
         for _ in range(80):
-            sx = random.randint(0, settings.SCREEN_WIDTH - 1)
-            sy = random.randint(0, settings.SCREEN_HEIGHT // 2)
-            STARS.append((sx, sy))
-
-    # generate a few cloud sprites on first call
-    if not CLOUDS:
+            sx = random.randint(0, width - 1)
+            sy = random.randint(0, height // 2)
+            pygame.draw.circle(stars, (255, 255, 255), (sx, sy), 2)
+        return stars
+
+    @staticmethod
+    def _bake_clouds(size):
+        width = size[0]
+        layer = pygame.Surface((width, CLOUD_LAYER_HEIGHT), pygame.SRCALPHA)
         for _ in range(6):
             w = random.randint(120, 220)
             h = random.randint(40, 80)
             cloud = pygame.Surface((w, h), pygame.SRCALPHA)
             pygame.draw.ellipse(cloud, (255, 255, 255, 230), (0, h // 3, w, h // 2))
             pygame.draw.ellipse(cloud, (255, 255, 255, 230), (w // 4, 0, w // 2, h))
-            x = random.randint(0, settings.SCREEN_WIDTH)
+            x = random.randint(0, width)
             y = random.randint(40, 200)
-            speed = random.uniform(0.2, 0.7)
-            CLOUDS.append([cloud, x, y, speed])
-
-    # move and draw clouds
-    for cloud in CLOUDS:
-        cloud[1] -= cloud[3]
-        if cloud[1] < -cloud[0].get_width():
-            cloud[1] = settings.SCREEN_WIDTH + random.randint(20, 100)
-            cloud[2] = random.randint(40, 200)
-            cloud[3] = random.uniform(0.2, 0.7)
-        surface.blit(cloud[0], (cloud[1], cloud[2]))
-
-    # add a simple sun or moon that moves across the sky
-    day_fraction = (current_time % (24 * 60)) / (24 * 60)
-    x = int(day_fraction * settings.SCREEN_WIDTH)
-    y = int(80 - 60 * math.cos(day_fraction * 2 * math.pi))
-    hour = int(current_time) // 60
-    if 6 <= hour < 18:
-        pygame.draw.circle(surface, (255, 240, 150), (x, y), 40)
-    else:
-        pygame.draw.circle(surface, (230, 230, 255), (x, y), 30)
-        for sx, sy in STARS:
-            pygame.draw.circle(surface, (255, 255, 255), (sx, sy), 2)
+            # wrap clouds crossing the right edge so the layer tiles seamlessly
+            layer.blit(cloud, (x, y))
+            layer.blit(cloud, (x - width, y))
+        return layer
+
+    def draw(self, surface, current_time, clouds=True, gradients=True):
+        self._ensure_size((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        width = self.size[0]
+        bucket = sky_bucket(current_time)
+        if gradients:
+            surface.blit(self.gradient(bucket), (0, 0))
+        else:
+            surface.fill(SKY_PALETTES[bucket][0])
+
+        if clouds:
+            # scroll the cloud layer left, drawing it twice to cover the wrap
+            self.cloud_offset = (self.cloud_offset + CLOUD_SPEED) % width
+            offset = int(self.cloud_offset)
+            surface.blit(self.clouds, (-offset, 0))
+            surface.blit(self.clouds, (width - offset, 0))
+
+        # add a simple sun or moon that moves across the sky
+        day_fraction = (current_time % (24 * 60)) / (24 * 60)
+        x = int(day_fraction * width)
+        y = int(80 - 60 * math.cos(day_fraction * 2 * math.pi))
+        hour = int(current_time) // 60
+        if 6 <= hour < 18:
+            pygame.draw.circle(surface, (255, 240, 150), (x, y), 40)
+        else:
+            pygame.draw.circle(surface, (230, 230, 255), (x, y), 30)
+            surface.blit(self.stars, (0, 0))
+
+
+SKY_RENDERER = SkyRenderer()
+
+
+@profiled("draw_sky")
+def draw_sky(surface, current_time):
+    """Draw a vertical gradient sky background with a sun or moon."""
+    tier = QUALITY.tier
+    SKY_RENDERER.draw(surface, current_time, tier.clouds, tier.gradients)
+
 
+# Light radius of the street lamps and lit windows
+STREET_LAMP_RADIUS = 90
+WINDOW_LIGHT_RADIUS = 28
+# Edge of the world-aligned light map tiles, in pixels, and how many tiles
+# for the coming hour are built ahead of time each frame
+LIGHT_TILE_SIZE = 256
+LIGHT_TILES_PER_FRAME = 2
 
-def draw_day_night(surface, current_time):
-    """Darken the city during nighttime hours and report the overlay alpha."""
+
+def night_alpha_for(current_time):
+    """Return the darkness overlay alpha for a time given in minutes."""
     hour = int(current_time) // 60
     alpha = 0
     if hour >= 18 or hour < 6:
@@ -578,24 +886,187 @@ def draw_day_night(surface, current_time):
             alpha = min(int((hour - 18) / 6 * 120), 120)
         else:
             alpha = min(int((6 - hour) / 6 * 120), 120)
-    if alpha:
-        overlay = pygame.Surface((settings.SCREEN_WIDTH, MAP_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, alpha))
-        surface.blit(overlay, (0, 0))
     return alpha
 
 
-def draw_weather(surface, weather):
-    """Render simple rain or snow particle effects."""
+class LightingCompositor:
+    """Cache night overlays and light map tiles.
+
+    Plain overlays are cached per alpha step. When a building index is
+    supplied the darkness is drawn from world-aligned tiles with the drawn
+    building windows and street lamps punched out, built the first time they
+    come into view, including tiles past the map edges. While one hour is
+    drawn the visible tiles for the next hour's darkness are built a few per
+    frame, so the hour change does not stall a frame. Tiles are dropped when
+    the buildings or lamps change.
+    """
+
+    def __init__(self, lamps=None, tile_size=LIGHT_TILE_SIZE):
+        # the drawn street lamps are loaded on first use unless given here
+        self.lamps = None if lamps is None else list(lamps)
+        self.tile_size = tile_size
+        self.overlays = {}
+        self.light_sprites = {}
+        self.tiles = {}  # (alpha, tile x, tile y) -> surface
+        self.tiles_key = None
+        self.alpha = 0
+
+    def add_light(self, x, y, radius=STREET_LAMP_RADIUS):
+        """Register a static light; light tiles are rebuilt on next use."""
+        self._lamps().append((x, y, radius))
+        self.tiles.clear()
+
+    def overlay(self, alpha, size):
+        """Return a cached full-screen darkness overlay."""
+        key = (alpha, size)
+        surf = self.overlays.get(key)
+        if surf is None:
+            if len(self.overlays) > 16:
+                self.overlays.clear()
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill((0, 0, 0, alpha))
+            self.overlays[key] = surf
+        return surf
+
+    def light_sprite(self, radius):
+        """Return a radial mask whose alpha rises from 0 at the centre."""
+        sprite = self.light_sprites.get(radius)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            sprite.fill((0, 0, 0, 255))
+            for r in range(radius, 0, -2):
+                alpha = int(255 * (r / radius) ** 2)
+                pygame.draw.circle(sprite, (0, 0, 0, alpha), (radius, radius), r)
+            self.light_sprites[radius] = sprite
+        return sprite
+
+    def _lamps(self):
+        if self.lamps is None:
+            self.lamps = list(street_lamps())
+        return self.lamps
+
+    def _lights(self, buildings, area):
+        """Yield ``(x, y, radius)`` for every light reaching ``area``."""
+        for lamp in self._lamps():
+            x, y = lamp[0], lamp[1]
+            radius = lamp[2] if len(lamp) > 2 else STREET_LAMP_RADIUS
+            if area.colliderect((x - radius, y - radius, radius * 2, radius * 2)):
+                yield x, y, radius
+        reach = area.inflate(WINDOW_LIGHT_RADIUS * 2, WINDOW_LIGHT_RADIUS * 2)
+        for b in buildings.query_rect(reach):
+            for window in lit_window_rects(b):
+                yield window.centerx, window.centery, WINDOW_LIGHT_RADIUS
+
+    def build_light_map(self, alpha, buildings, area):
+        """Render darkness over world ``area`` with holes for its lights."""
+        light_map = pygame.Surface(area.size, pygame.SRCALPHA)
+        light_map.fill((0, 0, 0, alpha))
+        for x, y, radius in self._lights(buildings, area):
+            light_map.blit(
+                self.light_sprite(radius),
+                (x - radius - area.x, y - radius - area.y),
+                special_flags=pygame.BLEND_RGBA_MIN,
+            )
+        return light_map
+
+    def tile(self, tx, ty, alpha, buildings):
+        """Return the light map tile at tile coordinates ``(tx, ty)``."""
+        key = (id(buildings), buildings.version)
+        if key != self.tiles_key:
+            self.tiles.clear()
+            self.tiles_key = key
+        surf = self.tiles.get((alpha, tx, ty))
+        if surf is None:
+            size = self.tile_size
+            area = pygame.Rect(tx * size, ty * size, size, size)
+            surf = self.build_light_map(alpha, buildings, area)
+            self.tiles[(alpha, tx, ty)] = surf
+        return surf
+
+    def draw(self, surface, current_time, buildings=None, cam_x=0, cam_y=0):
+        alpha = night_alpha_for(current_time)
+        if not alpha:
+            return 0
+        if buildings is None:
+            surface.blit(self.overlay(alpha, surface.get_size()), (0, 0))
+            return alpha
+        next_alpha = night_alpha_for(current_time + 60)
+        if alpha != self.alpha:
+            self.alpha = alpha
+            self.tiles = {
+                key: surf
+                for key, surf in self.tiles.items()
+                if key[0] in (alpha, next_alpha)
+            }
+        size = self.tile_size
+        width, height = surface.get_size()
+        xs = range(cam_x // size, (cam_x + width - 1) // size + 1)
+        ys = range(cam_y // size, (cam_y + height - 1) // size + 1)
+        for ty in ys:
+            for tx in xs:
+                tile = self.tile(tx, ty, alpha, buildings)
+                surface.blit(tile, (tx * size - cam_x, ty * size - cam_y))
+
+        # get the next hour's tiles ready ahead of time
+        if next_alpha and next_alpha != alpha:
+            budget = LIGHT_TILES_PER_FRAME
+            for ty in ys:
+                for tx in xs:
+                    if budget and (next_alpha, tx, ty) not in self.tiles:
+                        self.tile(tx, ty, next_alpha, buildings)
+                        budget -= 1
+        return alpha
+
+
+LIGHTING = LightingCompositor()
+
+
+@profiled("draw_day_night")
+def draw_day_night(surface, current_time, buildings=None, cam_x=0, cam_y=0):
+    """Darken the city during nighttime hours and report the overlay alpha.
+
+    With ``buildings``, a :class:`spatial.SpatialHash` of the city buildings,
+    the cached light map tiles are used so lit windows and street lamps
+    shine through the darkness.
+    """
+    return LIGHTING.draw(surface, current_time, buildings, cam_x, cam_y)
+
+
+WEATHER_PARTICLES = WeatherParticles()
+
+
+@profiled("draw_weather")
+def draw_weather(surface, weather, density=1.0):
+    """Render rain or snow particle effects.
+
+    ``density`` scales the particle count; storms can use values of 50 or
+    more when NumPy is installed. The quality tier scales it further.
+    """
+    density *= QUALITY.tier.particle_density
+    if density <= 0:
+        return
+    if not ParticleField.available():
+        _draw_weather_lists(surface, weather, density)
+        return
+    field = WEATHER_PARTICLES.update(
+        weather, (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), density
+    )
+    if field is not None:
+        field.step()
+        field.draw(surface)
+
+
+def _draw_weather_lists(surface, weather, density=1.0):
+    """Per-particle rain and snow used when NumPy is unavailable."""
     global RAINDROPS, SNOWFLAKES
     if weather == "Rain":
-        if not RAINDROPS:
+        if len(RAINDROPS) != int(180 * density):
             RAINDROPS = [
                 [
                     random.randint(0, settings.SCREEN_WIDTH),
                     random.randint(-settings.SCREEN_HEIGHT, 0),
                 ]
-                for _ in range(180)
+                for _ in range(int(180 * density))
             ]
         for drop in RAINDROPS:
             drop[0] += -3
@@ -612,14 +1083,14 @@ def draw_weather(surface, weather):
             )
         SNOWFLAKES = []
     elif weather == "Snow":
-        if not SNOWFLAKES:
+        if len(SNOWFLAKES) != int(120 * density):
             SNOWFLAKES = [
                 [
                     random.randint(0, settings.SCREEN_WIDTH),
                     random.randint(-settings.SCREEN_HEIGHT, 0),
                     random.randint(1, 3),
                 ]
-                for _ in range(120)
+                for _ in range(int(120 * density))
             ]
         for flake in SNOWFLAKES:
             flake[0] += math.sin(flake[1] * 0.05) * flake[2]
@@ -636,149 +1107,77 @@ def draw_weather(surface, weather):
         SNOWFLAKES = []
 
 
-def draw_ui(surface, font, player, quests, story_quests=None):
-    """Render the main HUD bar showing player stats."""
-
-    bar_height = 60
-    bar = pygame.Surface((settings.SCREEN_WIDTH, bar_height), pygame.SRCALPHA)
-    bar.fill(UI_BG)
-    hour = int(player.time) // 60
-    minute = int(player.time) % 60
-    time_str = f"{hour:02d}:{minute:02d}"
-    o_exp, o_need = job_progress(player, "office")
-    d_exp, d_need = job_progress(player, "dealer")
-    c_exp, c_need = job_progress(player, "clinic")
-    office_prog = f"{o_exp}/{o_need}" if o_need else "MAX"
-    dealer_prog = f"{d_exp}/{d_need}" if d_need else "MAX"
-    clinic_prog = f"{c_exp}/{c_need}" if c_need else "MAX"
-    job_info = (
-        f"Office:{get_job_title(player, 'office')} "
-        f"L{player.office_level}({office_prog})  "
-        f"Dealer:{get_job_title(player, 'dealer')} "
-        f"L{player.dealer_level}({dealer_prog})  "
-        f"Clinic:{get_job_title(player, 'clinic')} "
-        f"L{player.clinic_level}({clinic_prog})"
-    )
-    text = font.render(
-        f"Money: ${int(player.money)}  Tokens: {player.tokens}  "
-        f"Energy: {int(player.energy)}  Health: {int(player.health)}  "
-        f"STR:{player.strength} DEF:{player.defense} SPD:{player.speed} "
-        f"INT:{player.intelligence} CHA:{player.charisma}  "
-        f"{job_info}  Day: {player.day}  Time: {time_str}",
-        True,
-        FONT_COLOR,
-    )
-    bar.blit(text, (16, 6))
-    if player.epithet:
-        ep_txt = font.render(player.epithet, True, FONT_COLOR)
-        bar.blit(ep_txt, (settings.SCREEN_WIDTH // 2 - ep_txt.get_width() // 2, 6))
-    seed_total = sum(player.resources.get(f"{n}_seeds", 0) for n in CROPS)
-    produce_total = sum(player.resources.get(n, 0) for n in CROPS)
-    res_txt = font.render(
-        f"M:{player.resources.get('metal', 0)} "
-        f"C:{player.resources.get('cloth', 0)} "
-        f"H:{player.resources.get('herbs', 0)} "
-        f"S:{seed_total} P:{produce_total}",
-        True,
-        FONT_COLOR,
-    )
-    bar.blit(res_txt, (16, 20))
-    crops_line = " ".join(
-        f"{c['type']}:{min(player.day - c['planted_day'], CROPS[c['type']]['growth_days'])}/{CROPS[c['type']]['growth_days']}"
-        for c in player.crops
-    )
-    if crops_line:
-        crop_txt = font.render(crops_line, True, FONT_COLOR)
-        bar.blit(crop_txt, (16, 32))
-    rep_line = (
-        f"Mayor:{player.reputation.get('mayor', 0)} "
-        f"Biz:{player.reputation.get('business', 0)} "
-        f"Gang:{player.reputation.get('gang', 0)}"
-    )
-    rewards = (
-        factions.mayor_rewards(player)
-        + factions.business_rewards(player)
-        + factions.gang_rewards(player)
-    )
-    if rewards:
-        rep_line += " " + ", ".join(rewards)
-    rep_txt = font.render(rep_line, True, FONT_COLOR)
-    bar.blit(rep_txt, (16, 44))
-    card_stat = font.render(
-        f"Cards: {len(player.cards)}/10",
-        True,
-        FONT_COLOR,
-    )
-    bar.blit(card_stat, (settings.SCREEN_WIDTH - card_stat.get_width() - 20, 20))
-    if player.crafting_skills:
-        first = next(iter(player.crafting_skills))
-        level = player.crafting_skills[first]
-        xp = player.crafting_exp.get(first, 0)
-        needed = crafting_exp_needed(player, first)
-        craft_prog = f"{first.title()} {level} {xp}/{needed}"
-    else:
-        craft_prog = "No Crafting"
-    craft_txt = font.render(f"Craft XP: {craft_prog}", True, FONT_COLOR)
-    bar.blit(craft_txt, (settings.SCREEN_WIDTH - craft_txt.get_width() - 20, 32))
-    season_txt = font.render(
-        f"{WEEKDAY_NAMES[player.weekday]} - {player.season} - {player.weather}",
-        True,
-        FONT_COLOR,
-    )
-    bar.blit(season_txt, (settings.SCREEN_WIDTH // 2 - season_txt.get_width() // 2, 32))
-    if player.companion:
-        ctxt = font.render(f"Pet: {player.companion}", True, FONT_COLOR)
-        bar.blit(ctxt, (settings.SCREEN_WIDTH - ctxt.get_width() - 20, 6))
-    # progress bars for energy and health
-    pygame.draw.rect(bar, (80, 80, 80), (16, 44, 100, 10))
-    pygame.draw.rect(bar, (0, 200, 0), (16, 44, int(player.energy), 10))
-    pygame.draw.rect(bar, (80, 80, 80), (140, 44, 100, 10))
-    pygame.draw.rect(bar, (200, 0, 0), (140, 44, int(player.health), 10))
-    e_txt = font.render("E", True, FONT_COLOR)
-    h_txt = font.render("H", True, FONT_COLOR)
-    bar.blit(e_txt, (6, 42))
-    bar.blit(h_txt, (130, 42))
-    heavy_cd = (
-        player.ability_cooldowns["heavy"] // 60
-        if player.ability_cooldowns["heavy"]
-        else "R"
-    )
-    guard_cd = (
-        player.ability_cooldowns["guard"] // 60
-        if player.ability_cooldowns["guard"]
-        else "R"
-    )
-    special_cd = (
-        player.ability_cooldowns["special"] // 60
-        if player.ability_cooldowns["special"]
-        else "R"
-    )
-    cd_txt = font.render(
-        f"Z:{heavy_cd} X:{guard_cd} C:{special_cd}", True, FONT_COLOR
-    )
-    bar.blit(cd_txt, (settings.SCREEN_WIDTH - cd_txt.get_width() - 20, 32))
-    surface.blit(bar, (0, 0))
-
-    # Show current quest below the stat bar
-    quest_text = None
+def current_quest_text(player, quests, story_quests=None):
+    """Return the description of the quest shown under the stat bar."""
     if player.side_quest:
         sq = SIDE_QUESTS.get(player.side_quest)
         if sq:
-            quest_text = sq.description
-    if quest_text is None:
-        if story_quests and player.story_stage < len(story_quests):
-            quest_text = story_quests[player.story_stage].description
-        elif player.current_quest < len(quests):
-            quest_text = quests[player.current_quest].description
-    if quest_text:
-        qsurf = font.render(f"Quest: {quest_text}", True, FONT_COLOR)
-        qbg = pygame.Surface(
-            (qsurf.get_width() + 12, qsurf.get_height() + 4), pygame.SRCALPHA
+            return sq.description
+    if story_quests and player.story_stage < len(story_quests):
+        return story_quests[player.story_stage].description
+    if player.current_quest < len(quests):
+        return quests[player.current_quest].description
+    return None
+
+
+HUD_BAR = HUD()
+
+
+@profiled("draw_ui")
+def draw_ui(surface, font, player, quests, story_quests=None):
+    """Render the main HUD bar showing player stats.
+
+    Returns the screen rects whose contents changed since the last call.
+    """
+    quest_text = current_quest_text(player, quests, story_quests)
+    return HUD_BAR.draw(surface, font, player, quest_text)
+
+
+PROFILER_COLUMNS = (0, 220, 290, 360)
+
+
+class ProfilerOverlay:
+    """Panel listing p50/p95/p99 milliseconds of every profiled subsystem.
+
+    The panel surface is reused between frames, and the timings, which change
+    every frame, are rendered without the shared text cache so they do not
+    evict the HUD and building labels the profiler is measuring.
+    """
+
+    def __init__(self):
+        self.panel = None
+
+    def _panel(self, size):
+        if self.panel is None or self.panel.get_size() != size:
+            self.panel = pygame.Surface(size, pygame.SRCALPHA)
+        self.panel.fill(UI_BG)
+        return self.panel
+
+    def draw(self, surface, font, profiler=PROFILER):
+        summary = sorted(profiler.summary().items())
+        labels = [("section", "p50", "p95", "p99"), ("quality", QUALITY.tier.name)]
+        line_h = font.get_linesize()
+        panel = self._panel(
+            (PROFILER_COLUMNS[-1] + 80, line_h * (len(labels) + len(summary)) + 10)
         )
-        qbg.fill((255, 255, 255, 220))
-        surface.blit(qbg, (16, bar_height + 4))
-        surface.blit(qsurf, (22, bar_height + 6))
+        for i, row in enumerate(labels):
+            for x, text in zip(PROFILER_COLUMNS, row):
+                text_surf = render_text(font, text, True, FONT_COLOR)
+                panel.blit(text_surf, (x + 5, i * line_h + 5))
+        for i, (name, row) in enumerate(summary, len(labels)):
+            y = i * line_h + 5
+            panel.blit(render_text(font, name, True, FONT_COLOR), (5, y))
+            for x, key in zip(PROFILER_COLUMNS[1:], ("p50_ms", "p95_ms", "p99_ms")):
+                panel.blit(font.render(f"{row[key]:.2f}", True, FONT_COLOR), (x + 5, y))
+        surface.blit(panel, (10, 60))
+
+
+PROFILER_OVERLAY = ProfilerOverlay()
+
 
+def draw_profiler_overlay(surface, font, profiler=PROFILER):
+    """List p50/p95/p99 milliseconds of every profiled subsystem."""
+    PROFILER_OVERLAY.draw(surface, font, profiler)
 
 
 def draw_inventory_screen(
@@ -805,19 +1204,22 @@ def draw_inventory_screen(
     panel.fill((240, 240, 220))
     surface.blit(panel, (60, 60))
 
-    title = font.render("Inventory", True, FONT_COLOR)
+    title = render_text(font, "Inventory", True, FONT_COLOR)
     surface.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 70))
     if sort_mode:
-        mode_txt = font.render(f"Sorted by: {sort_mode.title()}", True, FONT_COLOR)
+        mode_txt = render_text(
+            font, f"Sorted by: {sort_mode.title()}", True, FONT_COLOR
+        )
         surface.blit(mode_txt, (100, 110))
 
     for slot, rect in slot_rects.items():
         pygame.draw.rect(surface, (210, 210, 210), rect)
-        label = font.render(slot.title(), True, FONT_COLOR)
+        label = render_text(font, slot.title(), True, FONT_COLOR)
         surface.blit(label, (rect.x + 2, rect.y - 20))
         item = player.equipment.get(slot)
         if item:
-            it = font.render(
+            it = render_text(
+                font,
                 f"{item.name} Lv{item.level} A{item.attack} D{item.defense} "
                 f"S{item.speed} C{item.combo}",
                 True,
@@ -827,7 +1229,8 @@ def draw_inventory_screen(
 
     for rect, item in item_rects:
         pygame.draw.rect(surface, (200, 220, 230), rect)
-        txt = font.render(
+        txt = render_text(
+            font,
             f"{item.name} Lv{item.level} A{item.attack} D{item.defense} "
             f"S{item.speed} C{item.combo}",
             True,
@@ -837,7 +1240,8 @@ def draw_inventory_screen(
 
     if dragging:
         item, pos = dragging
-        txt = font.render(
+        txt = render_text(
+            font,
             f"{item.name} Lv{item.level} A{item.attack} D{item.defense} "
             f"S{item.speed} C{item.combo}",
             True,
@@ -856,10 +1260,11 @@ def draw_inventory_screen(
         f"Herbs:{player.resources.get('herbs', 0)} "
         f"Produce:{produce_total}"
     )
-    res_txt = font.render(res, True, FONT_COLOR)
+    res_txt = render_text(font, res, True, FONT_COLOR)
     surface.blit(res_txt, (100, settings.SCREEN_HEIGHT - 120))
     card_line = ", ".join(player.cards) if player.cards else "None"
-    card_txt = font.render(
+    card_txt = render_text(
+        font,
         f"Cards ({len(player.cards)}/10): {card_line}", True, FONT_COLOR
     )
     surface.blit(card_txt, (100, settings.SCREEN_HEIGHT - 100))
@@ -867,22 +1272,22 @@ def draw_inventory_screen(
     if hotkey_rects:
         for i, rect in enumerate(hotkey_rects):
             pygame.draw.rect(surface, (210, 210, 210), rect)
-            label = font.render(str(i + 1), True, FONT_COLOR)
+            label = render_text(font, str(i + 1), True, FONT_COLOR)
             surface.blit(label, (rect.x + 2, rect.y - 20))
             item = player.hotkeys[i]
             if item:
-                txt = font.render(item.name, True, FONT_COLOR)
+                txt = render_text(font, item.name, True, FONT_COLOR)
                 surface.blit(txt, (rect.x + 4, rect.y + 14))
 
     if furn_rects:
         for idx, rect in enumerate(furn_rects):
             pygame.draw.rect(surface, (200, 190, 150), rect)
-            label = font.render(f"F{idx+1}", True, FONT_COLOR)
+            label = render_text(font, f"F{idx+1}", True, FONT_COLOR)
             surface.blit(label, (rect.x + 2, rect.y - 20))
             slot = f"slot{idx+1}"
             item = player.furniture.get(slot)
             if item:
-                txt = font.render(item.name, True, FONT_COLOR)
+                txt = render_text(font, item.name, True, FONT_COLOR)
                 surface.blit(txt, (rect.x + 4, rect.y + 20))
 
 
@@ -897,17 +1302,20 @@ def draw_perk_menu(surface, font, player, perks):
     panel.fill((240, 240, 220))
     surface.blit(panel, (60, 60))
 
-    title = font.render("Choose a Perk", True, FONT_COLOR)
+    title = render_text(font, "Choose a Perk", True, FONT_COLOR)
     surface.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 70))
 
     for i, (name, desc) in enumerate(perks):
         level = player.perk_levels.get(name, 0)
-        txt = font.render(
+        txt = render_text(
+            font,
             f"{i+1}: {name} Lv{level}/{PERK_MAX_LEVEL} - {desc}", True, FONT_COLOR
         )
         surface.blit(txt, (100, 120 + i * 40))
 
-    info = font.render(f"Points: {player.perk_points}   [Q] Exit", True, FONT_COLOR)
+    info = render_text(
+        font, f"Points: {player.perk_points}   [Q] Exit", True, FONT_COLOR
+    )
     surface.blit(info, (100, 120 + len(perks) * 40 + 20))
 
 
@@ -921,7 +1329,7 @@ def draw_companion_menu(surface, font, player, abilities):
     panel.fill((240, 240, 220))
     surface.blit(panel, (60, 60))
 
-    title = font.render("Train Companion", True, FONT_COLOR)
+    title = render_text(font, "Train Companion", True, FONT_COLOR)
     surface.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 70))
 
     levels = player.companion_abilities.get(player.companion, {})
@@ -931,20 +1339,23 @@ def draw_companion_menu(surface, font, player, abilities):
         None,
     )
     if active:
-        qtxt = font.render(f"Quest: {active.description}", True, FONT_COLOR)
+        qtxt = render_text(font, f"Quest: {active.description}", True, FONT_COLOR)
         surface.blit(qtxt, (100, y))
         y += 20
-    morale_txt = font.render(f"Morale: {player.companion_morale}", True, FONT_COLOR)
+    morale_txt = render_text(
+        font, f"Morale: {player.companion_morale}", True, FONT_COLOR
+    )
     surface.blit(morale_txt, (100, y))
     offset = 20
     for i, (name, desc, _stat) in enumerate(abilities):
         lvl = levels.get(name, 0)
-        txt = font.render(
+        txt = render_text(
+            font,
             f"{i+1}: {name} Lv{lvl}/{PERK_MAX_LEVEL} - {desc}", True, FONT_COLOR
         )
         surface.blit(txt, (100, y + 20 + i * 40))
 
-    info = font.render("[Q] Exit", True, FONT_COLOR)
+    info = render_text(font, "[Q] Exit", True, FONT_COLOR)
     surface.blit(info, (100, y + 20 + len(abilities) * 40 + offset))
 
 
@@ -959,36 +1370,36 @@ def draw_quest_log(surface, font, quests, player, story_quests=None):
     panel.fill((240, 240, 220))
     surface.blit(panel, (60, 60))
 
-    title = font.render("Quest Log", True, FONT_COLOR)
+    title = render_text(font, "Quest Log", True, FONT_COLOR)
     surface.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 70))
 
     y = 120
     if player.side_quest:
-        hdr = font.render("Side Quest", True, FONT_COLOR)
+        hdr = render_text(font, "Side Quest", True, FONT_COLOR)
         surface.blit(hdr, (100, y))
         y += 30
         sq = SIDE_QUESTS.get(player.side_quest)
         if sq:
-            txt = font.render(f"[ ] {sq.description}", True, FONT_COLOR)
+            txt = render_text(font, f"[ ] {sq.description}", True, FONT_COLOR)
             surface.blit(txt, (120, y))
             y += 40
     if story_quests:
-        hdr = font.render("Story Quests", True, FONT_COLOR)
+        hdr = render_text(font, "Story Quests", True, FONT_COLOR)
         surface.blit(hdr, (100, y))
         y += 30
         for q in story_quests:
             status = "[x]" if q.completed else "[ ]"
-            txt = font.render(f"{status} {q.description}", True, FONT_COLOR)
+            txt = render_text(font, f"{status} {q.description}", True, FONT_COLOR)
             surface.blit(txt, (120, y))
             y += 30
         y += 20
     for q in quests:
         status = "[x]" if q.completed else "[ ]"
-        txt = font.render(f"{status} {q.description}", True, FONT_COLOR)
+        txt = render_text(font, f"{status} {q.description}", True, FONT_COLOR)
         surface.blit(txt, (100, y))
         y += 30
 
-    note = font.render("Press L or Q to close", True, FONT_COLOR)
+    note = render_text(font, "Press L or Q to close", True, FONT_COLOR)
     surface.blit(note, (100, settings.SCREEN_HEIGHT - 140))
 
 
@@ -1004,7 +1415,7 @@ def draw_help_screen(surface, font):
     panel.fill((240, 240, 220))
     surface.blit(panel, (80, 80))
 
-    title = font.render("Help & Controls", True, FONT_COLOR)
+    title = render_text(font, "Help & Controls", True, FONT_COLOR)
     surface.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 100))
 
     lines = [
@@ -1017,11 +1428,11 @@ def draw_help_screen(surface, font):
     ]
     y = 160
     for line in lines:
-        txt = font.render(line, True, FONT_COLOR)
+        txt = render_text(font, line, True, FONT_COLOR)
         surface.blit(txt, (120, y))
         y += 40
 
-    note = font.render("Press F1 or Q to close", True, FONT_COLOR)
+    note = render_text(font, "Press F1 or Q to close", True, FONT_COLOR)
     surface.blit(note, (120, y))
 
 
@@ -1031,7 +1442,7 @@ def draw_tip_panel(surface, font, text):
     panel = pygame.Surface((settings.SCREEN_WIDTH, panel_height))
     panel.fill((245, 245, 200))
     surface.blit(panel, (0, settings.SCREEN_HEIGHT - panel_height))
-    tip_surf = font.render(text, True, (80, 40, 40))
+    tip_surf = render_text(font, text, True, (80, 40, 40))
     surface.blit(
         tip_surf,
         (
@@ -1045,14 +1456,14 @@ def draw_hotkey_bar(surface, font, player, rects):
     """Render hotkey slots showing bound items."""
     for i, rect in enumerate(rects):
         pygame.draw.rect(surface, (210, 210, 210), rect)
-        label = font.render(str(i + 1), True, FONT_COLOR)
+        label = render_text(font, str(i + 1), True, FONT_COLOR)
         surface.blit(
             label,
             (rect.x + int(rect.width * 0.033), rect.y - int(rect.height * 0.45)),
         )
         item = player.hotkeys[i]
         if item:
-            txt = font.render(item.name, True, FONT_COLOR)
+            txt = render_text(font, item.name, True, FONT_COLOR)
             surface.blit(
                 txt,
                 (rect.x + int(rect.width * 0.067), rect.y + int(rect.height * 0.25)),
@@ -1098,7 +1509,7 @@ def draw_home_interior(surface, font, player, frame, bed_rect, door_rect, furn_r
         slot = f"slot{idx+1}"
         item = player.furniture.get(slot)
         if item:
-            txt = font.render(item.name, True, FONT_COLOR)
+            txt = render_text(font, item.name, True, FONT_COLOR)
             surface.blit(
                 txt,
                 (rect.x + int(rect.width * 0.033), rect.y + int(rect.height * 0.25)),
@@ -1196,7 +1607,7 @@ def draw_bar_interior(
             -int(counter_rect.width * 0.111), -int(counter_rect.height * 0.167)
         ),
     )
-    ct = font.render("Tokens", True, FONT_COLOR)
+    ct = render_text(font, "Tokens", True, FONT_COLOR)
     surface.blit(
         ct,
         (
@@ -1207,7 +1618,7 @@ def draw_bar_interior(
 
     # blackjack table
     pygame.draw.rect(surface, (60, 120, 60), bj_rect)
-    bj = font.render("Blackjack", True, (250, 250, 250))
+    bj = render_text(font, "Blackjack", True, (250, 250, 250))
     surface.blit(
         bj,
         (
@@ -1218,7 +1629,7 @@ def draw_bar_interior(
 
     # slots
     pygame.draw.rect(surface, (90, 90, 150), slot_rect)
-    sl = font.render("Slots", True, (250, 250, 250))
+    sl = render_text(font, "Slots", True, (250, 250, 250))
     surface.blit(
         sl,
         (
@@ -1229,7 +1640,7 @@ def draw_bar_interior(
 
     # darts board
     pygame.draw.rect(surface, (120, 70, 120), dart_rect)
-    dr = font.render("Darts", True, (250, 250, 250))
+    dr = render_text(font, "Darts", True, (250, 250, 250))
     surface.blit(
         dr,
         (
@@ -1240,7 +1651,7 @@ def draw_bar_interior(
 
     # fighting ring
     pygame.draw.rect(surface, (180, 70, 70), brawl_rect)
-    fb = font.render("Fight", True, (250, 250, 250))
+    fb = render_text(font, "Fight", True, (250, 250, 250))
     surface.blit(
         fb,
         (
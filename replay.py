@@ -0,0 +1,263 @@
+"""Deterministic input recording and replay.
+
+:class:`InputRecorder` saves, for every frame of :meth:`game.Game.run`, the
+pygame events, the state of every bound key and how many fixed updates ran,
+after a header holding the RNG seed. Blocking menus opened from gameplay read
+their events through :meth:`game.Game.menu_events`, which records each pass
+of a menu loop as a line of its own. :class:`InputReplay` feeds all of it
+back through the :class:`~state_manager.StateManager` and the menus in place
+of the live devices, so a seeded session plays out identically and can be
+profiled before and after a change. A digest of the final world state is
+stored at the end of a recording and checked after a replay.
+
+Run ``python -m game --record session.jsonl`` to record and
+``python -m game --replay session.jsonl`` to play it back.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pygame
+
+import settings
+from quality import QUALITY
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None
+
+REPLAY_VERSION = 2
+# Paths planned per frame while recording or replaying, replacing the
+# wall-clock budget that would make NPC routing timing dependent
+REPLAY_PATHS_PER_FRAME = 4
+DEFAULT_PLAYER_FILE = os.path.join("data", "bench_player.json")
+
+Frame = Tuple[int, List[pygame.event.Event], List[int]]
+
+
+def seed_rngs(seed: int) -> None:
+    """Seed every random number generator the game draws from."""
+    random.seed(seed)
+    if np is not None:
+        np.random.seed(seed % 2**32)
+
+
+def bound_keys() -> List[int]:
+    """Keyboard keys used by any binding; joystick buttons are negative."""
+    keys = settings.KEY_BINDINGS.values()
+    return sorted({k for bound in keys for k in bound if k >= 0})
+
+
+def snapshot_keys() -> List[int]:
+    """Bound keys currently held down."""
+    pressed = pygame.key.get_pressed()
+    return [k for k in bound_keys() if pressed[k]]
+
+
+class PressedKeys:
+    """Stand-in for ``pygame.key.get_pressed()`` built from a key list."""
+
+    def __init__(self, keys: Iterable[int]) -> None:
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+def serialize_event(event: pygame.event.Event) -> Dict:
+    """JSON-ready form of ``event``, dropping attributes that are not data."""
+    attrs = {}
+    for name, value in event.dict.items():
+        if isinstance(value, (bool, int, float, str)):
+            attrs[name] = value
+        elif isinstance(value, tuple) and all(
+            isinstance(v, (int, float)) for v in value
+        ):
+            attrs[name] = list(value)
+    return {"type": event.type, "attrs": attrs}
+
+
+def deserialize_event(data: Dict) -> pygame.event.Event:
+    attrs = {
+        name: tuple(value) if isinstance(value, list) else value
+        for name, value in data["attrs"].items()
+    }
+    return pygame.event.Event(data["type"], attrs)
+
+
+def state_digest(game) -> str:
+    """Hash of the player and NPC state used to confirm a replay matched."""
+    player = game.player
+    state = [
+        tuple(player.rect),
+        round(player.time, 6),
+        player.money,
+        player.weather,
+        [(npc.name, tuple(npc.rect), npc.bubble_timer) for npc in game.npcs],
+    ]
+    return hashlib.sha256(repr(state).encode()).hexdigest()
+
+
+def make_deterministic(game) -> None:
+    """Turn off the wall-clock driven parts of the simulation."""
+    game.path_planner.threaded = False
+    game.path_planner.request_limit = REPLAY_PATHS_PER_FRAME
+    # rebuilding weather particles for a new tier draws from the seeded RNG
+    QUALITY.auto = False
+
+
+class InputRecorder:
+    """Append one JSON line per frame to ``path``."""
+
+    def __init__(self, path: str, seed: int, player_file: str) -> None:
+        self.file = open(path, "w")
+        self.frames = 0
+        self._write(
+            {
+                "version": REPLAY_VERSION,
+                "seed": seed,
+                "player": player_file,
+                "tick_rate": settings.SIM_TICK_RATE,
+            }
+        )
+
+    def _write(self, data: Dict) -> None:
+        self.file.write(json.dumps(data, separators=(",", ":")) + "\n")
+
+    def record(
+        self, steps: int, events: Sequence[pygame.event.Event], keys: Sequence[int]
+    ) -> None:
+        self._write(
+            {
+                "steps": steps,
+                "events": [serialize_event(e) for e in events],
+                "keys": list(keys),
+            }
+        )
+        self.frames += 1
+
+    def record_menu(self, events: Sequence[pygame.event.Event]) -> None:
+        """Save the events one pass of a blocking menu loop read."""
+        self._write({"menu": [serialize_event(e) for e in events]})
+
+    def close(self, digest: Optional[str] = None) -> None:
+        self._write({"end": True, "frames": self.frames, "digest": digest})
+        self.file.close()
+
+
+class InputReplay:
+    """Read back a recording frame by frame."""
+
+    def __init__(self, path: str) -> None:
+        self.file = open(path)
+        header = json.loads(self.file.readline())
+        if header.get("version") != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version in {path}")
+        self.seed = header["seed"]
+        self.player_file = header["player"]
+        self.tick_rate = header["tick_rate"]
+        self.frames = 0
+        self.digest: Optional[str] = None
+
+    def next_frame(self) -> Optional[Frame]:
+        """Return ``(steps, events, keys)`` or None once the recording ends."""
+        line = self.file.readline()
+        if not line:
+            return None
+        data = json.loads(line)
+        if data.get("end"):
+            self.digest = data.get("digest")
+            return None
+        if "menu" in data:
+            raise ValueError(
+                f"replay diverged at frame {self.frames}: the recording has "
+                "menu input but no menu is open"
+            )
+        self.frames += 1
+        events = [deserialize_event(e) for e in data["events"]]
+        return data["steps"], events, data["keys"]
+
+    def next_menu_events(self) -> List[pygame.event.Event]:
+        """Return the events for one pass of a blocking menu loop.
+
+        Raises ``ValueError`` if the recording has no menu input here, as
+        the replay can no longer match the recorded session.
+        """
+        line = self.file.readline()
+        data = json.loads(line) if line else {"end": True}
+        if "menu" not in data:
+            raise ValueError(
+                f"replay diverged at frame {self.frames}: a menu opened "
+                "that the recording does not have"
+            )
+        return [deserialize_event(e) for e in data["menu"]]
+
+    def finish(self) -> None:
+        """Skip to the end of the recording to read its digest, then close."""
+        for line in self.file:
+            data = json.loads(line)
+            if data.get("end"):
+                self.digest = data.get("digest")
+        self.file.close()
+
+
+def _boot(seed: int, player_file: str):
+    from game import Game
+    from helpers import load_game
+
+    player = load_game(player_file)
+    if player is None:
+        raise FileNotFoundError(player_file)
+    seed_rngs(seed)
+    game = Game(player=player)
+    make_deterministic(game)
+    return game
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m game")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--record", metavar="PATH")
+    mode.add_argument("--replay", metavar="PATH")
+    parser.add_argument("--player", default=DEFAULT_PLAYER_FILE)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--headless", action="store_true", help="use SDL's dummy drivers"
+    )
+    args = parser.parse_args(argv)
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    if args.record:
+        seed = args.seed
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        game = _boot(seed, args.player)
+        recorder = InputRecorder(args.record, seed, args.player)
+        game.run(recorder=recorder)
+        recorder.close(state_digest(game))
+        print(f"recorded {recorder.frames} frames to {args.record}")
+        return 0
+
+    replay = InputReplay(args.replay)
+    if replay.tick_rate != settings.SIM_TICK_RATE:
+        print(
+            f"warning: recorded at {replay.tick_rate} Hz, "
+            f"running at {settings.SIM_TICK_RATE} Hz"
+        )
+    game = _boot(replay.seed, replay.player_file)
+    game.run(replay=replay)
+    replay.finish()
+    digest = state_digest(game)
+    matched = replay.digest is None or replay.digest == digest
+    outcome = "identical" if matched else "DIVERGED"
+    print(f"replayed {replay.frames} frames: {outcome}")
+    return 0 if matched else 1
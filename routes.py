@@ -0,0 +1,164 @@
+"""Precomputed shortest routes between building entrances.
+
+NPCs only ever travel between buildings, so instead of running A* whenever a
+schedule changes, :class:`RouteTable` floods the :class:`~pathfinding.NavGrid`
+once from every entrance and keeps the path between each pair. An NPC joins
+the table with a short breadth-first search from its current tile to the
+nearest tile on any stored route into its destination.
+
+The game only builds a table when NumPy is missing; with NumPy the shared
+:class:`~flowfield.FlowFieldCache` fields answer every lookup instead.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pathfinding import Coord, NavGrid
+
+# Largest number of steps the local search takes to reach a stored route
+JOIN_RADIUS = 12
+
+
+class RouteTable:
+    """All-pairs building entrance routes over a :class:`NavGrid`.
+
+    The table remembers the grid version and the building rects it was built
+    from and rebuilds itself on the next lookup once either changes, so
+    adding, removing, moving or replacing a building all invalidate it.
+    """
+
+    def __init__(
+        self,
+        grid: NavGrid,
+        buildings: Sequence,
+        join_radius: int = JOIN_RADIUS,
+    ) -> None:
+        self.grid = grid
+        self.buildings = buildings
+        self.join_radius = join_radius
+        self.entrances: List[int] = []
+        self.index: Dict[int, int] = {}  # id(building) -> entrance index
+        # (source, destination) -> node ids after the source entrance
+        self.routes: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        # destination -> node -> (source, index of the route step after node)
+        self.joins: Dict[int, Dict[int, Tuple[int, int]]] = {}
+        self.key: Optional[Tuple] = None
+        self.build_seconds = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.build()
+
+    def _key(self) -> Tuple:
+        return (
+            self.grid.version,
+            tuple((id(b), tuple(b.rect)) for b in self.buildings),
+        )
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup."""
+        self.key = None
+
+    def build(self) -> None:
+        """Flood the grid from every entrance and store all pair routes."""
+        start_time = time.perf_counter()
+        grid = self.grid
+        self.entrances = []
+        self.index = {}
+        for i, b in enumerate(self.buildings):
+            entrance = grid.entrances.get(id(b))
+            if entrance is None:
+                entrance = grid.node(*grid.entrance_tile(b.rect))
+            self.entrances.append(entrance)
+            self.index[id(b)] = i
+
+        self.routes = {}
+        self.joins = {j: {} for j in range(len(self.entrances))}
+        for i, source in enumerate(self.entrances):
+            parent = grid.flood(source)
+            for j, goal in enumerate(self.entrances):
+                if j == i or goal == source or parent[goal] < 0:
+                    continue
+                route = []
+                node = goal
+                while node != source:
+                    route.append(node)
+                    node = parent[node]
+                route.reverse()
+                self.routes[(i, j)] = tuple(route)
+
+        # Index every route tile so NPCs can join at the one closest to them
+        for (i, j), route in self.routes.items():
+            join = self.joins[j]
+            remaining = len(route)
+            for k, node in enumerate(((self.entrances[i],) + route)[:-1]):
+                best = join.get(node)
+                if best is None or remaining - k < self._remaining(best, j):
+                    join[node] = (i, k)
+
+        self.key = self._key()
+        self.build_seconds = time.perf_counter() - start_time
+
+    def _remaining(self, join: Tuple[int, int], j: int) -> int:
+        i, k = join
+        return len(self.routes[(i, j)]) - k
+
+    def _local_join(
+        self, start: int, join: Dict[int, Tuple[int, int]]
+    ) -> Optional[Tuple[List[int], int]]:
+        """Breadth-first search from ``start`` to the nearest route tile."""
+        if start in join:
+            return [], start
+        walkable = self.grid.walkable
+        offsets = self.grid.offsets
+        parent = {start: start}
+        frontier = [start]
+        for _ in range(self.join_radius):
+            next_frontier = []
+            for current in frontier:
+                for offset in offsets:
+                    n = current + offset
+                    if not walkable[n] or n in parent:
+                        continue
+                    parent[n] = current
+                    if n in join:
+                        steps = [n]
+                        while parent[steps[-1]] != start:
+                            steps.append(parent[steps[-1]])
+                        steps.reverse()
+                        return steps, n
+                    next_frontier.append(n)
+            frontier = next_frontier
+        return None
+
+    def path(self, start: Coord, building) -> List[Coord]:
+        """Return pixel steps from ``start`` to the entrance of ``building``."""
+        if self.key != self._key():
+            self.build()
+        grid = self.grid
+        start_node = grid.node_at(start)
+        j = self.index.get(id(building))
+        if j is None:
+            goal = grid.node(*grid.entrance_tile(building.rect))
+            return grid.to_pixels(grid.search(start_node, goal))
+        goal = self.entrances[j]
+        if start_node == goal:
+            return []
+        joined = self._local_join(start_node, self.joins[j])
+        if joined is None:
+            self.misses += 1
+            return grid.to_pixels(grid.search(start_node, goal))
+        self.hits += 1
+        steps, node = joined
+        i, k = self.joins[j][node]
+        return grid.to_pixels(steps + list(self.routes[(i, j)][k:]))
+
+    def stats(self) -> Dict[str, float]:
+        """Return build time and lookup counters."""
+        return {
+            "build_ms": self.build_seconds * 1000.0,
+            "routes": len(self.routes),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
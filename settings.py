@@ -32,6 +32,8 @@ SHADOW_COLOR = (40, 40, 40, 60)
 TREE_COLOR = (80, 140, 60)
 TRUNK_COLOR = (110, 80, 50)
 FLOWER_COLORS = [(255, 100, 100), (255, 255, 120), (200, 100, 200)]
+STREET_LAMP_POST_COLOR = (60, 60, 70)
+STREET_LAMP_HEAD_COLOR = (250, 235, 180)
 
 
 # Asset directories
@@ -40,6 +42,8 @@ IMAGE_DIR = os.path.join(ASSETS_DIR, "images")
 SOUND_DIR = os.path.join(ASSETS_DIR, "sounds")
 BUILDING_IMAGE_DIR = os.path.join(IMAGE_DIR, "buildings")
 BUILDING_WINDOW_LAYER = "window_layer.svg"
+# Fill color of the window panes in the building sprites
+BUILDING_WINDOW_FILL = "#f0f9ff"
 
 # Mapping of building types to sprite filenames
 BUILDING_SPRITES = {
@@ -69,8 +73,79 @@ BUILDING_SPRITES = {
 
 FONT_COLOR = (30, 30, 30)
 UI_BG = (255, 255, 255, 230)
+# In-game minutes that pass per simulation tick
 MINUTES_PER_FRAME = 0.1
 
+# Fixed simulation updates per second of wall time, the most updates run to
+# catch up before a frame is drawn, and the render frame cap: 30, 60, 144 or
+# 0 for uncapped
+SIM_TICK_RATE = 60
+MAX_CATCHUP_STEPS = 5
+RENDER_FPS = 60
+
+# Milliseconds per frame spent planning queued NPC paths, and whether the
+# searches run on a background worker thread instead
+PATH_BUDGET_MS = 2.0
+PATH_WORKER_THREAD = False
+
+# NPC simulation ticks per second of wall time, independent of the frame
+# rate, and the most ticks one update may run to catch up after a stall
+NPC_TICK_RATE = 60
+MAX_NPC_TICKS_PER_UPDATE = 5
+
+# Per-subsystem frame profiler: collect from startup, samples kept per
+# subsystem and where the F4 export writes its CSV
+PROFILER_ENABLED = False
+PROFILE_SAMPLES = 600
+PROFILE_CSV_FILE = "profile.csv"
+
+# Visual effect tiers from best to cheapest. window_layers caps the parallax
+# window-light layers per window, particle_density scales rain and snow, and
+# clouds, shadows and gradients switch the sky cloud layer, building drop
+# shadows and the sky and building gradients on or off.
+QUALITY_TIERS = [
+    {
+        "name": "high",
+        "window_layers": 3,
+        "particle_density": 1.0,
+        "clouds": True,
+        "shadows": True,
+        "gradients": True,
+    },
+    {
+        "name": "medium",
+        "window_layers": 2,
+        "particle_density": 0.6,
+        "clouds": True,
+        "shadows": True,
+        "gradients": True,
+    },
+    {
+        "name": "low",
+        "window_layers": 1,
+        "particle_density": 0.35,
+        "clouds": False,
+        "shadows": False,
+        "gradients": True,
+    },
+    {
+        "name": "minimal",
+        "window_layers": 0,
+        "particle_density": 0.15,
+        "clouds": False,
+        "shadows": False,
+        "gradients": False,
+    },
+]
+# Tier to start in and whether the governor may change it. When the average
+# frame time over the last QUALITY_WINDOW frames exceeds the budget it drops
+# a tier; an average under QUALITY_RAISE_RATIO of the budget raises one.
+QUALITY_TIER = 0
+QUALITY_AUTO = True
+QUALITY_BUDGET_MS = 16.0
+QUALITY_RAISE_RATIO = 0.6
+QUALITY_WINDOW = 90
+
 # Simple audio settings and asset locations
 MUSIC_FILE = os.path.join(SOUND_DIR, "music.wav")
 STEP_SOUND_FILE = os.path.join(SOUND_DIR, "step.wav")
@@ -90,6 +165,8 @@ KEY_BINDINGS = {
     "move_right": [pygame.K_d, pygame.K_RIGHT],
     "interact": [pygame.K_e],
     "run": [pygame.K_LSHIFT, pygame.K_RSHIFT],
+    "profiler": [pygame.K_F3],
+    "profiler_export": [pygame.K_F4],
 }
 
 
@@ -0,0 +1,139 @@
+"""Uniform grid spatial hash for world entities."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+import pygame
+
+Cell = Tuple[int, int]
+
+# Default cell edge in world pixels
+CELL_SIZE = 256
+
+
+class SpatialHash:
+    """Bucket entities by the grid cells their rects overlap.
+
+    Entities are tracked by identity so unhashable dataclasses such as
+    :class:`entities.Building` can be stored. Query results keep insertion
+    order so callers can rely on a stable drawing order.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, Set[int]] = {}
+        # id(item) -> (insertion order, item, rect, cells)
+        self.entries: Dict[int, Tuple[int, Any, pygame.Rect, List[Cell]]] = {}
+        self._counter = 0
+        # Bumped on every insert, move and removal so caches can notice
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self.entries
+
+    def _cells_for(self, rect: pygame.Rect) -> List[Cell]:
+        size = self.cell_size
+        x0 = rect.left // size
+        y0 = rect.top // size
+        # rects are half-open, so the last covered pixel is right - 1
+        x1 = (rect.right - 1) // size if rect.width else x0
+        y1 = (rect.bottom - 1) // size if rect.height else y0
+        return [(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)]
+
+    def insert(self, item: Any, rect: pygame.Rect) -> None:
+        """Add ``item`` covering ``rect``; re-inserting moves it."""
+        key = id(item)
+        if key in self.entries:
+            self.move(item, rect)
+            return
+        rect = pygame.Rect(rect)
+        cells = self._cells_for(rect)
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(key)
+        self.entries[key] = (self._counter, item, rect, cells)
+        self._counter += 1
+        self.version += 1
+
+    def remove(self, item: Any) -> None:
+        entry = self.entries.pop(id(item), None)
+        if entry is None:
+            return
+        self.version += 1
+        for cell in entry[3]:
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.discard(id(item))
+                if not bucket:
+                    del self.cells[cell]
+
+    def move(self, item: Any, rect: pygame.Rect) -> None:
+        """Update the rect of ``item``, touching buckets only if cells change."""
+        key = id(item)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.insert(item, rect)
+            return
+        order, _, old_rect, old_cells = entry
+        if old_rect == rect:
+            return
+        rect = pygame.Rect(rect)
+        cells = self._cells_for(rect)
+        if cells != old_cells:
+            for cell in old_cells:
+                bucket = self.cells.get(cell)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self.cells[cell]
+            for cell in cells:
+                self.cells.setdefault(cell, set()).add(key)
+        self.entries[key] = (order, item, rect, cells)
+        self.version += 1
+
+    def rect_of(self, item: Any) -> pygame.Rect:
+        return self.entries[id(item)][2]
+
+    def _candidates(self, rect: pygame.Rect) -> Iterator[int]:
+        seen: Set[int] = set()
+        for cell in self._cells_for(rect):
+            for key in self.cells.get(cell, ()):
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def query_rect(self, rect: pygame.Rect) -> List[Any]:
+        """Return items whose rects overlap ``rect`` in insertion order."""
+        rect = pygame.Rect(rect)
+        hits = []
+        for key in self._candidates(rect):
+            entry = self.entries[key]
+            if entry[2].colliderect(rect):
+                hits.append(entry)
+        hits.sort(key=lambda e: e[0])
+        return [e[1] for e in hits]
+
+    def query_radius(self, center: Tuple[int, int], radius: float) -> List[Any]:
+        """Return items whose rects come within ``radius`` of ``center``."""
+        cx, cy = center
+        r = int(radius) + 1
+        limit = radius * radius
+        hits = []
+        for key in self._candidates(pygame.Rect(cx - r, cy - r, 2 * r, 2 * r)):
+            entry = self.entries[key]
+            rect = entry[2]
+            # distance from the center to the closest point of the rect
+            dx = max(rect.left - cx, 0, cx - (rect.right - 1))
+            dy = max(rect.top - cy, 0, cy - (rect.bottom - 1))
+            if dx * dx + dy * dy <= limit:
+                hits.append(entry)
+        hits.sort(key=lambda e: e[0])
+        return [e[1] for e in hits]
+
+    def first_overlapping(self, rect: pygame.Rect) -> Any:
+        """Return the earliest inserted item overlapping ``rect`` or None."""
+        hits = self.query_rect(rect)
+        return hits[0] if hits else None
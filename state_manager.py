@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+from profiler import profiled
+
 
 class GameState:
     """Base class for individual game states."""
@@ -36,14 +38,17 @@ class StateManager:
         self.state = new_state
         self.state.on_enter()
 
+    @profiled("state.handle_events")
     def handle_events(self, events) -> None:
         if self.state:
             self.state.handle_events(events)
 
+    @profiled("state.update")
     def update(self) -> None:
         if self.state:
             self.state.update()
 
+    @profiled("state.render")
     def render(self, screen) -> None:
         if self.state:
             self.state.render(screen)
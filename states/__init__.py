@@ -22,15 +22,18 @@ from rendering import (
     draw_sky,
     draw_ui,
     draw_quest_marker,
+    draw_profiler_overlay,
+    night_alpha_for,
 )
 from settings import MINUTES_PER_FRAME, SCREEN_WIDTH, SCREEN_HEIGHT, MAP_WIDTH, MAP_HEIGHT, KEY_BINDINGS
 from helpers import quest_target_building
 
+from profiler import PROFILER
 from state_manager import GameState
-from pathfinding import find_path
 from entities import Player, NPC, Building
 from tilemap import TileMap
-from typing import List
+from timestep import lerp_point
+from typing import Dict, List, Optional, Tuple
 
 
 class PlayState(GameState):
@@ -38,6 +41,9 @@ class PlayState(GameState):
 
     def __init__(self, game) -> None:
         self.game = game
+        # positions before the latest update, for render interpolation
+        self.previous_player: Optional[Tuple[int, int]] = None
+        self.previous_npcs: Dict[int, Tuple[int, int]] = {}
 
     def on_enter(self) -> None:  # pragma: no cover - nothing special on enter
         pass
@@ -51,42 +57,57 @@ class PlayState(GameState):
                 self.game.running = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 self.game.state_manager.change_state(PauseState(self.game))
+            elif event.type == pygame.KEYDOWN and event.key in KEY_BINDINGS.get(
+                "profiler", []
+            ):
+                PROFILER.toggle_overlay()
+            elif event.type == pygame.KEYDOWN and event.key in KEY_BINDINGS.get(
+                "profiler_export", []
+            ):
+                PROFILER.export_csv()
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_e:
-                for b in self.game.buildings:
-                    if b.rect.colliderect(self.game.player.rect):
-                        if b.btype == "business":
-                            business_menu(self.game, self.game.player)
-                        elif b.btype == "shop":
-                            shop_menu(self.game, self.game.player)
-
-                        elif b.btype == "townhall":
-                            # Progress story when visiting Town Hall
-                            from quests import check_story, choose_story_branch
-
-                            if self.game.player.story_stage == 0:
-                                self.game.player.story_stage = 1
-                                check_story(self.game.player)
-                                if self.game.sound_enabled and self.game.enter_sound:
-                                    try:
-                                        self.game.enter_sound.play()
-                                    except Exception:
-                                        pass
-                            elif self.game.player.story_stage == 1 and not self.game.player.story_branch:
-                                # Default to mayor branch on confirm; simple progression
-                                choose_story_branch(self.game.player, "mayor")
-                                check_story(self.game.player)
-                                if self.game.sound_enabled and self.game.enter_sound:
-                                    try:
-                                        self.game.enter_sound.play()
-                                    except Exception:
-                                        pass
-                        elif b.btype == "petshop":
-                            pet_shop_menu(self.game, self.game.player)
-                        break
+                b = self.game.building_index.first_overlapping(self.game.player.rect)
+                if b is not None:
+                    if b.btype == "business":
+                        business_menu(self.game, self.game.player)
+                    elif b.btype == "shop":
+                        shop_menu(self.game, self.game.player)
+
+                    elif b.btype == "townhall":
+                        # Progress story when visiting Town Hall
+                        from quests import check_story, choose_story_branch
+
+                        if self.game.player.story_stage == 0:
+                            self.game.player.story_stage = 1
+                            check_story(self.game.player)
+                            if self.game.sound_enabled and self.game.enter_sound:
+                                try:
+                                    self.game.enter_sound.play()
+                                except Exception:
+                                    pass
+                        elif (
+                            self.game.player.story_stage == 1
+                            and not self.game.player.story_branch
+                        ):
+                            # Default to mayor branch on confirm; simple progression
+                            choose_story_branch(self.game.player, "mayor")
+                            check_story(self.game.player)
+                            if self.game.sound_enabled and self.game.enter_sound:
+                                try:
+                                    self.game.enter_sound.play()
+                                except Exception:
+                                    pass
+                    elif b.btype == "petshop":
+                        pet_shop_menu(self.game, self.game.player)
 
     def update(self) -> None:
         self.game.frame += 1
-        keys = pygame.key.get_pressed()
+        self.previous_player = self.game.player.rect.topleft
+        self.previous_npcs = {
+            id(npc): npc.bounds[:2]
+            for npc in self.game.camera.visible(self.game.npc_index)
+        }
+        keys = self.game.pressed_keys()
         speed = settings.PLAYER_SPEED
         if any(keys[k] for k in KEY_BINDINGS.get("run", [])) and getattr(
             self.game.player, "has_skateboard", False
@@ -119,41 +140,62 @@ class PlayState(GameState):
         # advance world time
         self.game.player.time = (self.game.player.time + MINUTES_PER_FRAME) % 1440
 
-        # update NPCs
-        update_npcs(
-            self.game.player,
-            self.game.npcs,
-            self.game.buildings,
-            self.game.tilemap,
+        # NPCs tick at their own fixed rate
+        self.game.npc_sim.update(
+            self.game.player, self.game.timestep.step, self.game.camera.rect
         )
 
+    def _interpolated(self, rect: pygame.Rect, previous) -> pygame.Rect:
+        """``rect`` blended from ``previous`` by the timestep's alpha."""
+        if previous is None:
+            return rect
+        x, y = lerp_point(previous, rect.topleft, self.game.timestep.alpha)
+        return pygame.Rect(x, y, rect.width, rect.height)
+
     def render(self, screen) -> None:
         player = self.game.player
+        camera = self.game.camera
+        player_rect = self._interpolated(player.rect, self.previous_player)
         # Camera follows player horizontally
-        cam_x = max(0, min(MAP_WIDTH - SCREEN_WIDTH, player.rect.centerx - SCREEN_WIDTH // 2))
-        cam_y = 0
+        camera.follow(player_rect, screen.get_size())
+        cam_x, cam_y = camera.x, camera.y
 
         # Sky and ground
         draw_sky(screen, player.time)
         draw_road_and_sidewalks(screen, cam_x, cam_y)
         draw_decorations(screen, cam_x, cam_y)
 
-        # Buildings
+        # Buildings, tinted for the night overlay drawn over them below
+        night_alpha = night_alpha_for(player.time)
         target = quest_target_building(player, self.game.buildings)
-        for b in self.game.buildings:
-            highlight = b is target or b.rect.colliderect(player.rect.inflate(12, 12))
-            # draw with camera offset by blitting to a temp surface via position adjustment
-            # draw_building expects world coordinates already on screen, so shift a subsurface
-            # Instead, temporarily shift rect during draw
-            original = b.rect
-            b.rect = pygame.Rect(b.rect.x - cam_x, b.rect.y - cam_y, b.rect.width, b.rect.height)
-            draw_building(screen, b, highlight=highlight, cam_x=cam_x, player=player, frame=self.game.frame)
-            b.rect = original
+        near_player = {
+            id(b)
+            for b in self.game.building_index.query_rect(player.rect.inflate(12, 12))
+        }
+        for b in camera.visible(self.game.building_index):
+            highlight = b is target or id(b) in near_player
+            draw_building(
+                screen,
+                b,
+                highlight=highlight,
+                cam_x=cam_x,
+                player=player,
+                frame=self.game.frame,
+                night_alpha=night_alpha,
+                cam_y=cam_y,
+            )
 
         # Player and NPCs
-        for npc in self.game.npcs:
-            draw_npc(screen, npc, self.game.font, offset=(-cam_x, -cam_y))
-        pr = player.rect.move(-cam_x, -cam_y)
+        previous_npcs = self.previous_npcs
+        for npc in camera.visible(self.game.npc_index):
+            offset = camera.offset
+            previous = previous_npcs.get(id(npc))
+            if previous is not None:
+                x, y = npc.bounds[:2]
+                px, py = lerp_point(previous, (x, y), self.game.timestep.alpha)
+                offset = (offset[0] + px - x, offset[1] + py - y)
+            draw_npc(screen, npc, self.game.font, offset=offset)
+        pr = player_rect.move(camera.offset)
         draw_player_sprite(
             screen,
             pr,
@@ -167,48 +209,21 @@ class PlayState(GameState):
         )
 
         # Night overlay and weather
-        night_alpha = draw_day_night(screen, player.time)
+        draw_day_night(screen, player.time, self.game.building_index, cam_x, cam_y)
         draw_weather(screen, player.weather)
 
         # Quest arrow and UI
         if target:
-            draw_quest_marker(screen, pr, target.rect, cam_x, cam_y)
+            draw_quest_marker(screen, player_rect, target.rect, cam_x, cam_y)
         draw_city_walls(screen, cam_x, cam_y)
         from quests import QUESTS, STORY_QUESTS
 
         draw_ui(screen, self.game.font, player, QUESTS, STORY_QUESTS)
+        if PROFILER.overlay:
+            draw_profiler_overlay(screen, self.game.font)
         pygame.display.flip()
 
 
-def update_npcs(
-    player: Player,
-    npcs: List[NPC],
-    buildings: List[Building],
-    tile_map: TileMap,
-) -> None:
-    """Update NPC destinations and advance their movement."""
-    hour = int(player.time) // 60
-    for npc in npcs:
-        target = npc.home
-        if npc.work and npc.work_start <= hour < npc.work_end:
-            target = npc.work
-        building = next((b for b in buildings if b.btype == target), None)
-        if building:
-            dest = (
-                building.rect.centerx - npc.rect.width // 2,
-                building.rect.centery - npc.rect.height // 2,
-            )
-            if npc.destination != dest:
-                npc.destination = dest
-                npc.path = find_path(tile_map, npc.rect.topleft, dest)
-        npc.move()
-        if npc.bubble_timer > 0:
-            npc.bubble_timer -= 1
-        if npc.rect.colliderect(player.rect.inflate(40, 40)):
-            npc.bubble_message = f"Hi {player.name}"
-            npc.bubble_timer = 60
-
-
 class PauseState(GameState):
     """Temporary state that shows the pause menu."""
 
@@ -235,4 +250,4 @@ class PauseState(GameState):
 
 from .dream_state import DreamState  # noqa: E402
 
-__all__ = ["PlayState", "PauseState", "DreamState", "update_npcs"]
+__all__ = ["PlayState", "PauseState", "DreamState"]
@@ -8,6 +8,7 @@ from typing import Dict, Tuple, List, Any
 import pygame
 
 from . import PlayState
+from fonts import render_text
 from inventory import dream_shop_purchase
 
 
@@ -96,8 +97,11 @@ class DreamState(PlayState):
         if not non_empty:
             return
         spacing = 12
-        rendered = [font.render(str(line), True, (255, 255, 255)) for line in non_empty]
-        total_height = sum(s.get_height() for s in rendered) + spacing * (len(rendered) - 1)
+        rendered = [
+            render_text(font, str(line), True, (255, 255, 255)) for line in non_empty
+        ]
+        total_height = sum(s.get_height() for s in rendered)
+        total_height += spacing * (len(rendered) - 1)
         current_y = screen.get_height() // 2 - total_height // 2
         render_iter = iter(rendered)
         for line in lines:
@@ -113,7 +117,8 @@ class DreamState(PlayState):
         base_x = int(screen.get_width() * 0.1)
         base_y = int(screen.get_height() * 0.6)
         line_height = font.get_height() + 6
-        shards_text = font.render(
+        shards_text = render_text(
+            font,
             f"Dream Shards: {self.game.player.dream_shards}", True, (255, 255, 200)
         )
         screen.blit(shards_text, (base_x, base_y))
@@ -130,13 +135,18 @@ class DreamState(PlayState):
                 color = (220, 140, 140)
             else:
                 color = (220, 220, 255)
-            screen.blit(font.render(label, True, color), (base_x, base_y))
+            screen.blit(render_text(font, label, True, color), (base_x, base_y))
             base_y += line_height
         instructions = "Press 1-9 to buy, Enter to wake"
-        screen.blit(font.render(instructions, True, (255, 255, 255)), (base_x, base_y))
+        screen.blit(
+            render_text(font, instructions, True, (255, 255, 255)), (base_x, base_y)
+        )
         if self.message:
             base_y += line_height
-            screen.blit(font.render(self.message, True, (255, 230, 160)), (base_x, base_y))
+            screen.blit(
+                render_text(font, self.message, True, (255, 230, 160)),
+                (base_x, base_y),
+            )
 
     def _attempt_purchase(self, index: int) -> None:
         if not self.shop_inventory:
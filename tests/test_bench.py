@@ -0,0 +1,35 @@
+import bench
+
+
+def test_route_walks_every_leg_at_player_speed():
+    positions = bench.route_positions(2000, 5)
+    assert len(positions) == 2000
+    steps = zip([bench.BENCH_ROUTE[0]] + positions, positions)
+    assert all(abs(x1 - x0) <= 5 and abs(y1 - y0) <= 5 for (x0, y0), (x1, y1) in steps)
+    assert bench.BENCH_ROUTE[1] in positions
+    assert bench.BENCH_ROUTE[2] in positions
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = {"scenarios": {"a": {"p95_ms": 10.0}, "b": {"p95_ms": 0.2}}}
+    results = {
+        "scenarios": {
+            "a": {"p95_ms": 13.0},
+            "b": {"p95_ms": 0.6},
+            "new": {"p95_ms": 99.0},
+        }
+    }
+    assert bench.compare(results, baseline) == [
+        "a: p95 13.00 ms > 12.50 ms (baseline 10.00 ms)"
+    ]
+    assert bench.compare(results, baseline, tolerance=0.5) == []
+
+
+def test_compare_scales_the_baseline_to_this_machine():
+    baseline = {"calibration_ms": 4.0, "scenarios": {"a": {"p95_ms": 10.0}}}
+    slower = {"calibration_ms": 8.0, "scenarios": {"a": {"p95_ms": 24.0}}}
+    assert bench.compare(slower, baseline) == []
+    faster = {"calibration_ms": 2.0, "scenarios": {"a": {"p95_ms": 7.0}}}
+    assert bench.compare(faster, baseline) == [
+        "a: p95 7.00 ms > 6.25 ms (baseline 5.00 ms)"
+    ]
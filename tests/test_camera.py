@@ -0,0 +1,43 @@
+import pygame
+
+import rendering
+from camera import Camera
+from entities import Building
+from spatial import SpatialHash
+
+
+def test_camera_follow_clamps_to_world():
+    cam = Camera(2000, 1000)
+    cam.follow(pygame.Rect(0, 0, 10, 10), (800, 600))
+    assert cam.rect == pygame.Rect(0, 0, 800, 600)
+    cam.follow(pygame.Rect(1990, 0, 10, 10), (800, 600))
+    assert cam.x == 1200
+    cam.follow(pygame.Rect(1000, 0, 10, 10), (800, 600))
+    assert cam.offset == (-605, 0)
+
+
+def test_visible_culls_offscreen_buildings():
+    near = Building(pygame.Rect(100, 100, 80, 80), "Near", "shop")
+    far = Building(pygame.Rect(3000, 100, 80, 80), "Far", "shop")
+    index = SpatialHash()
+    for b in (near, far):
+        index.insert(b, b.rect)
+    cam = Camera(4000, 1000)
+    cam.move_to(0, 0, (800, 600))
+    assert cam.visible(index) == [near]
+    cam.move_to(2600, 0, (800, 600))
+    assert cam.visible(index) == [far]
+
+
+def test_draw_building_uses_camera_offset():
+    b = Building(pygame.Rect(500, 100, 80, 80), "Shop", "shop")
+    world = b.rect.copy()
+    shifted = pygame.Surface((400, 300))
+    rendering.draw_building(shifted, b, cam_x=400, cam_y=0)
+    direct = pygame.Surface((400, 300))
+    moved = Building(pygame.Rect(100, 100, 80, 80), "Shop", "shop")
+    rendering.draw_building(direct, moved)
+    assert b.rect == world
+    assert pygame.image.tostring(shifted, "RGB") == pygame.image.tostring(
+        direct, "RGB"
+    )
@@ -0,0 +1,89 @@
+import pygame
+import pytest
+
+from crowd import Crowd, _bench_npcs
+from entities import NPC
+
+pytest.importorskip("numpy")
+
+
+def test_step_matches_npc_move():
+    plain = _bench_npcs(50, seed=2)
+    crowd = Crowd(capacity=4)
+    viewed = _bench_npcs(50, seed=2)
+    for npc in viewed:
+        crowd.add(npc)
+    for _ in range(200):
+        for npc in plain:
+            npc.move()
+        crowd.step()
+    for a, b in zip(plain, viewed):
+        assert a.rect == b.rect
+        assert a.path == b.path
+
+
+def test_npc_is_a_view_into_the_arrays():
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "Sam", path=[(8, 0)], speed=4)
+    crowd = Crowd()
+    slot = crowd.add(npc)
+    crowd.pos[slot] = (100, 60)
+    assert npc.rect == pygame.Rect(100, 60, 40, 40)
+    npc.rect = pygame.Rect(0, 0, 40, 40)
+    npc.move()
+    assert tuple(crowd.pos[slot]) == (4, 0)
+    npc.path = [(0, 40), (40, 40)]
+    assert npc.path == [(0, 40), (40, 40)]
+    npc.speed = 40
+    crowd.step()
+    assert npc.rect.topleft == (0, 40)
+    assert npc.path == [(40, 40)]
+
+
+def test_in_place_changes_reach_the_arrays():
+    crowd = Crowd()
+    npc = NPC(pygame.Rect(10, 10, 20, 20), "A")
+    crowd.add(npc)
+    npc.rect.x += 50
+    npc.rect.move_ip(0, 5)
+    npc.path.append((100, 15))
+    npc.path.append((100, 40))
+    del npc.path[0]
+    assert npc.rect == pygame.Rect(60, 15, 20, 20)
+    assert npc.path == [(100, 40)]
+    assert crowd.pos[npc.slot].tolist() == [60, 15]
+    crowd.remove(npc)
+    assert type(npc.rect) is pygame.Rect and type(npc.path) is list
+    assert npc.path == [(100, 40)]
+
+
+def test_bounds_read_the_arrays_without_a_rect(monkeypatch):
+    crowd = Crowd()
+    npcs = _bench_npcs(3)
+    for npc in npcs:
+        crowd.add(npc)
+    crowd.step()
+    expected = [list(npc.rect) for npc in npcs]
+    monkeypatch.setattr(crowd, "rect_of", None)
+    assert [list(npc.bounds) for npc in npcs] == expected
+    assert crowd.bounds_many([2, 0]) == [expected[2], expected[0]]
+    plain = NPC(pygame.Rect(1, 2, 3, 4), "B")
+    assert plain.bounds == (1, 2, 3, 4)
+
+
+def test_remove_restores_plain_npc_and_compacts_paths():
+    crowd = Crowd()
+    npcs = _bench_npcs(3)
+    for npc in npcs:
+        crowd.add(npc)
+    first = npcs[0]
+    rect, path = first.rect, first.path
+    crowd.remove(first)
+    assert first.crowd is None
+    assert first.rect == rect and first.path == path
+    assert npcs[2].slot == 0 and crowd.npcs[0] is npcs[2]
+    # force the shared buffer to compact and grow
+    before = npcs[1].path
+    for _ in range(40):
+        npcs[2].path = [(0, 0)] * 100
+    assert npcs[1].path == before
+    assert npcs[2].path == [(0, 0)] * 100
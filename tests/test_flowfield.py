@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from entities import Building
+from flowfield import FlowFieldCache
+from pathfinding import NavGrid, find_path
+
+pytest.importorskip("numpy")
+
+
+def _city():
+    tm = SimpleNamespace(width=12, height=8, tilewidth=40, tileheight=40)
+    tm.layers = [[1] * 96]
+    for y in range(6):
+        tm.layers[0][y * 12 + 6] = 7  # water wall with a gap at the bottom
+    buildings = [
+        Building(pygame.Rect(40, 40, 120, 120), "Home", "home"),
+        Building(pygame.Rect(320, 40, 120, 120), "Shop", "shop"),
+    ]
+    return NavGrid.from_tilemap(tm, buildings), buildings
+
+
+def test_field_paths_are_shortest_from_anywhere():
+    grid, buildings = _city()
+    cache = FlowFieldCache(grid)
+    shop = buildings[1]
+    goal = grid.to_pixels([grid.entrances[id(shop)]])[0]
+    for start in [(0, 0), (0, 280), (440, 280), (200, 40)]:
+        path = cache.path(start, shop)
+        assert path[-1] == goal
+        assert len(path) == len(find_path(grid, start, goal))
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 3
+
+
+def test_npc_inside_building_leaves_through_field():
+    grid, buildings = _city()
+    cache = FlowFieldCache(grid)
+    # top-left corner of the home building is blocked
+    assert not grid.is_walkable(1, 1)
+    path = cache.path((40, 40), buildings[1])
+    assert path and grid.is_walkable(path[0][0] // 40, path[0][1] // 40)
+
+
+def test_lru_eviction_and_grid_changes():
+    grid, buildings = _city()
+    cache = FlowFieldCache(grid, max_fields=1)
+    home, shop = buildings
+    first = cache.field(home)
+    cache.field(shop)
+    assert cache.stats()["evictions"] == 1
+    assert cache.field(home) is not first
+    current = cache.field(home)
+    grid.set_walkable(0, 7, False)
+    assert current.stale
+    assert cache.field(home) is not current
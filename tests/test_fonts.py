@@ -0,0 +1,42 @@
+import pygame
+
+import settings
+from fonts import TextCache
+from helpers import scaled_font
+
+pygame.font.init()
+
+
+def test_fonts_memoized_by_scaled_size(monkeypatch):
+    assert scaled_font(28) is scaled_font(28)
+    half = scaled_font(14)
+    monkeypatch.setattr(settings, "SCREEN_HEIGHT", settings.SCREEN_HEIGHT * 2)
+    assert scaled_font(7) is half
+
+
+def test_render_cache_hits_and_keys():
+    cache = TextCache()
+    font = cache.font(20)
+    first = cache.render(font, "Money: $50", True, (0, 0, 0))
+    assert cache.render(font, "Money: $50", True, (0, 0, 0)) is first
+    assert cache.render(font, "Money: $50", True, (255, 0, 0)) is not first
+    assert cache.render(font, "Money: $50", False, (0, 0, 0)) is not first
+    assert cache.render(cache.font(24), "Money: $50", True, (0, 0, 0)) is not first
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 4
+    assert stats["surfaces"] == 4
+
+
+def test_render_cache_evicts_least_recently_used():
+    cache = TextCache(max_entries=2)
+    font = cache.font(20)
+    a = cache.render(font, "a", True, (0, 0, 0))
+    cache.render(font, "b", True, (0, 0, 0))
+    cache.render(font, "a", True, (0, 0, 0))
+    cache.render(font, "c", True, (0, 0, 0))
+    assert cache.stats()["evictions"] == 1
+    assert cache.render(font, "a", True, (0, 0, 0)) is a
+    misses = cache.misses
+    cache.render(font, "b", True, (0, 0, 0))
+    assert cache.misses == misses + 1
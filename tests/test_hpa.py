@@ -0,0 +1,61 @@
+from hpa import HierarchicalPathfinder, bench_grid
+from pathfinding import NavGrid
+
+
+def _assert_walk(grid, start, steps):
+    prev = start
+    for node in steps:
+        assert grid.walkable[node]
+        assert abs(node - prev) in (1, grid.stride)
+        prev = node
+
+
+def test_entrances_cover_open_borders():
+    grid = NavGrid(32, 16, 40, 40)
+    hpa = HierarchicalPathfinder(grid, cluster_size=16)
+    # one wide gap along the only border gives an entrance at each end
+    assert len(hpa.edges) == 4
+    assert hpa.cluster_nodes[0] == [grid.node(15, 0), grid.node(15, 15)]
+
+
+def test_paths_match_astar_on_generated_map():
+    grid = bench_grid(96, 64, seed=3)
+    hpa = HierarchicalPathfinder(grid, cluster_size=16)
+    pairs = [
+        (grid.node(x, y), grid.node(95 - x, 63 - y))
+        for x, y in [(0, 0), (5, 40), (30, 2), (47, 31)]
+    ]
+    for start, goal in pairs:
+        if not (grid.walkable[start] and grid.walkable[goal]):
+            continue
+        exact = grid.search(start, goal)
+        approx = hpa.search(start, goal)
+        assert bool(exact) == bool(approx)
+        if exact:
+            assert approx[-1] == goal
+            _assert_walk(grid, start, approx)
+            assert len(approx) <= len(exact) * 1.2
+
+
+def test_same_cluster_and_rebuild_after_edit():
+    grid = NavGrid(32, 32, 40, 40)
+    hpa = HierarchicalPathfinder(grid, cluster_size=16)
+    start, goal = grid.node(1, 1), grid.node(4, 1)
+    assert hpa.search(start, goal) == grid.search(start, goal)
+    # wall off the cluster border except one tile
+    for y in range(32):
+        if y != 30:
+            grid.set_walkable(16, y, False)
+    start, goal = grid.node(2, 2), grid.node(30, 2)
+    path = hpa.search(start, goal)
+    assert grid.node(16, 30) in path
+    _assert_walk(grid, start, path)
+    assert len(path) == len(grid.search(start, goal))
+
+
+def test_pixel_wrapper():
+    grid = NavGrid(40, 20, 40, 40)
+    hpa = HierarchicalPathfinder(grid, cluster_size=8)
+    path = hpa.find_path((0, 0), (39 * 40, 19 * 40))
+    assert path[-1] == (39 * 40, 19 * 40)
+    assert len(path) == 39 + 19
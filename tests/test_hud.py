@@ -0,0 +1,59 @@
+import pygame
+
+import settings
+from entities import Player
+from helpers import scaled_font
+from hud import HUD, BAR_HEIGHT
+
+pygame.font.init()
+
+
+def make_player():
+    return Player(pygame.Rect(0, 0, settings.PLAYER_SIZE, settings.PLAYER_SIZE))
+
+
+def test_first_frame_repaints_whole_bar():
+    hud = HUD()
+    dirty = hud.update(make_player(), scaled_font(28))
+    assert dirty == [pygame.Rect(0, 0, settings.SCREEN_WIDTH, BAR_HEIGHT)]
+
+
+def test_unchanged_player_costs_no_repaint():
+    hud = HUD()
+    player = make_player()
+    font = scaled_font(28)
+    hud.update(player, font)
+    bar = hud.bar
+    assert hud.update(player, font) == []
+    assert hud.bar is bar
+    # sub-minute time changes do not alter the displayed clock
+    player.time += 0.1
+    assert hud.update(player, font) == []
+
+
+def test_only_changed_widgets_are_repainted():
+    hud = HUD()
+    player = make_player()
+    font = scaled_font(28)
+    hud.update(player, font)
+    player.cards.append("Dart Master")
+    dirty = hud.update(player, font)
+    assert len(dirty) == 1
+    assert dirty[0].y == 20 and dirty[0].right == settings.SCREEN_WIDTH - 20
+    player.energy -= 30
+    dirty = hud.update(player, font)
+    # the stats line and the energy meter both show energy
+    assert len(dirty) == 2
+    assert pygame.Rect(16, 44, 100, 10) in dirty
+
+
+def test_quest_panel_reported_when_text_changes():
+    hud = HUD()
+    player = make_player()
+    font = scaled_font(28)
+    screen = pygame.Surface((settings.SCREEN_WIDTH, 200))
+    dirty = hud.draw(screen, font, player, "Earn $200")
+    assert any(r.y == BAR_HEIGHT + 4 for r in dirty)
+    assert hud.draw(screen, font, player, "Earn $200") == []
+    dirty = hud.draw(screen, font, player, None)
+    assert [r.y for r in dirty] == [BAR_HEIGHT + 4]
@@ -0,0 +1,104 @@
+import pygame
+import pytest
+
+from crowd import Crowd, _bench_npcs
+from entities import NPC, Player
+from npc_lod import NPCLevelOfDetail, advance_npc
+from npc_sim import NPCSimulation
+
+
+def test_advance_matches_stepping():
+    stepped = _bench_npcs(20, seed=4)
+    jumped = _bench_npcs(20, seed=4)
+    for ticks in (1, 7, 10, 33, 500):
+        for npc in stepped:
+            for _ in range(ticks):
+                npc.move()
+        for npc in jumped:
+            advance_npc(npc, ticks)
+        for a, b in zip(stepped, jumped):
+            assert a.rect == b.rect
+            assert a.path == b.path
+
+
+def test_crowd_advance_matches_step():
+    pytest.importorskip("numpy")
+    stepped = Crowd()
+    jumped = Crowd()
+    for npc in _bench_npcs(20, seed=5):
+        stepped.add(npc)
+    for npc in _bench_npcs(20, seed=5):
+        jumped.add(npc)
+    for _ in range(45):
+        stepped.step()
+    for slot in range(20):
+        jumped.advance(slot, 45)
+    assert (stepped.pos[:20] == jumped.pos[:20]).all()
+    assert (stepped.waypoint[:20] == jumped.waypoint[:20]).all()
+
+
+def test_far_npcs_catch_up_exactly():
+    view = pygame.Rect(0, 0, 200, 200)
+    lod = NPCLevelOfDetail(far_interval=5, margin=0)
+    npcs = _bench_npcs(30, seed=6)
+    reference = _bench_npcs(30, seed=6)
+    for tick in range(1, 24):
+        near = lod.update(npcs, view, tick)
+        for npc in reference:
+            npc.move()
+        assert all(npc.rect.colliderect(view) for npc in near)
+    lod.sync_all(npcs)
+    for a, b in zip(npcs, reference):
+        assert a.rect == b.rect
+
+
+def test_tick_jump_advances_along_path():
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "Sam", path=[(400, 0), (400, 400)])
+    lod = NPCLevelOfDetail()
+    far = pygame.Rect(2000, 2000, 100, 100)
+    lod.update([npc], far, 1)
+    # 200 ticks at 4px a tick is enough for the whole path
+    lod.update([npc], far, 201)
+    assert npc.rect.topleft == (400, 400)
+    assert npc.path == []
+
+
+def test_npcs_move_every_npc_tick_above_the_sim_rate():
+    player = Player(pygame.Rect(0, 0, 40, 40))
+    near = NPC(pygame.Rect(0, 100, 40, 40), "Di", path=[(400, 100)])
+    far = NPC(pygame.Rect(2000, 0, 40, 40), "Ed", path=[(2400, 0)])
+    sim = NPCSimulation([], [near, far], None, lod=NPCLevelOfDetail(), tick_rate=120)
+    view = pygame.Rect(0, 0, 400, 400)
+    # the game clock stands still between the two NPC ticks of one frame
+    assert sim.update(player, dt=1 / 60, view=view) == 2
+    assert near.rect.x == 2 * near.speed
+    sim.lod.sync(far)
+    assert far.rect.x == 2000 + 2 * far.speed
+
+
+def test_greeting_near_player_with_lod():
+    player = Player(pygame.Rect(1000, 1000, 40, 40))
+    player.name = "Ana"
+    near = NPC(pygame.Rect(1030, 1000, 40, 40), "Bo")
+    far = NPC(pygame.Rect(0, 0, 40, 40), "Cy", path=[(0, 400)])
+    lod = NPCLevelOfDetail()
+    view = pygame.Rect(0, 0, 0, 0)
+    NPCSimulation([], [near, far], None, lod=lod).tick(player, view)
+    assert near.bubble_message == "Hi Ana"
+    assert far.bubble_message == ""
+
+
+def test_advance_many_matches_advance():
+    pytest.importorskip("numpy")
+    one = Crowd()
+    many = Crowd()
+    for npc in _bench_npcs(20, seed=7):
+        one.add(npc)
+    for npc in _bench_npcs(20, seed=7):
+        many.add(npc)
+    lags = [3 * i for i in range(20)]
+    for slot, lag in enumerate(lags):
+        one.advance(slot, lag)
+    many.advance_many(range(20), lags)
+    assert (one.pos[:20] == many.pos[:20]).all()
+    assert (one.waypoint[:20] == many.waypoint[:20]).all()
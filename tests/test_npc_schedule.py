@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import pygame
+
+from entities import Building, NPC
+from npc_schedule import NPCScheduler, on_shift
+from npc_sim import NPCSimulation
+
+
+def _buildings():
+    return [
+        Building(pygame.Rect(0, 0, 80, 80), "Suburbs", "suburbs"),
+        Building(pygame.Rect(400, 0, 80, 80), "Shop", "shop"),
+        Building(pygame.Rect(800, 0, 80, 80), "Bar", "bar"),
+    ]
+
+
+def test_on_shift_handles_overnight_hours():
+    day = NPC(pygame.Rect(0, 0, 40, 40), "D", work="shop", work_start=9, work_end=17)
+    night = NPC(pygame.Rect(0, 0, 40, 40), "N", work="bar", work_start=20, work_end=4)
+    assert on_shift(day, 9) and not on_shift(day, 17)
+    assert on_shift(night, 23) and on_shift(night, 2) and not on_shift(night, 12)
+
+
+def test_advance_fires_only_crossed_boundaries():
+    day = NPC(pygame.Rect(0, 0, 40, 40), "D", work="shop", work_start=9, work_end=17)
+    night = NPC(pygame.Rect(0, 0, 40, 40), "N", work="bar", work_start=20, work_end=4)
+    sched = NPCScheduler(_buildings(), [day, night])
+    assert sched.advance(8 * 60) == [day, night]
+    assert sched.advance(8 * 60 + 30.5) == []
+    assert sched.advance(9 * 60) == [day]
+    assert sched.target(day, 9).btype == "shop"
+    assert sched.advance(19 * 60) == [day]
+    # wrapping past midnight crosses 20:00 and 04:00
+    assert sched.advance(5 * 60) == [night]
+    sched.unregister(night)
+    assert sched.advance(21 * 60) == [day]
+
+
+def test_simulation_reroutes_on_boundaries_only():
+    buildings = _buildings()
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "D", work="shop", work_start=9, work_end=17)
+    sched = NPCScheduler(buildings, [npc])
+    tile_map = SimpleNamespace(width=30, height=5, tilewidth=40, tileheight=40)
+    player = SimpleNamespace(time=8 * 60, rect=pygame.Rect(2000, 0, 40, 40), name="P")
+    sim = NPCSimulation(buildings, [npc], tile_map, scheduler=sched)
+    sim.tick(player)
+    assert npc.destination == (20, 20)
+    npc.destination = (1, 1)  # only a fired boundary may change it
+    player.time = 8 * 60 + 59
+    sim.tick(player)
+    assert npc.destination == (1, 1)
+    player.time = 9 * 60
+    sim.tick(player)
+    assert npc.destination == (420, 20)
+    assert npc.path
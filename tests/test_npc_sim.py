@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import pygame
+
+import quests
+from entities import Building, NPC, Player
+from npc_sim import PHASES, NPCSimulation
+
+
+def _setup(**kwargs):
+    buildings = [
+        Building(pygame.Rect(0, 0, 80, 80), "Suburbs", "suburbs"),
+        Building(pygame.Rect(400, 0, 80, 80), "Shop", "shop"),
+    ]
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "D", work="shop", work_start=9, work_end=17)
+    tile_map = SimpleNamespace(width=30, height=5, tilewidth=40, tileheight=40)
+    sim = NPCSimulation(buildings, [npc], tile_map, **kwargs)
+    player = SimpleNamespace(time=10 * 60, rect=pygame.Rect(2000, 0, 40, 40), name="P")
+    return sim, npc, player
+
+
+def test_tick_count_follows_wall_time_not_calls():
+    sim, npc, player = _setup(tick_rate=20)
+    # 0.25 s in uneven frames is five 50 ms ticks
+    for dt in (0.01, 0.07, 0.02, 0.1, 0.05):
+        sim.update(player, dt)
+    assert sim.ticks == 5
+    assert npc.destination == (420, 20)
+
+
+def test_catch_up_is_capped():
+    sim, npc, player = _setup(tick_rate=60, max_ticks=3)
+    assert sim.update(player, 1.0) == 3
+    assert 56 <= sim.stats()["dropped_ticks"] <= 57
+    assert sim.update(player, 0.0) == 0
+
+
+def test_phase_timings_are_recorded():
+    sim, npc, player = _setup()
+    sim.tick(player)
+    last = sim.last_tick()
+    assert set(last) == set(PHASES)
+    assert all(ns >= 0 for ns in last.values())
+    assert last["pathing"] > 0
+    stats = sim.stats()
+    assert stats["ticks"] == 1 and "movement_ms" in stats
+
+
+def test_quest_update_uses_simulation():
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "D", work="shop", work_start=9, work_end=17)
+    buildings = [Building(pygame.Rect(400, 0, 80, 80), "Shop", "shop")]
+    player = Player(pygame.Rect(2000, 0, 40, 40), name="P")
+    player.time = 10 * 60
+    tile_map = SimpleNamespace(width=30, height=5, tilewidth=40, tileheight=40)
+    sim = NPCSimulation(buildings, [npc], tile_map)
+    quests.update_npcs(player, sim)
+    assert npc.destination == (420, 20)
+    assert npc.rect.topleft != (0, 0)
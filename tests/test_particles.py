@@ -0,0 +1,40 @@
+import pygame
+import pytest
+
+from particles import ParticleField, WeatherParticles, RAIN_COLOR
+
+pytest.importorskip("numpy")
+
+
+def test_density_scales_particle_count():
+    assert ParticleField("Rain", (400, 300)).count == 180
+    assert ParticleField("Rain", (400, 300), density=60).count == 10800
+    assert ParticleField("Snow", (400, 300), density=0.5).count == 60
+
+
+def test_step_moves_and_respawns_rain():
+    field = ParticleField("Rain", (400, 300), seed=1)
+    field.pos[:] = (100, 0)
+    field.pos[0] = (50, 295)
+    field.step()
+    assert tuple(field.pos[1]) == (97, 15)
+    # the first drop fell off the bottom and restarts above the screen
+    assert -40 <= field.pos[0, 1] <= 0
+
+
+def test_draw_writes_particle_pixels():
+    field = ParticleField("Rain", (400, 300), seed=1)
+    field.pos[:] = (100, 100)
+    screen = pygame.Surface((400, 300))
+    field.draw(screen)
+    assert tuple(screen.get_at((100, 100)))[:3] == RAIN_COLOR
+    assert tuple(screen.get_at((103, 108)))[:3] == RAIN_COLOR
+    assert tuple(screen.get_at((120, 100)))[:3] == (0, 0, 0)
+
+
+def test_weather_particles_reset_on_change():
+    weather = WeatherParticles()
+    rain = weather.update("Rain", (400, 300))
+    assert weather.update("Rain", (400, 300)) is rain
+    assert weather.update("Snow", (400, 300)).kind == "Snow"
+    assert weather.update("Clear", (400, 300)) is None
@@ -0,0 +1,88 @@
+import time
+
+import pygame
+
+from entities import NPC
+from path_planner import PathPlanner, plan_path
+from pathfinding import NavGrid
+
+
+class _Building:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 40, 40)
+
+
+def _slow_plan(delay):
+    def plan(start, building, dest):
+        time.sleep(delay)
+        return [dest]
+
+    return plan
+
+
+def test_budget_spreads_requests_over_frames():
+    planner = PathPlanner(_slow_plan(0.002), budget_ms=3.0)
+    npcs = [NPC(pygame.Rect(0, 0, 40, 40), f"N{i}") for i in range(6)]
+    for npc in npcs:
+        planner.request(npc, _Building(400, 0), (400, 0))
+    assert planner.depth == 6
+    assert all(npc.path == [] for npc in npcs)
+    planner.process()
+    assert 0 < planner.stats()["completed"] < 6
+    while planner.depth:
+        planner.process()
+    assert all(npc.path == [(400, 0)] for npc in npcs)
+    assert planner.stats()["latency_ms_max"] > 0
+
+
+def test_newer_request_supersedes_older():
+    planner = PathPlanner(lambda start, building, dest: [dest])
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "Sam")
+    planner.request(npc, _Building(80, 0), (80, 0))
+    planner.request(npc, _Building(160, 0), (160, 0))
+    planner.process()
+    assert npc.path == [(160, 0)]
+    assert planner.stats()["superseded"] == 1
+    assert planner.stats()["completed"] == 1
+
+
+def test_straight_fallback_until_path_arrives():
+    planner = PathPlanner(lambda s, b, d: [(40, 0), d], fallback="straight")
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "Sam")
+    planner.request(npc, _Building(80, 40), (80, 40))
+    assert npc.path == [(80, 40)]
+    planner.process()
+    assert npc.path == [(40, 0), (80, 40)]
+
+
+def test_worker_thread_delivers_on_process():
+    grid = NavGrid(10, 10, 40, 40)
+    planner = PathPlanner(
+        lambda start, building, dest: plan_path(start, building, dest, grid),
+        threaded=True,
+    )
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "Sam")
+    planner.request(npc, _Building(200, 0), (200, 0))
+    deadline = time.time() + 5
+    while planner.depth and time.time() < deadline:
+        planner.process()
+        time.sleep(0.001)
+    planner.close()
+    assert npc.path[-1] == (200, 0)
+    assert len(npc.path) == 5
+
+
+def test_worker_waits_for_the_planner_lock():
+    planner = PathPlanner(_slow_plan(0), threaded=True)
+    npc = NPC(pygame.Rect(0, 0, 40, 40), "Sam")
+    with planner.lock:
+        planner.request(npc, _Building(200, 0), (200, 0))
+        time.sleep(0.05)
+        planner.process()
+        assert planner.depth == 1
+    deadline = time.time() + 5
+    while planner.depth and time.time() < deadline:
+        planner.process()
+        time.sleep(0.001)
+    planner.close()
+    assert npc.path == [(200, 0)]
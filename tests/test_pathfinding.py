@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pygame
+
+from entities import Building
+from pathfinding import NavGrid, find_path
+
+
+def _open_map(width=10, height=6):
+    return SimpleNamespace(width=width, height=height, tilewidth=40, tileheight=40)
+
+
+def test_find_path_on_plain_map_is_manhattan():
+    path = find_path(_open_map(), (0, 0), (120, 80))
+    assert len(path) == 5
+    assert path[-1] == (120, 80)
+
+
+def test_layers_block_tiles():
+    tm = _open_map(5, 3)
+    tm.layers = [[1] * 15]
+    for y in range(2):
+        tm.layers[0][y * 5 + 2] = 7
+    grid = NavGrid.from_tilemap(tm)
+    assert not grid.is_walkable(2, 0)
+    path = find_path(grid, (0, 0), (160, 0))
+    assert (80, 80) in path
+    assert (80, 0) not in path and (80, 40) not in path
+
+
+def test_buildings_block_except_entrance():
+    shop = Building(pygame.Rect(120, 0, 120, 120), "Shop", "shop")
+    grid = NavGrid.from_tilemap(_open_map(), [shop])
+    assert not grid.is_walkable(3, 0)
+    assert not grid.is_walkable(5, 2)
+    # corridor from the center tile out of the bottom edge
+    assert grid.is_walkable(4, 1) and grid.is_walkable(4, 2)
+    assert grid.entrances[id(shop)] == grid.node(4, 1)
+    path = find_path(grid, (0, 0), (160, 40))
+    assert path[-1] == (160, 40)
+    assert (160, 120) in path
+    for x, y in path[:-2]:
+        assert not shop.rect.colliderect(pygame.Rect(x, y, 40, 40).inflate(-2, -2))
+
+
+def test_unreachable_goal_returns_empty():
+    tm = _open_map(5, 3)
+    tm.layers = [[1, 1, 7, 1, 1] * 3]
+    grid = NavGrid.from_tilemap(tm)
+    assert find_path(grid, (0, 0), (160, 0)) == []
+    assert find_path(grid, (0, 0), (80, 0)) == []
@@ -0,0 +1,75 @@
+import csv
+
+import pygame
+
+import rendering
+from fonts import TEXT_CACHE
+from profiler import Profiler, RingBuffer, percentile, profiled
+
+
+def test_ring_buffer_keeps_newest_samples():
+    buf = RingBuffer(3)
+    for value in range(5):
+        buf.append(value)
+    assert buf.values() == [2, 3, 4]
+    assert len(buf) == 3
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0
+
+
+def test_profiled_records_only_when_enabled():
+    prof = Profiler(capacity=8, enabled=False)
+
+    @profiled("work", prof)
+    def work(x):
+        return x * 2
+
+    assert work(2) == 4
+    assert prof.sections == {}
+    prof.enabled = True
+    assert work(3) == 6
+    assert len(prof.sections["work"]) == 1
+
+
+def test_summary_and_csv_export(tmp_path):
+    prof = Profiler(capacity=100, enabled=True)
+    for ms in range(1, 101):
+        prof.record("draw_sky", ms * 1_000_000)
+    row = prof.summary()["draw_sky"]
+    assert (row["p50_ms"], row["p95_ms"], row["p99_ms"]) == (50.0, 95.0, 99.0)
+    path = tmp_path / "profile.csv"
+    prof.export_csv(str(path))
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["section"] == "draw_sky"
+    assert float(rows[0]["p99_ms"]) == 99.0
+
+
+def test_overlay_draws_every_section():
+    pygame.font.init()
+    prof = Profiler(enabled=True)
+    prof.record("state.render", 5_000_000)
+    surface = pygame.Surface((640, 480))
+    rendering.draw_profiler_overlay(surface, pygame.font.Font(None, 20), prof)
+    assert surface.get_at((20, 70)) != (0, 0, 0, 255)
+
+
+def test_overlay_keeps_timings_out_of_the_text_cache():
+    pygame.font.init()
+    prof = Profiler(enabled=True)
+    prof.record("state.update", 1_234_567)
+    font = pygame.font.Font(None, 20)
+    surface = pygame.Surface((640, 480))
+    rendering.draw_profiler_overlay(surface, font, prof)
+    panel = rendering.PROFILER_OVERLAY.panel
+    cached = {key[0] for key in TEXT_CACHE.surfaces}
+    assert "state.update" in cached and "1.23" not in cached
+    prof.record("state.update", 2_000_000)
+    rendering.draw_profiler_overlay(surface, font, prof)
+    assert rendering.PROFILER_OVERLAY.panel is panel
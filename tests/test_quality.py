@@ -0,0 +1,43 @@
+import pytest
+
+import settings
+from quality import QualityGovernor, load_tiers
+
+
+def test_settings_tiers_get_cheaper():
+    tiers = load_tiers()
+    assert len(tiers) == len(settings.QUALITY_TIERS)
+    layers = [tier.window_layers for tier in tiers]
+    density = [tier.particle_density for tier in tiers]
+    assert layers == sorted(layers, reverse=True)
+    assert density == sorted(density, reverse=True)
+    assert not tiers[-1].shadows and not tiers[-1].gradients
+
+
+def test_governor_steps_down_over_budget_and_up_with_headroom():
+    governor = QualityGovernor(level=0, budget_ms=16.0, raise_ratio=0.5, window=4)
+    for _ in range(3):
+        assert not governor.record(30.0)
+    assert governor.record(30.0)
+    assert governor.level == 1
+    # the window restarts after a change
+    assert len(governor.samples) == 0
+    for _ in range(4):
+        governor.record(12.0)
+    assert governor.level == 1
+    # the average of the last four frames has to fall under 8 ms
+    changed = [governor.record(4.0) for _ in range(3)]
+    assert changed == [False, False, True]
+    assert governor.tier.name == settings.QUALITY_TIERS[0]["name"]
+
+
+def test_governor_stays_within_tiers_and_can_be_pinned():
+    governor = QualityGovernor(level=99, window=2)
+    assert governor.level == len(governor.tiers) - 1
+    assert not any(governor.record(100.0) for _ in range(6))
+    governor.auto = False
+    governor.set_level(governor.level_of("high"))
+    assert not any(governor.record(100.0) for _ in range(6))
+    assert governor.level == 0
+    with pytest.raises(ValueError):
+        governor.level_of("ultra")
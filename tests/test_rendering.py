@@ -0,0 +1,200 @@
+import pygame
+
+import rendering
+import settings
+from entities import Building
+from loaders import load_buildings, load_street_lamps
+from spatial import SpatialHash
+from rendering import (
+    BuildingRenderCache,
+    LightingCompositor,
+    SkyRenderer,
+    WindowLightCache,
+    sky_bucket,
+)
+
+pygame.font.init()
+
+
+def test_sky_bucket_boundaries():
+    assert sky_bucket(5 * 60) == "dawn"
+    assert sky_bucket(12 * 60) == "day"
+    assert sky_bucket(18 * 60) == "dusk"
+    assert sky_bucket(23 * 60) == "night"
+    assert sky_bucket(2 * 60) == "night"
+
+
+def test_sky_renderer_caches_until_size_changes(monkeypatch):
+    sky = SkyRenderer()
+    screen = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    sky.draw(screen, 12 * 60)
+    day = sky.gradients["day"]
+    clouds = sky.clouds
+    sky.draw(screen, 12 * 60 + 30)
+    assert sky.gradients["day"] is day
+    assert sky.clouds is clouds
+    sky.draw(screen, 22 * 60)
+    assert set(sky.gradients) == {"day", "night"}
+
+    monkeypatch.setattr(settings, "SCREEN_WIDTH", 800)
+    monkeypatch.setattr(settings, "SCREEN_HEIGHT", 600)
+    sky.draw(pygame.Surface((800, 600)), 22 * 60)
+    assert sky.gradients["night"].get_size() == (800, 600)
+    assert "day" not in sky.gradients
+    assert sky.clouds is not clouds
+
+
+def test_sky_gradient_runs_top_to_bottom_palette():
+    sky = SkyRenderer()
+    sky._ensure_size((10, 100))
+    grad = sky.gradient("day")
+    top, bottom = rendering.SKY_PALETTES["day"]
+    assert tuple(grad.get_at((5, 0)))[:3] == top
+    assert all(abs(a - b) <= 3 for a, b in zip(grad.get_at((5, 99)), bottom))
+
+
+def test_building_cache_reuses_composites(monkeypatch):
+    cache = BuildingRenderCache()
+    building = Building(pygame.Rect(0, 0, 120, 160), "Gym", "gym")
+    surf, offset = cache.get(building)
+    assert cache.get(building)[0] is surf
+    # moving the building does not invalidate its composite
+    building.rect = building.rect.move(500, 40)
+    assert cache.get(building)[0] is surf
+    assert cache.get(building, highlight=True)[0] is not surf
+    assert len(cache.entries) == 2
+    # label, roof and shadow extend the composite beyond the building rect
+    assert offset[1] < 0
+    assert surf.get_width() >= 124 and surf.get_height() >= 164 - offset[1]
+
+    monkeypatch.setattr(settings, "SCREEN_HEIGHT", 600)
+    assert cache.get(building)[0] is not surf
+    assert len(cache.entries) == 1
+
+
+def _window_layers():
+    layer = pygame.Surface((30, 30), pygame.SRCALPHA)
+    layer.fill((255, 255, 255, 255))
+    return [layer, layer.copy(), layer.copy()]
+
+
+def test_window_lights_bake_once_per_bucket():
+    cache = WindowLightCache()
+    layers = _window_layers()
+    night = cache.baked_layers(layers, (22, 22), 22, 6)
+    assert cache.baked_layers(list(layers), (22, 22), 22, 6) is night
+    assert cache.baked_layers(layers, (22, 22), 12, 0) is not night
+    assert len(night) == 3
+    # deeper layers are larger and more opaque
+    assert night[0][2].get_width() < night[2][2].get_width()
+    assert night[0][2].get_alpha() < night[2][2].get_alpha()
+    first = cache.frame_offsets(3, 0)
+    assert cache.frame_offsets(3, rendering.WINDOW_ANIM_PERIOD) is first
+    assert len(cache.offsets) == 1
+
+
+def test_window_layers_stay_inside_window():
+    building = Building(pygame.Rect(100, 100, 300, 200), "Gym", "gym")
+    building.window_layers = _window_layers()
+    screen = pygame.Surface((400, 400))
+    window = pygame.Rect(200, 150, 22, 22)
+    player = type("P", (), {"time": 23 * 60, "rect": pygame.Rect(0, 0, 10, 10)})()
+    rendering._draw_window_layers(screen, building, window, player, 0, 10, 120)
+    assert screen.get_at(window.center)[:3] != (0, 0, 0)
+    assert screen.get_at((window.x - 3, window.centery))[:3] == (0, 0, 0)
+    assert screen.get_clip() == screen.get_rect()
+
+
+def test_night_overlay_cached_per_alpha():
+    lighting = LightingCompositor(lamps=[])
+    screen = pygame.Surface((200, 100))
+    assert lighting.draw(screen, 12 * 60) == 0
+    assert lighting.draw(screen, 23 * 60) == 100
+    overlay = lighting.overlays[(100, (200, 100))]
+    lighting.draw(screen, 23 * 60 + 30)
+    assert lighting.overlays[(100, (200, 100))] is overlay
+
+
+def test_light_tiles_built_once_per_alpha_with_holes():
+    lighting = LightingCompositor(lamps=[(100, 50, 40)], tile_size=100)
+    shop = Building(pygame.Rect(300, 0, 200, 100), "Shop", "shop")
+    index = SpatialHash()
+    index.insert(shop, shop.rect)
+    screen = pygame.Surface((600, 200))
+    lighting.draw(screen, 23 * 60, index)
+    tile = lighting.tile(1, 0, 100, index)
+    lighting.draw(screen, 23 * 60 + 59, index, cam_x=20)
+    assert lighting.tile(1, 0, 100, index) is tile
+    # tiles for the next hour are prepared a few per frame
+    ahead = [key for key in lighting.tiles if key[0] == 120]
+    assert len(ahead) == 2 * rendering.LIGHT_TILES_PER_FRAME
+    lighting.draw(screen, 2 * 60, index)
+    assert {key[0] for key in lighting.tiles} == {80, 60}
+
+    assert tile.get_at((0, 50)).a < 10
+    assert lighting.tile(2, 1, 100, index).get_at((50, 50)).a == 100
+    window = rendering.building_window_rects(shop.rect)[0]
+    x, y = window.center
+    assert lighting.tile(x // 100, 0, 100, index).get_at((x % 100, y)).a < 10
+
+    lighting.add_light(250, 150, 20)
+    assert lighting.tile(2, 1, 100, index).get_at((50, 50)).a < 10
+    index.move(shop, shop.rect.move(0, 100))
+    assert lighting.tile(1, 0, 100, index) is not tile
+
+
+def test_lights_come_from_drawn_windows_and_lamps():
+    buildings = load_buildings()
+    gym = next(b for b in buildings if b.btype == "gym")
+    # gym.svg is 256x256 with its first pane at (46, 96), 40x44
+    w, h = gym.rect.size
+    assert rendering.lit_window_rects(gym)[0] == pygame.Rect(
+        gym.rect.x + round(46 / 256 * w),
+        gym.rect.y + round(96 / 256 * h),
+        round(40 / 256 * w),
+        round(44 / 256 * h),
+    )
+    index = SpatialHash()
+    index.insert(gym, gym.rect)
+    lights = list(LightingCompositor(lamps=[])._lights(index, gym.rect))
+    assert len(lights) == len(gym.windows) == 2
+
+    lamps = load_street_lamps()
+    assert LightingCompositor()._lamps() == lamps
+    # every lamp head stands in the open where it is drawn
+    for x, y in lamps:
+        post = pygame.Rect(x - 7, y - 7, 14, 41)
+        assert post.collidelist([b.rect for b in buildings]) == -1
+
+
+def test_darkness_covers_views_past_the_map():
+    lighting = LightingCompositor(lamps=[])
+    screen = pygame.Surface((200, 100))
+    screen.fill((255, 255, 255))
+    cam_y = settings.MAP_HEIGHT - 50
+    lighting.draw(screen, 23 * 60, SpatialHash(), cam_y=cam_y)
+    assert screen.get_at((100, 20)) == screen.get_at((100, 90))
+    assert screen.get_at((100, 90))[0] < 200
+
+
+def test_cheap_tiers_drop_shadows_and_window_layers(monkeypatch):
+    cache = BuildingRenderCache()
+    building = Building(pygame.Rect(0, 0, 120, 160), "Gym", "gym")
+    full, (dx, dy) = cache.get(building)
+    plain = cache.get(building, shadows=False, gradients=False)[0]
+    assert plain is not full
+    # switching tiers evicts the old tier's composites
+    assert len(cache.entries) == 1
+    # the drop shadow shows just below the building
+    below = (-dx + 60, -dy + 162)
+    assert full.get_at(below).a > 0
+    assert plain.get_at(below).a == 0
+
+    building.window_layers = _window_layers()
+    screen = pygame.Surface((400, 400))
+    window = pygame.Rect(200, 150, 22, 22)
+    player = type("P", (), {"time": 23 * 60, "rect": pygame.Rect(0, 0, 10, 10)})()
+    minimal = rendering.QUALITY.level_of(settings.QUALITY_TIERS[-1]["name"])
+    monkeypatch.setattr(rendering.QUALITY, "tier", rendering.QUALITY.tiers[minimal])
+    rendering._draw_window_layers(screen, building, window, player, 0, 10, 120)
+    assert screen.get_at(window.center)[:3] == (0, 0, 0)
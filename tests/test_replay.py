@@ -0,0 +1,123 @@
+import os
+import random
+import subprocess
+import sys
+
+import pygame
+import pytest
+
+import replay
+import settings
+
+
+def test_events_round_trip_through_json():
+    event = pygame.event.Event(
+        pygame.KEYDOWN, key=pygame.K_e, mod=0, unicode="e", window=object()
+    )
+    data = replay.serialize_event(event)
+    assert "window" not in data["attrs"]
+    again = replay.deserialize_event(data)
+    assert again.type == pygame.KEYDOWN
+    assert (again.key, again.unicode) == (pygame.K_e, "e")
+    click = replay.deserialize_event(
+        replay.serialize_event(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(3, 4), button=1)
+        )
+    )
+    assert click.pos == (3, 4)
+
+
+def test_pressed_keys_reads_like_get_pressed():
+    keys = replay.PressedKeys([pygame.K_LEFT])
+    assert keys[pygame.K_LEFT]
+    assert not keys[pygame.K_RIGHT]
+    assert set(settings.KEY_BINDINGS["move_left"]) & set(replay.bound_keys())
+
+
+def test_recording_reads_back_frame_by_frame(tmp_path):
+    path = str(tmp_path / "session.jsonl")
+    recorder = replay.InputRecorder(path, seed=7, player_file="p.json")
+    recorder.record(1, [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_e)], [])
+    recorder.record(2, [], [pygame.K_RIGHT])
+    recorder.close("abc")
+
+    playback = replay.InputReplay(path)
+    assert (playback.seed, playback.player_file) == (7, "p.json")
+    steps, events, keys = playback.next_frame()
+    assert steps == 1 and events[0].key == pygame.K_e and keys == []
+    assert playback.next_frame()[::2] == (2, [pygame.K_RIGHT])
+    assert playback.next_frame() is None
+    playback.finish()
+    assert playback.frames == 2
+    assert playback.digest == "abc"
+
+
+def test_menu_input_is_recorded_and_replayed(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from game import Game
+
+    path = str(tmp_path / "menu.jsonl")
+    recorder = replay.InputRecorder(path, seed=1, player_file="p.json")
+    recorder.record(1, [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)], [])
+    game = SimpleNamespace(replay=None, recorder=recorder)
+    escape = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+    monkeypatch.setattr(pygame.event, "get", lambda: [escape])
+    assert Game.menu_events(game) == [escape]
+    recorder.record(1, [], [])
+    recorder.close()
+    monkeypatch.undo()
+
+    playback = replay.InputReplay(path)
+    game = SimpleNamespace(replay=playback, recorder=None)
+    playback.next_frame()
+    assert [e.key for e in Game.menu_events(game)] == [pygame.K_ESCAPE]
+    assert playback.next_frame() is not None
+    # a menu the recording never opened cannot be replayed
+    with pytest.raises(ValueError):
+        Game.menu_events(game)
+
+
+def test_seeded_rngs_repeat():
+    replay.seed_rngs(42)
+    first = [random.random() for _ in range(3)]
+    replay.seed_rngs(42)
+    assert [random.random() for _ in range(3)] == first
+
+
+REPLAY_SCRIPT = """
+import replay
+playback = replay.InputReplay({path!r})
+game = replay._boot(playback.seed, playback.player_file)
+start = game.player.rect.topleft
+game.run(replay=playback)
+playback.finish()
+assert game.player.rect.topleft != start
+print(replay.state_digest(game))
+"""
+
+
+def test_replaying_a_session_reproduces_the_world(tmp_path):
+    path = str(tmp_path / "walk.jsonl")
+    recorder = replay.InputRecorder(path, 3, replay.DEFAULT_PLAYER_FILE)
+    for frame in range(40):
+        held = [pygame.K_RIGHT] if frame < 20 else [pygame.K_DOWN]
+        recorder.record(1 + frame % 2, [], held)
+    recorder.close()
+
+    # each replay gets a fresh process, as the NPC roster is module state
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    digests = [
+        subprocess.run(
+            [sys.executable, "-c", REPLAY_SCRIPT.format(path=path)],
+            cwd=root,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()[-1]
+        for _ in range(2)
+    ]
+    assert len(digests[0]) == 64
+    assert digests[0] == digests[1]
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pygame
+
+from entities import Building
+from pathfinding import NavGrid, find_path
+from routes import RouteTable
+
+
+def _city():
+    tm = SimpleNamespace(width=20, height=10, tilewidth=40, tileheight=40)
+    buildings = [
+        Building(pygame.Rect(40, 40, 120, 120), "Home", "home"),
+        Building(pygame.Rect(400, 40, 120, 120), "Shop", "shop"),
+        Building(pygame.Rect(640, 200, 120, 120), "Clinic", "clinic"),
+    ]
+    return NavGrid.from_tilemap(tm, buildings), buildings
+
+
+def _assert_connected(start, steps):
+    prev = start
+    for step in steps:
+        assert abs(step[0] - prev[0]) + abs(step[1] - prev[1]) == 40
+        prev = step
+
+
+def test_routes_between_entrances_are_shortest():
+    grid, buildings = _city()
+    table = RouteTable(grid, buildings)
+    assert table.stats()["routes"] == 6
+    assert table.stats()["build_ms"] >= 0
+    home, shop = buildings[0], buildings[1]
+    start = grid.to_pixels([table.entrances[0]])[0]
+    goal = grid.to_pixels([table.entrances[1]])[0]
+    path = table.path(start, shop)
+    assert path[-1] == goal
+    assert len(path) == len(find_path(grid, start, goal))
+    _assert_connected(start, path)
+
+
+def test_npc_joins_route_from_open_ground():
+    grid, buildings = _city()
+    table = RouteTable(grid, buildings)
+    start = (0, 360)
+    path = table.path(start, buildings[2])
+    assert path[-1] == grid.to_pixels([table.entrances[2]])[0]
+    _assert_connected(start, path)
+    assert table.hits == 1
+
+
+def test_table_rebuilds_when_map_changes():
+    grid, buildings = _city()
+    table = RouteTable(grid, buildings)
+    before = table.routes[(0, 1)]
+    blocked = grid.tile(before[len(before) // 2])
+    grid.set_walkable(*blocked, False)
+    start = grid.to_pixels([table.entrances[0]])[0]
+    path = table.path(start, buildings[1])
+    assert table.routes[(0, 1)] != before
+    blocked_px = (blocked[0] * 40, blocked[1] * 40)
+    assert blocked_px not in path
+    _assert_connected(start, path)
+
+
+def test_table_rebuilds_when_buildings_change(monkeypatch):
+    grid, buildings = _city()
+    table = RouteTable(grid, buildings)
+    builds = []
+    build = table.build
+    monkeypatch.setattr(table, "build", lambda: builds.append(1) or build())
+    start = grid.to_pixels([table.entrances[0]])[0]
+    table.path(start, buildings[1])
+    assert builds == []
+    buildings[1].rect = buildings[1].rect.move(40, 0)
+    table.path(start, buildings[1])
+    assert builds == [1]
+    buildings[2] = Building(buildings[2].rect.copy(), "Gym", "gym")
+    table.path(start, buildings[2])
+    assert builds == [1, 1]
+    assert table.index[id(buildings[2])] == 2
@@ -0,0 +1,47 @@
+import pygame
+
+from entities import Building
+from spatial import SpatialHash
+
+
+def test_spatial_hash_query_and_move():
+    index = SpatialHash(cell_size=100)
+    a, b, c = object(), object(), object()
+    index.insert(a, pygame.Rect(10, 10, 20, 20))
+    index.insert(b, pygame.Rect(250, 10, 300, 20))
+    index.insert(c, pygame.Rect(900, 900, 20, 20))
+    assert index.query_rect(pygame.Rect(0, 0, 300, 100)) == [a, b]
+    index.move(a, pygame.Rect(905, 905, 10, 10))
+    assert index.query_rect(pygame.Rect(0, 0, 300, 100)) == [b]
+    assert index.query_rect(pygame.Rect(890, 890, 50, 50)) == [a, c]
+    index.remove(c)
+    assert c not in index
+    assert index.query_rect(pygame.Rect(890, 890, 50, 50)) == [a]
+
+
+def test_spatial_hash_radius_and_first_overlap():
+    index = SpatialHash(cell_size=100)
+    a = Building(pygame.Rect(0, 0, 50, 50), "A", "shop")
+    b = Building(pygame.Rect(300, 0, 50, 50), "B", "park")
+    c = Building(pygame.Rect(20, 20, 50, 50), "C", "bank")
+    for item in (a, b, c):
+        index.insert(item, item.rect)
+    # closest point of b is (300, 25), 100 px from (200, 25)
+    assert index.query_radius((200, 25), 100) == [b]
+    assert index.query_radius((200, 25), 99) == []
+    assert index.query_radius((60, 60), 16) == [a, c]
+    assert index.query_radius((60, 60), 15) == [c]
+    assert index.first_overlapping(pygame.Rect(30, 30, 5, 5)) is a
+    assert index.first_overlapping(pygame.Rect(200, 200, 5, 5)) is None
+
+
+def test_spatial_hash_version_tracks_changes():
+    index = SpatialHash()
+    item = object()
+    start = index.version
+    index.insert(item, pygame.Rect(0, 0, 10, 10))
+    index.move(item, pygame.Rect(0, 0, 10, 10))
+    assert index.version == start + 1
+    index.move(item, pygame.Rect(5, 0, 10, 10))
+    index.remove(item)
+    assert index.version == start + 3
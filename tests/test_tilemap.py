@@ -0,0 +1,66 @@
+import os
+
+import pygame
+
+import settings
+from tilemap import TileMap
+
+CITY_MAP = os.path.join(settings.IMAGE_DIR, "tiles", "city.tmx")
+
+
+def load_city():
+    return TileMap(CITY_MAP, chunk_tiles=16)
+
+
+def test_render_only_builds_visible_chunks():
+    tm = load_city()
+    screen = pygame.Surface((800, 600))
+    tm.render(screen, 0, 0)
+    # 800x600 covers one 640px chunk horizontally plus part of the next
+    assert set(tm._chunks) == {(0, 0), (1, 0)}
+    tm.render(screen, 1280, 0)
+    assert (2, 0) in tm._chunks and (3, 0) in tm._chunks
+
+
+def test_chunked_render_matches_per_tile_render():
+    tm = load_city()
+    screen = pygame.Surface((400, 300))
+    tm.render(screen, 620, 20)
+    expected = pygame.Surface((400, 300))
+    for idx, gid in enumerate(tm.layers[0]):
+        tile = tm.tile_image(gid)
+        x = (idx % tm.width) * tm.tilewidth - 620
+        y = (idx // tm.width) * tm.tileheight - 20
+        if tile is not None:
+            expected.blit(tile, (x, y))
+    for px, py in [(0, 0), (15, 200), (250, 30), (399, 299)]:
+        assert screen.get_at((px, py)) == expected.get_at((px, py))
+
+
+def test_set_tile_invalidates_chunk():
+    tm = load_city()
+    screen = pygame.Surface((1600, 1200))
+    tm.render(screen)
+    assert (0, 0) in tm._chunks and (1, 0) in tm._chunks
+    gid = tm.get_tile(0, 17, 3)
+    tm.set_tile(0, 17, 3, gid)
+    assert (1, 0) in tm._chunks
+    tm.set_tile(0, 17, 3, 0)
+    assert tm.get_tile(0, 17, 3) == 0
+    assert (1, 0) not in tm._chunks and (0, 0) in tm._chunks
+    tm.render(screen)
+    assert (1, 0) in tm._chunks
+
+
+def test_gid_table_points_into_tileset_atlas():
+    tm = load_city()
+    firstgid, atlas = tm.atlases[0]
+    assert tm.tile_area(0) is None
+    assert tm.tile_area(len(tm.gid_table) + 5) is None
+    surf, area = tm.tile_area(firstgid + 3)
+    assert surf is atlas
+    assert area == pygame.Rect(3 * tm.tilewidth, 0, tm.tilewidth, tm.tileheight)
+    tile = tm.tile_image(firstgid + 3)
+    assert tile.get_parent() is atlas
+    assert tm.tile_image(firstgid + 3) is tile
+    assert tile is tm.tilesets[0][1][3]
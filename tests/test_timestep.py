@@ -0,0 +1,25 @@
+from timestep import FixedTimestep, lerp_point
+
+
+def test_steps_follow_wall_time_at_any_frame_rate():
+    for fps in (30, 60, 144):
+        timestep = FixedTimestep(tick_rate=60)
+        steps = sum(timestep.advance(1.0 / fps) for _ in range(fps))
+        # one second of frames is 60 updates, give or take the partial step
+        assert 59 <= steps <= 60
+
+
+def test_catch_up_is_capped_and_alpha_tracks_remainder():
+    timestep = FixedTimestep(tick_rate=10, max_steps=3)
+    assert timestep.advance(1.0) == 3
+    assert timestep.dropped == 7
+    assert timestep.alpha == 0.0
+    assert timestep.advance(0.05) == 0
+    assert abs(timestep.alpha - 0.5) < 1e-9
+    assert timestep.advance(0.06) == 1
+
+
+def test_lerp_point():
+    assert lerp_point((0, 0), (10, -20), 0.0) == (0, 0)
+    assert lerp_point((0, 0), (10, -20), 0.5) == (5, -10)
+    assert lerp_point((0, 0), (10, -20), 1.0) == (10, -20)
@@ -10,18 +10,35 @@ BUS_STOP_BUILDINGS = [
     {"rect": [2420, 920, 40, 40], "name": "Beach", "type": "bus_stop"},
 ]
 
+# Width and height of a pre-rendered chunk, in tiles
+CHUNK_TILES = 16
+
 
 class TileMap:
-    """Load a TMX tilemap and render it using pygame."""
+    """Load a TMX tilemap and render it using pygame.
+
+    Static layers are baked into cached chunk surfaces of ``CHUNK_TILES`` x
+    ``CHUNK_TILES`` tiles. Rendering only blits the chunks overlapping the
+    camera, and chunks are rebuilt lazily after :meth:`set_tile` changes them.
+    Each tileset is kept as a single atlas surface; ``gid_table`` maps a gid
+    straight to its ``(atlas, area)`` pair.
+    """
 
-    def __init__(self, filename):
+    def __init__(self, filename, chunk_tiles=CHUNK_TILES):
         self.filename = filename
         self.width = 0
         self.height = 0
         self.tilewidth = 0
         self.tileheight = 0
         self.layers = []
-        self.tilesets = []  # list of (firstgid, [surface])
+        self.tilesets = []  # list of (firstgid, [subsurface])
+        self.atlases = []  # list of (firstgid, tileset Surface)
+        # Flat gid -> (atlas, area) lookup, ``None`` for empty/unknown gids
+        self.gid_table = []
+        # Flat gid -> cached tile subsurface, ``None`` for empty/unknown gids
+        self.gid_images = []
+        self.chunk_tiles = chunk_tiles
+        self._chunks = {}  # (chunk_x, chunk_y) -> pre-rendered Surface
         self._load()
 
     def _load(self):
@@ -42,42 +59,140 @@ class TileMap:
                 ts_root = ts
             image = ts_root.find("image").attrib["source"]
             image_path = os.path.join(base_dir, image)
-            tileset_image = load_image(image_path)
+            atlas = load_image(image_path)
             columns = int(ts_root.attrib["columns"])
             tilecount = int(ts_root.attrib["tilecount"])
+            bounds = atlas.get_rect()
             tiles = []
             for i in range(tilecount):
-                x = (i % columns) * self.tilewidth
-                y = (i // columns) * self.tileheight
-                surf = pygame.Surface((self.tilewidth, self.tileheight), pygame.SRCALPHA)
-                surf.blit(
-                    tileset_image, (0, 0), pygame.Rect(x, y, self.tilewidth, self.tileheight)
+                area = pygame.Rect(
+                    (i % columns) * self.tilewidth,
+                    (i // columns) * self.tileheight,
+                    self.tilewidth,
+                    self.tileheight,
                 )
-                tiles.append(surf)
+                # Subsurfaces share pixels with the atlas instead of copying
+                tiles.append(atlas.subsurface(area) if bounds.contains(area) else None)
             self.tilesets.append((firstgid, tiles))
-        self.tilesets.sort()
+            self.atlases.append((firstgid, atlas))
+        self.tilesets.sort(key=lambda ts: ts[0])
+        self.atlases.sort(key=lambda at: at[0])
+        self._build_gid_table()
 
         for layer in root.findall("layer"):
-            data = layer.find("data").text.strip().split(",")
+            # Tiled may end CSV rows without a trailing comma
+            data = layer.find("data").text.replace(",", " ").split()
             gids = [int(g) for g in data]
             self.layers.append(gids)
 
-    def render(self, surface, cam_x=0, cam_y=0):
-        """Blit the map's tiles to the surface offset by camera."""
+    # ------------------------------------------------------------------
+    # Tile access
+    # ------------------------------------------------------------------
+    def _build_gid_table(self):
+        """Precompute the flat gid lookup used by the render loop."""
+        size = max((fg + len(tiles) for fg, tiles in self.tilesets), default=1)
+        table = [None] * size
+        images = [None] * size
+        for (firstgid, tiles), (_, atlas) in zip(self.tilesets, self.atlases):
+            for index, tile in enumerate(tiles):
+                if tile is not None:
+                    area = pygame.Rect(tile.get_offset(), tile.get_size())
+                    table[firstgid + index] = (atlas, area)
+                    images[firstgid + index] = tile
+        # gid 0 always means "no tile"
+        table[0] = None
+        images[0] = None
+        self.gid_table = table
+        self.gid_images = images
+
+    def tile_area(self, gid):
+        """Return ``(atlas, area)`` for ``gid`` or ``None`` for empty tiles."""
+        if 0 < gid < len(self.gid_table):
+            return self.gid_table[gid]
+        return None
+
+    def tile_image(self, gid):
+        """Return the tile surface for ``gid`` or ``None`` for empty tiles."""
+        if 0 < gid < len(self.gid_images):
+            return self.gid_images[gid]
+        return None
+
+    def get_tile(self, layer, x, y):
+        """Return the gid stored at tile ``(x, y)`` of ``layer``."""
+        return self.layers[layer][y * self.width + x]
+
+    def set_tile(self, layer, x, y, gid):
+        """Change a tile and invalidate the chunk that contains it."""
+        idx = y * self.width + x
+        if self.layers[layer][idx] == gid:
+            return
+        self.layers[layer][idx] = gid
+        self._chunks.pop((x // self.chunk_tiles, y // self.chunk_tiles), None)
+
+    def invalidate(self):
+        """Drop every cached chunk so they are rebuilt on the next render."""
+        self._chunks.clear()
+
+    # ------------------------------------------------------------------
+    # Chunk rendering
+    # ------------------------------------------------------------------
+    def _build_chunk(self, cx, cy):
+        """Bake all layers of a single chunk into one surface."""
+        size = self.chunk_tiles
+        x0 = cx * size
+        y0 = cy * size
+        cols = min(size, self.width - x0)
+        rows = min(size, self.height - y0)
+        chunk = pygame.Surface(
+            (cols * self.tilewidth, rows * self.tileheight), pygame.SRCALPHA
+        )
+        table = self.gid_table
+        table_size = len(table)
         for layer in self.layers:
-            for idx, gid in enumerate(layer):
-                if gid == 0:
-                    continue
-                tileset = None
-                firstgid = 0
-                for fg, tiles in reversed(self.tilesets):
-                    if gid >= fg:
-                        tileset = tiles
-                        firstgid = fg
-                        break
-                if tileset is None:
-                    continue
-                tile = tileset[gid - firstgid]
-                x = (idx % self.width) * self.tilewidth - cam_x
-                y = (idx // self.width) * self.tileheight - cam_y
-                surface.blit(tile, (x, y))
+            for ty in range(rows):
+                row_start = (y0 + ty) * self.width + x0
+                for tx in range(cols):
+                    gid = layer[row_start + tx]
+                    entry = table[gid] if gid < table_size else None
+                    if entry is not None:
+                        chunk.blit(
+                            entry[0],
+                            (tx * self.tilewidth, ty * self.tileheight),
+                            entry[1],
+                        )
+        return chunk
+
+    def _chunk(self, cx, cy):
+        chunk = self._chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self._build_chunk(cx, cy)
+            self._chunks[(cx, cy)] = chunk
+        return chunk
+
+    def visible_chunks(self, view_w, view_h, cam_x=0, cam_y=0):
+        """Return ``(cx, cy)`` for every chunk overlapping the viewport."""
+        chunk_w = self.chunk_tiles * self.tilewidth
+        chunk_h = self.chunk_tiles * self.tileheight
+        max_cx = (self.width - 1) // self.chunk_tiles
+        max_cy = (self.height - 1) // self.chunk_tiles
+        first_cx = max(0, int(cam_x) // chunk_w)
+        first_cy = max(0, int(cam_y) // chunk_h)
+        last_cx = min(max_cx, (int(cam_x) + view_w - 1) // chunk_w)
+        last_cy = min(max_cy, (int(cam_y) + view_h - 1) // chunk_h)
+        return [
+            (cx, cy)
+            for cy in range(first_cy, last_cy + 1)
+            for cx in range(first_cx, last_cx + 1)
+        ]
+
+    def render(self, surface, cam_x=0, cam_y=0):
+        """Blit the chunks overlapping the camera to the surface."""
+        if not self.width or not self.height:
+            return
+        chunk_w = self.chunk_tiles * self.tilewidth
+        chunk_h = self.chunk_tiles * self.tileheight
+        view_w, view_h = surface.get_size()
+        for cx, cy in self.visible_chunks(view_w, view_h, cam_x, cam_y):
+            surface.blit(
+                self._chunk(cx, cy), (cx * chunk_w - cam_x, cy * chunk_h - cam_y)
+            )
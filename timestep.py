@@ -0,0 +1,60 @@
+"""Fixed-timestep accumulator for the main loop.
+
+The simulation advances in steps of exactly ``1 / tick_rate`` seconds no
+matter how fast frames are drawn, so game time follows wall time. Leftover
+time that does not fill a whole step becomes :attr:`FixedTimestep.alpha`,
+the fraction renderers use to interpolate between the last two updates.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import settings
+
+
+class FixedTimestep:
+    """Turn elapsed wall time into a whole number of simulation steps."""
+
+    def __init__(
+        self,
+        tick_rate: float = settings.SIM_TICK_RATE,
+        max_steps: int = settings.MAX_CATCHUP_STEPS,
+    ) -> None:
+        self.step = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.steps = 0
+        self.dropped = 0
+
+    @property
+    def alpha(self) -> float:
+        """How far the next step has progressed, between 0 and 1."""
+        return min(1.0, self.accumulator / self.step)
+
+    def advance(self, elapsed: float) -> int:
+        """Add ``elapsed`` seconds and return how many steps to run now.
+
+        At most ``max_steps`` are returned; time beyond that is dropped so a
+        long stall slows the world down instead of spiralling.
+        """
+        self.accumulator += max(0.0, elapsed)
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            self.dropped += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+        self.steps += steps
+        return steps
+
+
+def lerp_point(
+    previous: Tuple[int, int], current: Tuple[int, int], alpha: float
+) -> Tuple[int, int]:
+    """Point ``alpha`` of the way from ``previous`` to ``current``."""
+    return (
+        round(previous[0] + (current[0] - previous[0]) * alpha),
+        round(previous[1] + (current[1] - previous[1]) * alpha),
+    )